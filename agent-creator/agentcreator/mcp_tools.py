@@ -26,6 +26,9 @@ _mcp_sessions: Dict[str, ClientSession] = {}
 _exit_stacks: Dict[str, AsyncExitStack] = {}
 _mcp_tools: Optional[List[dspy.Tool]] = None
 
+# Upper bound on closing all MCP sessions (they are closed concurrently)
+MCP_CLEANUP_TIMEOUT_SECONDS = 5.0
+
 
 async def initialize_mcp_server(
     server_name: str,
@@ -202,29 +205,41 @@ async def get_strands_mcp_tools(force_reload: bool = False) -> List[dspy.Tool]:
     return await get_all_mcp_tools(force_reload=force_reload)
 
 
+async def _close_mcp_session(server_name: str, exit_stack: AsyncExitStack):
+    """Close a single MCP session's exit stack"""
+    try:
+        await exit_stack.aclose()
+        logger.info(f"MCP session cleaned up: {server_name}")
+    except (RuntimeError, asyncio.CancelledError) as e:
+        # Expected error when cleaning up from different async context
+        logger.debug(f"MCP session cleanup skipped for {server_name} (will cleanup on exit): {e}")
+    except Exception as e:
+        logger.warning(f"Unexpected error cleaning up {server_name} MCP session: {e}")
+
+
 async def cleanup_mcp_sessions():
     """Clean up all MCP sessions and resources
     
+    Sessions are closed concurrently, bounded by MCP_CLEANUP_TIMEOUT_SECONDS
+    (raises TimeoutError if exceeded; session state is cleared either way).
+    
     Note: Due to async context manager limitations, cleanup may fail if called
     from a different async context than where sessions were created. This is
     expected behavior and sessions will be cleaned up when process exits.
     """
     global _mcp_sessions, _exit_stacks, _mcp_tools
     
-    for server_name, exit_stack in list(_exit_stacks.items()):
-        try:
-            await exit_stack.aclose()
-            logger.info(f"MCP session cleaned up: {server_name}")
-        except (RuntimeError, asyncio.CancelledError) as e:
-            # Expected error when cleaning up from different async context
-            logger.debug(f"MCP session cleanup skipped for {server_name} (will cleanup on exit): {e}")
-        except Exception as e:
-            logger.warning(f"Unexpected error cleaning up {server_name} MCP session: {e}")
-    
-    _mcp_sessions.clear()
-    _exit_stacks.clear()
-    _mcp_tools = None
-    logger.info("MCP sessions marked for cleanup")
+    try:
+        async with asyncio.timeout(MCP_CLEANUP_TIMEOUT_SECONDS):
+            await asyncio.gather(
+                *(_close_mcp_session(name, stack) for name, stack in _exit_stacks.items()),
+                return_exceptions=True,
+            )
+    finally:
+        _mcp_sessions.clear()
+        _exit_stacks.clear()
+        _mcp_tools = None
+        logger.info("MCP sessions marked for cleanup")
 
 
 def get_strands_tools_sync() -> List[dspy.Tool]:
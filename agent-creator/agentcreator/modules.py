@@ -19,6 +19,7 @@ from .signatures import (
     PlanReviewerSignature,
     PromptGeneratorSignature,
     SOPParserSignature,
+    VOICE_PARSER_DEMOS,
     VoicePersonalityParser,
 )
 from .signatures.types import (
@@ -308,15 +309,53 @@ class PromptGenerator(dspy.Module):
         return result.system_prompt
 
 
+class FrozenPromptAdapter(dspy.ChatAdapter):
+    """ChatAdapter that renders a signature's system prompt once
+
+    The field descriptions, field structure and task description depend only on
+    the signature, so they are rendered when the adapter is built and reused on
+    every call instead of being re-serialized from the signature each time.
+    Other signatures fall through to the regular ChatAdapter rendering.
+    """
+
+    def __init__(self, signature: type[dspy.Signature], **kwargs):
+        super().__init__(**kwargs)
+        self.signature = signature
+        self._field_description = super().format_field_description(signature)
+        self._field_structure = super().format_field_structure(signature)
+        self._task_description = super().format_task_description(signature)
+
+    def format_field_description(self, signature: type[dspy.Signature]) -> str:
+        if signature is self.signature:
+            return self._field_description
+        return super().format_field_description(signature)
+
+    def format_field_structure(self, signature: type[dspy.Signature]) -> str:
+        if signature is self.signature:
+            return self._field_structure
+        return super().format_field_structure(signature)
+
+    def format_task_description(self, signature: type[dspy.Signature]) -> str:
+        if signature is self.signature:
+            return self._task_description
+        return super().format_task_description(signature)
+
+
+# Rendered once at import; VoicePersonalityParser is called for every agent with a voice
+VOICE_PERSONALITY_ADAPTER = FrozenPromptAdapter(VoicePersonalityParser)
+
+
 class VoicePersonalityParserModule(dspy.Module):
     """Parse unstructured voice personality text into structured format
     
-    Uses Predict (simple completion) for extracting structured data.
+    Uses Predict (simple completion) for extracting structured data, with the
+    signature prompt pre-rendered by VOICE_PERSONALITY_ADAPTER.
     """
 
     def __init__(self):
         super().__init__()
         self.parser = dspy.Predict(VoicePersonalityParser)
+        self.parser.demos = list(VOICE_PARSER_DEMOS)
 
     async def aforward(
         self,
@@ -344,11 +383,12 @@ class VoicePersonalityParserModule(dspy.Module):
             - additional_instructions
         """
         
-        result = await self.parser.acall(
-            voice_personality_text=voice_personality_text,
-            sop=sop,
-            knowledge_base_description=knowledge_base_description,
-        )
+        with dspy.context(adapter=VOICE_PERSONALITY_ADAPTER):
+            result = await self.parser.acall(
+                voice_personality_text=voice_personality_text,
+                sop=sop,
+                knowledge_base_description=knowledge_base_description,
+            )
         
         # Convert result to dictionary
         return {
@@ -7,6 +7,7 @@ Pipeline Flow:
 2. Parse SOP → Extract structured requirements
 3. Draft Plan → Create agent architecture (with review cycle up to 3 iterations)
 4. Generate Code → Use ReAct with code interpreter tool for validation
+   (the system prompt is generated concurrently on the first iteration)
 5. Review Code → Validate generated code
 6. Generate Prompt → Create system prompt with personality
 
@@ -15,13 +16,16 @@ DSPy Module Selection:
 - ReAct: Used for CodeGenerator to enable tool usage (code interpreter)
 """
 
+import asyncio
 import json
 import logging
 import os
 from typing import Any, Dict, List, Optional, TypedDict
 
 import dspy
+from langgraph.cache.memory import InMemoryCache
 from langgraph.graph import END, StateGraph
+from langgraph.types import CachePolicy
 
 # OpenTelemetry imports for baggage context (session tracking)
 from opentelemetry import baggage, context, trace as trace_api
@@ -51,6 +55,21 @@ from .signatures.types import (
 
 logger = logging.getLogger(__name__)
 
+# Node-level result cache. Cache keys are derived from each node's input state,
+# so a repeated run with the same SOP / voice personality skips the LLM calls.
+# Set PIPELINE_CACHE_PATH to persist results across processes (SQLite).
+PIPELINE_CACHE_TTL_SECONDS = int(os.getenv("PIPELINE_CACHE_TTL_SECONDS", "3600"))
+PIPELINE_CACHE_PATH = os.getenv("PIPELINE_CACHE_PATH")
+
+
+def _create_pipeline_cache():
+    """Create the LangGraph node cache (SQLite if PIPELINE_CACHE_PATH is set)"""
+    if PIPELINE_CACHE_PATH:
+        from langgraph.cache.sqlite import SqliteCache
+
+        return SqliteCache(path=PIPELINE_CACHE_PATH)
+    return InMemoryCache()
+
 
 def set_session_context(session_id: str, user_id: Optional[str] = None):
     """
@@ -254,7 +273,7 @@ async def generate_code_node(state: AgentCreatorState) -> AgentCreatorState:
     # Get feedback from previous review (if any)
     code_review_feedback = state.get("code_review_feedback", "")
 
-    generation_result = await code_generator.acall(
+    generate_code = code_generator.acall(
         plan=state["plan"],
         requirements=state["requirements"],
         bedrock_knowledge_base_id=state["bedrock_knowledge_base_id"],
@@ -263,6 +282,18 @@ async def generate_code_node(state: AgentCreatorState) -> AgentCreatorState:
         code_review_feedback=code_review_feedback,
     )
 
+    # The system prompt only depends on the approved plan, so generate it
+    # alongside the first code draft instead of after the code review cycle
+    generated_prompt = state.get("generated_prompt")
+    if generated_prompt is None:
+        async with asyncio.TaskGroup() as tg:
+            code_task = tg.create_task(generate_code)
+            prompt_task = tg.create_task(_generate_system_prompt(state))
+        generation_result = code_task.result()
+        generated_prompt = prompt_task.result()
+    else:
+        generation_result = await generate_code
+
     # Extract from CodeGenerationOutput object
     output_obj: CodeGenerationOutput = getattr(generation_result, "output", None)
 
@@ -281,6 +312,7 @@ async def generate_code_node(state: AgentCreatorState) -> AgentCreatorState:
         "model_id": model_id,
         "enable_memory_hooks": enable_memory_hooks,
         "code_iteration": code_iteration,
+        "generated_prompt": generated_prompt,
     }
 
 
@@ -328,8 +360,8 @@ async def review_code_node(state: AgentCreatorState) -> AgentCreatorState:
     }
 
 
-async def generate_prompt_node(state: AgentCreatorState) -> AgentCreatorState:
-    """Generate system prompt"""
+async def _generate_system_prompt(state: AgentCreatorState) -> SystemPrompt:
+    """Generate the system prompt from the requirements, plan and voice personality"""
     logger.info("Generating system prompt...")
 
     voice_personality_str = None
@@ -346,6 +378,14 @@ async def generate_prompt_node(state: AgentCreatorState) -> AgentCreatorState:
     )
 
     logger.info(f"System prompt generated - type: {type(result)}")
+    return result
+
+
+async def generate_prompt_node(state: AgentCreatorState) -> AgentCreatorState:
+    """Finalize outputs, generating the system prompt if it wasn't already"""
+    result = state.get("generated_prompt")
+    if result is None:
+        result = await _generate_system_prompt(state)
 
     return {
         **state,
@@ -354,8 +394,13 @@ async def generate_prompt_node(state: AgentCreatorState) -> AgentCreatorState:
     }
 
 
-async def create_agent_creator_pipeline():
-    """Create and configure the AgentCreator LangGraph pipeline"""
+async def create_agent_creator_pipeline(checkpointer=None):
+    """Create and configure the AgentCreator LangGraph pipeline
+
+    Args:
+        checkpointer: Optional LangGraph checkpointer. When set, state is
+            persisted after every node so a run can be resumed by thread_id.
+    """
     global plan_drafter, code_generator, code_reviewer
     
     logger.info("Creating AgentCreator pipeline...")
@@ -385,14 +430,15 @@ async def create_agent_creator_pipeline():
     # Create the state graph
     workflow = StateGraph(AgentCreatorState)
 
-    # Add nodes
-    workflow.add_node("parse_voice_personality", parse_voice_personality_node)
-    workflow.add_node("parse_sop", parse_sop_node)
-    workflow.add_node("draft_plan", draft_plan_node)
-    workflow.add_node("review_plan", review_plan_node)
-    workflow.add_node("generate_code", generate_code_node)
-    workflow.add_node("review_code", review_code_node)
-    workflow.add_node("generate_prompt", generate_prompt_node)
+    # Add nodes (each node result is cached on its input state)
+    cache_policy = CachePolicy(ttl=PIPELINE_CACHE_TTL_SECONDS)
+    workflow.add_node("parse_voice_personality", parse_voice_personality_node, cache_policy=cache_policy)
+    workflow.add_node("parse_sop", parse_sop_node, cache_policy=cache_policy)
+    workflow.add_node("draft_plan", draft_plan_node, cache_policy=cache_policy)
+    workflow.add_node("review_plan", review_plan_node, cache_policy=cache_policy)
+    workflow.add_node("generate_code", generate_code_node, cache_policy=cache_policy)
+    workflow.add_node("review_code", review_code_node, cache_policy=cache_policy)
+    workflow.add_node("generate_prompt", generate_prompt_node, cache_policy=cache_policy)
 
     # Set entry point - start with voice personality parsing
     workflow.set_entry_point("parse_voice_personality")
@@ -427,7 +473,7 @@ async def create_agent_creator_pipeline():
     workflow.add_edge("generate_prompt", END)
 
     # Compile the graph
-    app = workflow.compile()
+    app = workflow.compile(cache=_create_pipeline_cache(), checkpointer=checkpointer)
 
     logger.info("AgentCreator pipeline created successfully")
     return app
@@ -19,7 +19,7 @@ from .plan_reviewer import PlanReviewerSignature
 from .code_generator import CodeGeneratorSignature
 from .code_reviewer import CodeReviewerSignature
 from .prompt_generator import PromptGeneratorSignature
-from .voice_personality_parser import VoicePersonalityParser
+from .voice_personality_parser import VOICE_PARSER_DEMOS, VoicePersonalityParser
 from .types import (
     PlanReview,
     CodeReview,
@@ -37,6 +37,7 @@ __all__ = [
     "CodeReviewerSignature",
     "PromptGeneratorSignature",
     "VoicePersonalityParser",
+    "VOICE_PARSER_DEMOS",
     "PlanReview",
     "CodeReview",
     "Requirements",
@@ -35,38 +35,6 @@ class VoicePersonalityParser(dspy.Signature):
     
     3. Be specific and actionable in your output
     4. Ensure consistency across all fields
-    
-    EXAMPLES:
-    
-    Input: "A friendly customer support agent who helps users with technical issues. 
-            Should be patient and empathetic, speaking clearly and not too fast."
-    Output:
-    {
-      "identity": "Technical customer support specialist with expertise in troubleshooting",
-      "task": "Help users resolve technical issues with patience and clarity",
-      "demeanor": "Friendly, patient, and empathetic",
-      "tone": "Warm and reassuring",
-      "formality_level": "neutral",
-      "enthusiasm_level": "moderate",
-      "filler_words": "none",
-      "pacing": "moderate",
-      "additional_instructions": "Always acknowledge user frustration and provide step-by-step guidance"
-    }
-    
-    Input: "Professional financial advisor for high-net-worth clients. 
-            Sophisticated, confident, and authoritative."
-    Output:
-    {
-      "identity": "Senior financial advisor specializing in wealth management for high-net-worth individuals",
-      "task": "Provide sophisticated financial guidance and investment strategies",
-      "demeanor": "Professional, confident, and authoritative",
-      "tone": "Authoritative and sophisticated",
-      "formality_level": "very_formal",
-      "enthusiasm_level": "low",
-      "filler_words": "none",
-      "pacing": "moderate",
-      "additional_instructions": "Use financial terminology appropriately, maintain gravitas, and project expertise"
-    }
     """
     
     # Input
@@ -109,3 +77,42 @@ class VoicePersonalityParser(dspy.Signature):
         desc="Any other specific instructions for voice behavior, communication style, or special considerations"
     )
 
+
+# Worked examples, passed as demos rather than embedded in the docstring so the
+# instructions stay short and the examples form a stable, cacheable prompt prefix
+VOICE_PARSER_DEMOS = [
+    dspy.Example(
+        voice_personality_text=(
+            "A friendly customer support agent who helps users with technical issues. "
+            "Should be patient and empathetic, speaking clearly and not too fast."
+        ),
+        sop="Help customers troubleshoot product issues and escalate unresolved cases.",
+        knowledge_base_description="Product troubleshooting guides and FAQs",
+        identity="Technical customer support specialist with expertise in troubleshooting",
+        task="Help users resolve technical issues with patience and clarity",
+        demeanor="Friendly, patient, and empathetic",
+        tone="Warm and reassuring",
+        formality_level="neutral",
+        enthusiasm_level="moderate",
+        filler_words="none",
+        pacing="moderate",
+        additional_instructions="Always acknowledge user frustration and provide step-by-step guidance",
+    ).with_inputs("voice_personality_text", "sop", "knowledge_base_description"),
+    dspy.Example(
+        voice_personality_text=(
+            "Professional financial advisor for high-net-worth clients. "
+            "Sophisticated, confident, and authoritative."
+        ),
+        sop="Advise clients on investment strategies and portfolio management.",
+        knowledge_base_description="Investment products and wealth management policies",
+        identity="Senior financial advisor specializing in wealth management for high-net-worth individuals",
+        task="Provide sophisticated financial guidance and investment strategies",
+        demeanor="Professional, confident, and authoritative",
+        tone="Authoritative and sophisticated",
+        formality_level="very_formal",
+        enthusiasm_level="low",
+        filler_words="none",
+        pacing="moderate",
+        additional_instructions="Use financial terminology appropriately, maintain gravitas, and project expertise",
+    ).with_inputs("voice_personality_text", "sop", "knowledge_base_description"),
+]
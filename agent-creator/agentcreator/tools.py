@@ -17,7 +17,7 @@ DSPy PythonInterpreter Benefits:
 - Full Python execution (not just syntax validation)
 - Fast local development
 - Automatic fallback for resilience
-- Maintains state between executions
+- Pooled interpreters for concurrent ReAct workers
 - Same interface as AgentCore
 
 Example:
@@ -28,13 +28,20 @@ Example:
     14
 """
 
+import atexit
 import json
 import logging
 import os
-from typing import Optional
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
-import boto3
-import dspy
+# boto3 and dspy are imported lazily where they are used: dev-mode syntax
+# validation needs neither, and both are expensive to import at startup.
+if TYPE_CHECKING:
+    import dspy
 
 logger = logging.getLogger(__name__)
 
@@ -46,29 +53,216 @@ AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 # Global code interpreter ARN
 _code_interpreter_session_id: Optional[str] = None  # Actually stores ARN, not session ID
 
-# DSPy PythonInterpreter as fallback
-_dspy_interpreter: Optional[dspy.PythonInterpreter] = None
+# Code interpreter ARN persisted across restarts, scoped to AWS account + region
+CODE_INTERPRETER_CACHE_PATH = os.path.expanduser(
+    os.getenv("AGENTCORE_CI_CACHE_PATH", "~/.oratio/agentcore_ci.json")
+)
+_aws_account_id: Optional[str] = None
 
+# Shared control-plane client so polling and cleanup reuse pooled connections
+_control_client: Optional[Any] = None
 
-def _get_dspy_interpreter() -> dspy.PythonInterpreter:
-    """Get or create DSPy PythonInterpreter instance"""
-    global _dspy_interpreter
-    if _dspy_interpreter is None:
-        _dspy_interpreter = dspy.PythonInterpreter()
-        logger.info("Initialized DSPy PythonInterpreter for fallback execution")
-    return _dspy_interpreter
+# Code interpreter readiness polling (exponential backoff, seconds)
+CODE_INTERPRETER_READY_TIMEOUT = 60.0
+CODE_INTERPRETER_POLL_INITIAL_DELAY = 0.25
+CODE_INTERPRETER_POLL_MAX_DELAY = 4.0
+_CODE_INTERPRETER_FAILED_STATUSES = {"CREATE_FAILED", "DELETING", "DELETE_FAILED", "DELETED"}
 
+# Pool of DSPy PythonInterpreters as fallback, so concurrent ReAct workers
+# don't serialize on a single interpreter subprocess
+DSPY_POOL_SIZE = min(os.cpu_count() or 1, 4)
+_dspy_pool: "queue.Queue[dspy.PythonInterpreter]" = queue.Queue(maxsize=DSPY_POOL_SIZE)
+_dspy_interpreters: list["dspy.PythonInterpreter"] = []
+_dspy_pool_lock = threading.Lock()
 
-def _get_or_create_session() -> tuple[boto3.client, str]:
+# Generated agents are a few KB; anything this large is runaway LLM output
+MAX_CODE_BYTES = 200 * 1024
+
+
+def _quick_reject(code: str) -> Optional[str]:
+    """Cheap pre-check that rejects obviously invalid code before ast.parse
+
+    Only catches inputs that can never be valid Python (oversized output,
+    markdown-fenced responses), so valid code always falls through to the parser.
+
+    Args:
+        code: Python code to check
+
+    Returns:
+        Error message if the code is rejected, None otherwise
+    """
+    if len(code) > MAX_CODE_BYTES or len(code.encode("utf-8")) > MAX_CODE_BYTES:
+        return f"✗ Code rejected: exceeds {MAX_CODE_BYTES // 1024} KB limit"
+    if code.lstrip().startswith("```"):
+        return "✗ Syntax error at line 1: code is wrapped in a markdown fence, remove the ``` markers"
+    return None
+
+
+@contextmanager
+def _checkout_dspy_interpreter() -> Iterator["dspy.PythonInterpreter"]:
+    """Check out a DSPy PythonInterpreter from the pool
+
+    Interpreters are created on demand up to DSPY_POOL_SIZE; once the pool is
+    full, callers block until an interpreter is returned.
+    """
+    try:
+        interpreter = _dspy_pool.get_nowait()
+    except queue.Empty:
+        interpreter = None
+        with _dspy_pool_lock:
+            if len(_dspy_interpreters) < DSPY_POOL_SIZE:
+                import dspy
+
+                interpreter = dspy.PythonInterpreter()
+                _dspy_interpreters.append(interpreter)
+                logger.info(
+                    f"Initialized DSPy PythonInterpreter {len(_dspy_interpreters)}/{DSPY_POOL_SIZE} "
+                    "for fallback execution"
+                )
+        if interpreter is None:
+            interpreter = _dspy_pool.get()
+
+    try:
+        yield interpreter
+    finally:
+        _dspy_pool.put(interpreter)
+
+
+@atexit.register
+def _shutdown_dspy_interpreters():
+    """Shut down pooled DSPy interpreters at process exit"""
+    for interpreter in _dspy_interpreters:
+        try:
+            interpreter.shutdown()
+        except Exception as e:
+            logger.warning(f"Failed to shut down DSPy PythonInterpreter: {e}")
+    _dspy_interpreters.clear()
+
+
+def _get_control_client() -> Any:
+    """Get or create the shared bedrock-agentcore-control client"""
+    global _control_client
+    if _control_client is None:
+        import boto3
+        from botocore.config import Config
+
+        _control_client = boto3.client(
+            'bedrock-agentcore-control',
+            region_name=AWS_REGION,
+            config=Config(tcp_keepalive=True),
+        )
+    return _control_client
+
+
+def _wait_for_code_interpreter(client: Any, code_interpreter_arn: str) -> bool:
+    """Poll until the code interpreter is ready, backing off 0.25s -> 4s
+
+    Args:
+        client: bedrock-agentcore-control client
+        code_interpreter_arn: ARN of the code interpreter to wait for
+
+    Returns:
+        True once the code interpreter is READY, False on timeout
+
+    Raises:
+        RuntimeError: If the code interpreter enters a failed state
+    """
+    deadline = time.monotonic() + CODE_INTERPRETER_READY_TIMEOUT
+    delay = CODE_INTERPRETER_POLL_INITIAL_DELAY
+
+    while True:
+        status = client.get_code_interpreter(codeInterpreterArn=code_interpreter_arn).get("status")
+        if status == "READY":
+            return True
+        if status in _CODE_INTERPRETER_FAILED_STATUSES:
+            raise RuntimeError(f"Code interpreter entered status {status}")
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, CODE_INTERPRETER_POLL_MAX_DELAY)
+
+
+def _get_aws_account_id() -> str:
+    """Get the caller's AWS account ID (memoized for the process)"""
+    global _aws_account_id
+    if _aws_account_id is None:
+        import boto3
+
+        sts = boto3.client('sts', region_name=AWS_REGION)
+        _aws_account_id = sts.get_caller_identity()['Account']
+    return _aws_account_id
+
+
+def _load_cached_code_interpreter_arn() -> Optional[str]:
+    """Load a code interpreter ARN persisted by a previous process
+
+    Returns:
+        The cached ARN if it was created in the current account and region, None otherwise
+    """
+    try:
+        with open(CODE_INTERPRETER_CACHE_PATH) as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable code interpreter cache {CODE_INTERPRETER_CACHE_PATH}: {e}")
+        return None
+
+    try:
+        if cached.get("region") != AWS_REGION or cached.get("account") != _get_aws_account_id():
+            return None
+    except Exception as e:
+        logger.warning(f"Could not resolve AWS account for code interpreter cache: {e}")
+        return None
+    return cached.get("codeInterpreterArn")
+
+
+def _save_cached_code_interpreter_arn(code_interpreter_arn: str) -> None:
+    """Persist the code interpreter ARN atomically so restarts can reuse it"""
+    try:
+        cache_dir = os.path.dirname(CODE_INTERPRETER_CACHE_PATH)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{CODE_INTERPRETER_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "codeInterpreterArn": code_interpreter_arn,
+                    "region": AWS_REGION,
+                    "account": _get_aws_account_id(),
+                },
+                f,
+            )
+        os.replace(tmp_path, CODE_INTERPRETER_CACHE_PATH)
+    except Exception as e:
+        logger.warning(f"Failed to persist code interpreter cache: {e}")
+
+
+def _clear_cached_code_interpreter_arn() -> None:
+    """Remove the persisted code interpreter ARN"""
+    try:
+        os.unlink(CODE_INTERPRETER_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove code interpreter cache: {e}")
+
+
+def _get_or_create_session() -> tuple[Any, str]:
     """Get or create a code interpreter session
     
     Returns:
         Tuple of (client, code_interpreter_arn)
     """
     global _code_interpreter_session_id
-    
-    client = boto3.client('bedrock-agentcore-control', region_name=AWS_REGION)
-    
+
+    client = _get_control_client()
+
+    # After a restart, pick up the code interpreter created by a previous process
+    if _code_interpreter_session_id is None:
+        _code_interpreter_session_id = _load_cached_code_interpreter_arn()
+
     # Reuse existing session if available
     if _code_interpreter_session_id:
         try:
@@ -79,6 +273,7 @@ def _get_or_create_session() -> tuple[boto3.client, str]:
         except Exception as e:
             logger.warning(f"Existing code interpreter invalid, creating new one: {e}")
             _code_interpreter_session_id = None
+            _clear_cached_code_interpreter_arn()
     
     # Create new code interpreter
     try:
@@ -91,14 +286,18 @@ def _get_or_create_session() -> tuple[boto3.client, str]:
         )
         _code_interpreter_session_id = response['codeInterpreterArn']
         logger.info(f"Created new code interpreter: {_code_interpreter_session_id}")
+        _save_cached_code_interpreter_arn(_code_interpreter_session_id)
         
         # Wait for code interpreter to be available
         try:
-            waiter = client.get_waiter('code_interpreter_available')
-            waiter.wait(codeInterpreterArn=_code_interpreter_session_id)
-            logger.info("Code interpreter is now available")
+            if _wait_for_code_interpreter(client, _code_interpreter_session_id):
+                logger.info("Code interpreter is now available")
+            else:
+                logger.warning(
+                    f"Code interpreter not ready after {CODE_INTERPRETER_READY_TIMEOUT:.0f}s"
+                )
         except Exception as wait_error:
-            logger.warning(f"Waiter not available or failed: {wait_error}")
+            logger.warning(f"Failed waiting for code interpreter: {wait_error}")
         
         return client, _code_interpreter_session_id
         
@@ -113,9 +312,10 @@ def cleanup_session():
     
     if _code_interpreter_session_id:
         try:
-            client = boto3.client('bedrock-agentcore-control', region_name=AWS_REGION)
+            client = _get_control_client()
             client.delete_code_interpreter(codeInterpreterArn=_code_interpreter_session_id)
             logger.info(f"Cleaned up code interpreter: {_code_interpreter_session_id}")
+            _clear_cached_code_interpreter_arn()
         except Exception as e:
             logger.warning(f"Failed to cleanup code interpreter: {e}")
         finally:
@@ -150,6 +350,11 @@ def execute_python_code(code: str, description: str = "") -> str:
         # In development mode, just validate syntax (no Deno dependency)
         logger.info(f"Validating code syntax (dev mode): {description}")
         
+        rejection = _quick_reject(code)
+        if rejection:
+            logger.warning(rejection)
+            return rejection
+
         try:
             import ast
             ast.parse(code)
@@ -169,7 +374,12 @@ def execute_python_code(code: str, description: str = "") -> str:
     # However, for AgentCreator's use case (validation only), we'll use syntax validation
     logger.warning("AgentCore Code Interpreter execution not yet implemented in control plane")
     logger.info("Falling back to syntax validation + DSPy execution")
-    
+
+    rejection = _quick_reject(code)
+    if rejection:
+        logger.warning(rejection)
+        return rejection
+
     try:
         # First, validate syntax
         import ast
@@ -177,8 +387,8 @@ def execute_python_code(code: str, description: str = "") -> str:
         logger.info("Code syntax validation successful")
         
         # Then execute with DSPy for full validation
-        interpreter = _get_dspy_interpreter()
-        result = interpreter.execute(code)
+        with _checkout_dspy_interpreter() as interpreter:
+            result = interpreter.execute(code)
         logger.info("DSPy execution successful")
         return f"✓ Code validated and executed successfully:\n{result}"
         
@@ -208,7 +418,11 @@ def validate_python_syntax(code: str) -> str:
         "✓ Code syntax is valid"
     """
     import ast
-    
+
+    rejection = _quick_reject(code)
+    if rejection:
+        return rejection
+
     try:
         ast.parse(code)
         return "✓ Code syntax is valid"
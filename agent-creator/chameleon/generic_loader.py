@@ -5,16 +5,30 @@ Includes memory hooks for conversation continuity
 """
 import os
 import sys
+import gzip
+import atexit
+import hashlib
+import marshal
+import tempfile
 import json
 import logging
+import threading
+import time
 import boto3
-import tempfile
-import importlib.util
-from typing import Dict, Any
+import types
+import linecache
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
-from bedrock_agentcore.memory import MemoryClient
-from strands.hooks import AgentInitializedEvent, HookProvider, HookRegistry, MessageAddedEvent
-from opentelemetry import baggage, context as otel_context
+
+# MemoryClient, strands hooks and OpenTelemetry are imported where they are first
+# used, so container startup only pays for what the runtime app needs
+if TYPE_CHECKING:
+    from bedrock_agentcore.memory import MemoryClient
+    from strands.hooks import AgentInitializedEvent, HookRegistry, MessageAddedEvent
 #comment to trigger a build
 # Configure logging
 logging.basicConfig(
@@ -27,29 +41,263 @@ logger = logging.getLogger(__name__)
 CODE_BUCKET = os.environ.get('CODE_BUCKET', 'oratio-generated-code')
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 AGENTS_TABLE = os.environ.get('AGENTS_TABLE', 'oratio-agents')
+AGENT_MODULE_CACHE_SIZE = int(os.environ.get('AGENT_MODULE_CACHE_SIZE', '64'))
+AGENT_META_TTL_SECONDS = float(os.environ.get('AGENT_META_TTL_SECONDS', '60'))
+AGENT_META_CACHE_SIZE = int(os.environ.get('AGENT_META_CACHE_SIZE', '10000'))
+# Approximate token budget for conversation history injected into the system prompt
+MAX_HISTORY_TOKENS = int(os.environ.get('MAX_HISTORY_TOKENS', '800'))
+MEMORY_FLUSH_INTERVAL_SECONDS = float(os.environ.get('MEMORY_FLUSH_INTERVAL_SECONDS', '0.5'))
+# Compiled agent code objects persisted across module cache misses and container restarts
+AGENT_CODE_CACHE_DIR = os.environ.get(
+    'AGENT_CODE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'oratio-agent-code')
+)
+S3_TRANSFER_ACCELERATION = os.environ.get('S3_TRANSFER_ACCELERATION', 'false').lower() == 'true'
 
 # Initialize clients
-s3_client = boto3.client('s3', region_name=AWS_REGION)
+# S3 is on every invocation's path: keep a large keep-alive pool so concurrent
+# invocations don't queue for connections or redo TLS handshakes
+s3_client = boto3.client(
+    's3',
+    region_name=AWS_REGION,
+    config=Config(
+        max_pool_connections=100,
+        retries={'mode': 'adaptive', 'max_attempts': 3},
+        tcp_keepalive=True,
+        connect_timeout=1.0,
+        read_timeout=5.0,
+        s3={'use_accelerate_endpoint': S3_TRANSFER_ACCELERATION},
+    ),
+)
 dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
-memory_client = MemoryClient(region_name=AWS_REGION)
+agents_table = dynamodb.Table(AGENTS_TABLE)
+_memory_client: Optional["MemoryClient"] = None
+_memory_client_lock = threading.Lock()
 
 # Create BedrockAgentCoreApp
 app = BedrockAgentCoreApp()
 
+# Loaded agent modules: (user_id, agent_id) -> (S3 ETag, module), least recently used evicted first
+_agent_module_cache: "OrderedDict[Tuple[str, str], Tuple[str, Any]]" = OrderedDict()
+_agent_module_cache_lock = threading.Lock()
+
+
+# Runs the independent DynamoDB and S3 lookups of an invocation concurrently
+_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='loader-io')
+
+# Agent rows from DynamoDB: (user_id, agent_id) -> (fetched_at, item); memoryId rarely changes
+_agent_meta_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+_agent_meta_cache_lock = threading.Lock()
+
+
+def _get_agent_meta(user_id: str, agent_id: str) -> Dict[str, Any]:
+    """Fetch the agent's memoryId from DynamoDB, cached for AGENT_META_TTL_SECONDS once set"""
+    cache_key = (user_id, agent_id)
+    with _agent_meta_cache_lock:
+        cached = _agent_meta_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < AGENT_META_TTL_SECONDS:
+        return cached[1]
+    
+    agent_response = agents_table.get_item(
+        Key={"userId": user_id, "agentId": agent_id},
+        ProjectionExpression="memoryId",
+    )
+    agent_data = agent_response.get('Item', {})
+    # A new agent's memoryId is written after its row, so only cache once it's there
+    if agent_data.get('memoryId'):
+        with _agent_meta_cache_lock:
+            _agent_meta_cache.pop(cache_key, None)
+            if len(_agent_meta_cache) >= AGENT_META_CACHE_SIZE:
+                _agent_meta_cache.pop(next(iter(_agent_meta_cache)))
+            _agent_meta_cache[cache_key] = (time.monotonic(), agent_data)
+    return agent_data
+
+
+def _fetch_agent_code(s3_key: str, cached_etag: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Fetch agent source from S3, conditionally on the cached ETag if there is one
+    
+    Returns:
+        (ETag, source) of the current object, or None if it still matches cached_etag
+    """
+    get_kwargs = {'Bucket': CODE_BUCKET, 'Key': s3_key}
+    if cached_etag is not None:
+        get_kwargs['IfNoneMatch'] = cached_etag
+    try:
+        response = s3_client.get_object(**get_kwargs)
+    except ClientError as e:
+        if cached_etag is not None and e.response.get('Error', {}).get('Code') == '304':
+            return None
+        raise
+    body = response['Body'].read()
+    # Agent code is uploaded gzip-compressed; boto3 does not decode Content-Encoding
+    if response.get('ContentEncoding') == 'gzip':
+        body = gzip.decompress(body)
+    return response['ETag'], body.decode('utf-8')
+
+
+def _compile_agent_code(agent_code: str, filename: str, etag: str) -> types.CodeType:
+    """Compile agent source without going through importlib
+    
+    Code objects are marshalled to AGENT_CODE_CACHE_DIR keyed by filename, S3 ETag and
+    interpreter version, so a module cache miss for unchanged code skips compilation.
+    The source is registered with linecache under the pseudo-filename so tracebacks
+    from agent code still show source lines.
+    """
+    cache_name = hashlib.sha256(
+        f"{sys.implementation.cache_tag}:{filename}:{etag}".encode('utf-8')
+    ).hexdigest()
+    cache_path = os.path.join(AGENT_CODE_CACHE_DIR, f"{cache_name}.pyc")
+    
+    code = None
+    try:
+        with open(cache_path, 'rb') as f:
+            code = marshal.load(f)
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable compiled agent cache {cache_path}: {e}")
+    
+    if not isinstance(code, types.CodeType):
+        code = compile(agent_code, filename, 'exec')
+        try:
+            os.makedirs(AGENT_CODE_CACHE_DIR, mode=0o700, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                marshal.dump(code, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write compiled agent cache {cache_path}: {e}")
+    
+    linecache.cache[filename] = (len(agent_code), None, agent_code.splitlines(True), filename)
+    return code
+
+
+def _agent_module_name(user_id: str, agent_id: str) -> str:
+    """Stable sys.modules name for an agent's module"""
+    return f"dynamic_agent_{user_id}_{agent_id}"
+
+
+def _build_agent_module(
+    module_name: str, user_id: str, agent_id: str, agent_code: str, etag: str
+) -> types.ModuleType:
+    """Compile and execute agent source into a new module
+    
+    The module is registered in sys.modules under module_name so dataclasses/pydantic
+    can resolve it; callers remove it if loading fails.
+    """
+    agent_module = types.ModuleType(module_name)
+    agent_module.__file__ = f"<agent:{user_id}/{agent_id}>"
+    code = _compile_agent_code(agent_code, agent_module.__file__, etag)
+    sys.modules[module_name] = agent_module
+    exec(code, agent_module.__dict__)
+    return agent_module
+
+
+def _get_cached_agent_module(cache_key: Tuple[str, str]) -> Optional[Tuple[str, Any]]:
+    """Return the cached (ETag, module) entry for an agent, if any"""
+    with _agent_module_cache_lock:
+        entry = _agent_module_cache.get(cache_key)
+        if entry is not None:
+            _agent_module_cache.move_to_end(cache_key)
+        return entry
+
+
+def _cache_agent_module(cache_key: Tuple[str, str], etag: str, agent_module: Any) -> None:
+    """Store a loaded agent module, evicting the least recently used beyond the cache size"""
+    with _agent_module_cache_lock:
+        _agent_module_cache[cache_key] = (etag, agent_module)
+        _agent_module_cache.move_to_end(cache_key)
+        while len(_agent_module_cache) > AGENT_MODULE_CACHE_SIZE:
+            _, (_, evicted_module) = _agent_module_cache.popitem(last=False)
+            # Only drop the sys.modules entry if it still points at the evicted module
+            if sys.modules.get(evicted_module.__name__) is evicted_module:
+                del sys.modules[evicted_module.__name__]
+
+
+def _get_memory_client() -> "MemoryClient":
+    """Create the AgentCore MemoryClient on first use by an agent with memory"""
+    global _memory_client
+    if _memory_client is None:
+        with _memory_client_lock:
+            if _memory_client is None:
+                from bedrock_agentcore.memory import MemoryClient
+                
+                _memory_client = MemoryClient(region_name=AWS_REGION)
+    return _memory_client
+
+
+# Memory events are buffered per (memory_id, actor_id, session_id) and written in
+# batches by a background thread, keeping create_event off the response path
+_memory_queue: Dict[Tuple[str, str, str], List[Tuple[str, str]]] = defaultdict(list)
+_memory_queue_lock = threading.Lock()
+_memory_flush_thread: Optional[threading.Thread] = None
+
+
+def _enqueue_memory_event(memory_id: str, actor_id: str, session_id: str, message: Tuple[str, str]) -> None:
+    """Buffer a (text, role) message for the background memory writer"""
+    global _memory_flush_thread
+    with _memory_queue_lock:
+        _memory_queue[(memory_id, actor_id, session_id)].append(message)
+        if _memory_flush_thread is None:
+            _memory_flush_thread = threading.Thread(
+                target=_memory_flush_loop, name='memory-flush', daemon=True
+            )
+            _memory_flush_thread.start()
+
+
+def _flush_memory_events(key: Optional[Tuple[str, str, str]] = None) -> None:
+    """Write buffered memory events, one create_event call per session
+    
+    Args:
+        key: Only flush this (memory_id, actor_id, session_id); flush everything if None
+    """
+    with _memory_queue_lock:
+        if key is None:
+            batches = dict(_memory_queue)
+            _memory_queue.clear()
+        elif key in _memory_queue:
+            batches = {key: _memory_queue.pop(key)}
+        else:
+            return
+    
+    for (memory_id, actor_id, session_id), messages in batches.items():
+        try:
+            _get_memory_client().create_event(
+                memory_id=memory_id,
+                actor_id=actor_id,
+                session_id=session_id,
+                messages=messages
+            )
+            logger.debug(f"✅ Saved {len(messages)} messages to memory for session {session_id}")
+        except Exception as e:
+            logger.error(f"Memory save error: {e}")
+
+
+def _memory_flush_loop() -> None:
+    """Background writer that flushes buffered memory events periodically"""
+    while True:
+        time.sleep(MEMORY_FLUSH_INTERVAL_SECONDS)
+        _flush_memory_events()
+
+
+atexit.register(_flush_memory_events)
+
 
-class MemoryHookProvider(HookProvider):
+class MemoryHookProvider:
     """
     Memory hook provider for Chameleon generic loader.
     Handles conversation history loading and storage for all generated agents.
     
     Based on: https://github.com/awslabs/amazon-bedrock-agentcore-samples/blob/main/01-tutorials/04-AgentCore-memory/01-short-term-memory/01-single-agent/with-strands-agent/personal-agent.ipynb
+    
+    Implements the strands HookProvider protocol (register_hooks) without
+    subclassing it, so strands is only imported once hooks are registered.
     """
     
-    def __init__(self, memory_client: MemoryClient, memory_id: str):
+    def __init__(self, memory_client: "MemoryClient", memory_id: str):
         self.memory_client = memory_client
         self.memory_id = memory_id
     
-    def on_agent_initialized(self, event: AgentInitializedEvent):
+    def on_agent_initialized(self, event: "AgentInitializedEvent"):
         """Load recent conversation history when agent starts"""
         try:
             # Get session info from agent state
@@ -60,6 +308,9 @@ class MemoryHookProvider(HookProvider):
                 logger.warning("Missing actor_id or session_id in agent state")
                 return
             
+            # Write anything still buffered for this session so history is complete
+            _flush_memory_events((self.memory_id, actor_id, session_id))
+            
             # Load the last 10 conversation turns from memory
             recent_turns = self.memory_client.get_last_k_turns(
                 memory_id=self.memory_id,
@@ -69,25 +320,53 @@ class MemoryHookProvider(HookProvider):
             )
             
             if recent_turns:
+                # Keep the newest turns that fit in MAX_HISTORY_TOKENS (~4 chars per token)
+                # so long sessions don't inflate every prompt
+                kept_turns = []
+                remaining_tokens = MAX_HISTORY_TOKENS
+                for turn in reversed(recent_turns):
+                    turn_tokens = sum(len(message['content']['text']) for message in turn) // 4
+                    if turn_tokens > remaining_tokens:
+                        break
+                    remaining_tokens -= turn_tokens
+                    kept_turns.append(turn)
+                kept_turns.reverse()
+                
+                if not kept_turns:
+                    logger.info(f"Latest conversation turn exceeds history budget for session {session_id}")
+                    return
+                
                 # Format conversation history for context
-                context_messages = []
-                for turn in recent_turns:
-                    for message in turn:
-                        role = message['role']
-                        content = message['content']['text']
-                        context_messages.append(f"{role}: {content}")
+                context = "\n".join(
+                    f"{message['role']}: {message['content']['text']}"
+                    for turn in kept_turns
+                    for message in turn
+                )
+                omitted_turns = len(recent_turns) - len(kept_turns)
+                if omitted_turns:
+                    context = f"({omitted_turns} earlier turns omitted)\n{context}"
                 
-                context = "\n".join(context_messages)
                 # Add context to agent's system prompt
-                event.agent.system_prompt += f"\n\nRecent conversation:\n{context}"
-                logger.info(f"✅ Loaded {len(recent_turns)} conversation turns for session {session_id}")
+                event.agent.system_prompt = f"{event.agent.system_prompt}\n\nRecent conversation:\n{context}"
+                logger.info(
+                    f"✅ Loaded {len(kept_turns)}/{len(recent_turns)} conversation turns for session {session_id}"
+                )
                 
         except Exception as e:
             logger.error(f"Memory load error: {e}")
     
-    def on_message_added(self, event: MessageAddedEvent):
+    def on_message_added(self, event: "MessageAddedEvent"):
         """Store messages in memory"""
-        messages = event.agent.messages
+        message = event.agent.messages[-1]
+        
+        # Only text messages are stored; skip tool use/results before touching agent state
+        try:
+            text = message["content"][0]["text"]
+        except (KeyError, IndexError, TypeError):
+            return
+        if not text:
+            return
+        
         try:
             # Get session info from agent state
             actor_id = event.agent.state.get("actor_id")
@@ -97,23 +376,31 @@ class MemoryHookProvider(HookProvider):
                 logger.warning("Missing actor_id or session_id, skipping memory save")
                 return
 
-            if messages[-1]["content"][0].get("text"):
-                self.memory_client.create_event(
-                    memory_id=self.memory_id,
-                    actor_id=actor_id,
-                    session_id=session_id,
-                    messages=[(messages[-1]["content"][0]["text"], messages[-1]["role"])]
-                )
-                logger.debug(f"✅ Saved message to memory for session {session_id}")
+            _enqueue_memory_event(self.memory_id, actor_id, session_id, (text, message["role"]))
+            logger.debug("Queued message for memory save in session %s", session_id)
         except Exception as e:
             logger.error(f"Memory save error: {e}")
     
-    def register_hooks(self, registry: HookRegistry):
+    def register_hooks(self, registry: "HookRegistry"):
         """Register memory hooks"""
+        from strands.hooks import AgentInitializedEvent, MessageAddedEvent
+        
         registry.add_callback(MessageAddedEvent, self.on_message_added)
         registry.add_callback(AgentInitializedEvent, self.on_agent_initialized)
 
 
+# MemoryHookProvider holds only the client and memory_id, so one instance per memory_id is shared
+_memory_hooks: Dict[str, MemoryHookProvider] = {}
+
+
+def _get_memory_hook(memory_id: str) -> MemoryHookProvider:
+    """Get or create the memory hook provider for a memory resource"""
+    memory_hook = _memory_hooks.get(memory_id)
+    if memory_hook is None:
+        memory_hook = _memory_hooks.setdefault(memory_id, MemoryHookProvider(_get_memory_client(), memory_id))
+    return memory_hook
+
+
 @app.entrypoint
 def invoke(payload: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -143,7 +430,9 @@ def invoke(payload: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         }
     """
     try:
-        logger.info(f"Generic loader invoked with payload: {json.dumps(payload, default=str)}")
+        # Only serialize the payload when INFO logging is actually enabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Generic loader invoked with payload: %s", json.dumps(payload, default=str))
         
         # Extract identifiers
         agent_id = payload.get('agent_id')
@@ -166,38 +455,51 @@ def invoke(payload: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
                 'error_type': 'ValidationError'
             }
         
+        # Construct S3 path
+        s3_key = f"{user_id}/{agent_id}/agent_file.py"
+        cache_key = (user_id, agent_id)
+        
+        cached = _get_cached_agent_module(cache_key)
+        agent_module = None
+        module_name = None
+        context_token = None
+        
+        # The DynamoDB and S3 lookups are independent, so run them concurrently.
+        # With a cached module the S3 fetch is a conditional GET that returns
+        # 304 (no body) when the code is unchanged.
+        logger.info("Fetching agent code from s3://%s/%s", CODE_BUCKET, s3_key)
+        meta_future = _io_pool.submit(_get_agent_meta, user_id, agent_id)
+        code_future = _io_pool.submit(_fetch_agent_code, s3_key, cached[0] if cached else None)
+        
         # Fetch agent details from DynamoDB to get memory_id
-        agents_table = dynamodb.Table(AGENTS_TABLE)
         try:
-            agent_response = agents_table.get_item(
-                Key={"userId": user_id, "agentId": agent_id}
-            )
-            agent_data = agent_response.get('Item', {})
+            agent_data = meta_future.result()
             agent_memory_id = agent_data.get('memoryId')
             
             if agent_memory_id:
-                logger.info(f"Agent has dedicated memory resource: {agent_memory_id}")
+                logger.info("Agent has dedicated memory resource: %s", agent_memory_id)
             else:
-                logger.info(f"Agent has no memory resource (conversation history disabled)")
+                logger.info("Agent has no memory resource (conversation history disabled)")
         except Exception as db_error:
             logger.warning(f"Failed to fetch agent from DynamoDB: {db_error}")
             agent_memory_id = None
         
-        # Construct S3 path
-        s3_key = f"{user_id}/{agent_id}/agent_file.py"
-        logger.info(f"Fetching agent code from s3://{CODE_BUCKET}/{s3_key}")
-        
         # Fetch agent code from S3
         try:
-            response = s3_client.get_object(Bucket=CODE_BUCKET, Key=s3_key)
-            agent_code = response['Body'].read().decode('utf-8')
-            logger.info(f"Successfully fetched {len(agent_code)} bytes of agent code")
-        except s3_client.exceptions.NoSuchKey:
-            error_msg = f"Agent code not found at s3://{CODE_BUCKET}/{s3_key}"
-            logger.error(error_msg)
+            fetched = code_future.result()
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+                error_msg = f"Agent code not found at s3://{CODE_BUCKET}/{s3_key}"
+                logger.error(error_msg)
+                return {
+                    'error': error_msg,
+                    'error_type': 'AgentNotFoundError'
+                }
+            error_msg = f"Failed to fetch agent code from S3: {str(e)}"
+            logger.error(error_msg, exc_info=True)
             return {
                 'error': error_msg,
-                'error_type': 'AgentNotFoundError'
+                'error_type': 'S3Error'
             }
         except Exception as e:
             error_msg = f"Failed to fetch agent code from S3: {str(e)}"
@@ -207,51 +509,37 @@ def invoke(payload: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
                 'error_type': 'S3Error'
             }
         
-        # Write code to temporary file
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.py',
-            delete=False,
-            prefix=f'agent_{agent_id}_'
-        ) as tmp_file:
-            tmp_file.write(agent_code)
-            tmp_file_path = tmp_file.name
-        
-        logger.info(f"Agent code written to temporary file: {tmp_file_path}")
+        if fetched is None:
+            etag, agent_module = cached
+            logger.info("Agent code unchanged, using cached agent module (ETag %s)", etag)
+        else:
+            etag, agent_code = fetched
+            logger.info("Successfully fetched %d bytes of agent code", len(agent_code))
         
         try:
-            # Import the agent module dynamically
-            spec = importlib.util.spec_from_file_location(
-                f"dynamic_agent_{agent_id}",
-                tmp_file_path
-            )
-            
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Failed to load spec from {tmp_file_path}")
-            
-            agent_module = importlib.util.module_from_spec(spec)
-            
-            # Add to sys.modules to support relative imports
-            sys.modules[spec.name] = agent_module
-            
-            # Execute the module
-            logger.info("Executing agent module")
-            spec.loader.exec_module(agent_module)
-            
-            # Check if module has invoke function
-            if not hasattr(agent_module, 'invoke'):
-                error_msg = "Agent code does not have 'invoke' function"
-                logger.error(error_msg)
-                return {
-                    'error': error_msg,
-                    'error_type': 'CodeStructureError'
-                }
+            if agent_module is None:
+                # Build the agent module directly from the in-memory source
+                module_name = _agent_module_name(user_id, agent_id)
+                logger.info("Executing agent module")
+                agent_module = _build_agent_module(module_name, user_id, agent_id, agent_code, etag)
+                
+                # Check if module has invoke function
+                if not hasattr(agent_module, 'invoke'):
+                    error_msg = "Agent code does not have 'invoke' function"
+                    logger.error(error_msg)
+                    return {
+                        'error': error_msg,
+                        'error_type': 'CodeStructureError'
+                    }
+                
+                _cache_agent_module(cache_key, etag, agent_module)
+                module_name = None  # Loaded successfully: keep it in sys.modules
             
             # Prepare memory hooks and state for injection
             hooks = []
             state = {}
             
-            if memory_client and agent_memory_id:
+            if agent_memory_id:
                 # Extract session info from payload
                 # actor_id = end customer ID (provided by enterprise/Oratio user's app)
                 # session_id = conversation ID (can be generated or provided)
@@ -265,16 +553,24 @@ def invoke(payload: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
                 
                 # Set OpenTelemetry baggage for session correlation
                 # This allows CloudWatch to group traces by session
-                ctx = baggage.set_baggage("session.id", session_id)
-                ctx = baggage.set_baggage("actor.id", actor_id, context=ctx)
-                ctx = baggage.set_baggage("agent.id", agent_id, context=ctx)
-                ctx = baggage.set_baggage("user.id", user_id, context=ctx)
+                from opentelemetry import baggage, context as otel_context
+                
+                ctx = otel_context.get_current()
+                for key, value in (
+                    ("session.id", session_id),
+                    ("actor.id", actor_id),
+                    ("agent.id", agent_id),
+                    ("user.id", user_id),
+                ):
+                    ctx = baggage.set_baggage(key, value, context=ctx)
                 context_token = otel_context.attach(ctx)
-                logger.info(f"✅ OpenTelemetry baggage set: session_id={session_id}, actor_id={actor_id}, agent_id={agent_id}")
+                logger.info(
+                    "✅ OpenTelemetry baggage set: session_id=%s, actor_id=%s, agent_id=%s",
+                    session_id, actor_id, agent_id
+                )
                 
-                # Create memory hook provider with agent-specific memory_id
-                memory_hook = MemoryHookProvider(memory_client, agent_memory_id)
-                hooks.append(memory_hook)
+                # Reuse the memory hook provider for this agent's memory_id
+                hooks.append(_get_memory_hook(agent_memory_id))
                 
                 # Set state for agent
                 state = {
@@ -282,16 +578,21 @@ def invoke(payload: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
                     "session_id": session_id
                 }
                 
-                logger.info(f"Memory hooks enabled for actor_id={actor_id}, session_id={session_id}, memory_id={agent_memory_id}")
+                logger.info(
+                    "Memory hooks enabled for actor_id=%s, session_id=%s, memory_id=%s",
+                    actor_id, session_id, agent_memory_id
+                )
             else:
-                context_token = None
-                logger.info(f"Memory hooks disabled (agent_memory_id={'not configured' if not agent_memory_id else 'unavailable'})")
+                logger.info(
+                    "Memory hooks disabled (agent_memory_id=%s)",
+                    'not configured' if not agent_memory_id else 'unavailable'
+                )
             
             # Call the agent's invoke function with hooks and state injection
             logger.info("Calling agent invoke function with memory hooks")
             result = agent_module.invoke(payload, context, hooks=hooks, state=state)
             
-            logger.info(f"Agent execution completed successfully")
+            logger.info("Agent execution completed successfully")
             return result
             
         except Exception as e:
@@ -304,24 +605,18 @@ def invoke(payload: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         finally:
             # Detach OpenTelemetry context
             try:
-                if 'context_token' in locals() and context_token is not None:
+                if context_token is not None:
+                    from opentelemetry import context as otel_context
+                    
                     otel_context.detach(context_token)
                     logger.debug("Detached OpenTelemetry baggage context")
             except Exception as context_error:
                 logger.warning(f"Failed to detach context: {context_error}")
             
-            # Cleanup: Remove temporary file
+            # Cleanup: Remove a module that failed to load from sys.modules
             try:
-                if os.path.exists(tmp_file_path):
-                    os.unlink(tmp_file_path)
-                    logger.info(f"Cleaned up temporary file: {tmp_file_path}")
-            except Exception as cleanup_error:
-                logger.warning(f"Failed to cleanup temp file: {cleanup_error}")
-            
-            # Cleanup: Remove from sys.modules
-            try:
-                if spec and spec.name in sys.modules:
-                    del sys.modules[spec.name]
+                if module_name is not None:
+                    sys.modules.pop(module_name, None)
             except:
                 pass
     
@@ -334,10 +629,41 @@ def invoke(payload: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+def _preload_agent_module(user_id: str, agent_id: str) -> None:
+    """Fetch, execute and cache an agent module before the first request arrives"""
+    s3_key = f"{user_id}/{agent_id}/agent_file.py"
+    module_name = _agent_module_name(user_id, agent_id)
+    try:
+        etag, agent_code = _fetch_agent_code(s3_key, None)
+        try:
+            agent_module = _build_agent_module(module_name, user_id, agent_id, agent_code, etag)
+        except Exception:
+            sys.modules.pop(module_name, None)
+            raise
+        
+        if not hasattr(agent_module, 'invoke'):
+            sys.modules.pop(module_name, None)
+            logger.warning(f"Preloaded agent {agent_id} has no 'invoke' function, not caching it")
+            return
+        
+        _cache_agent_module((user_id, agent_id), etag, agent_module)
+        _get_agent_meta(user_id, agent_id)
+        logger.info(f"Preloaded agent module from s3://{CODE_BUCKET}/{s3_key}")
+    except Exception as e:
+        logger.warning(f"Failed to preload agent {agent_id}: {e}")
+
+
 if __name__ == "__main__":
     # Run the app
     logger.info("Starting Generic AgentCore Runtime Loader")
     logger.info(f"CODE_BUCKET: {CODE_BUCKET}")
     logger.info(f"AWS_REGION: {AWS_REGION}")
+    
+    # Containers dedicated to one agent can warm the module cache before serving
+    preload_user_id = os.environ.get('PRELOAD_USER_ID')
+    preload_agent_id = os.environ.get('PRELOAD_AGENT_ID')
+    if preload_user_id and preload_agent_id:
+        _preload_agent_module(preload_user_id, preload_agent_id)
+    
     app.run()
 
@@ -3,12 +3,19 @@
 Test AgentCreator Pipeline
 
 Tests the complete DSPy + LangGraph + MCP integration with a sample SOP.
+Requires the dev extra for the SQLite checkpointer: uv sync --extra dev
 """
 
 import asyncio
+import atexit
+import functools
+import hashlib
 import json
 import logging
+import os
 import sys
+import time
+from pathlib import Path
 
 # Configure logging
 logging.basicConfig(
@@ -18,12 +25,141 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 run_name = "oratio-multi-agent-test-complex"
 
+from langfuse import get_client
 from langfuse.langchain import CallbackHandler  
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
-langfuse_handler: CallbackHandler | None = None
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Pipeline checkpoints, keyed by a hash of the input (see pipeline_thread_id)
+CHECKPOINT_PATH = os.getenv("PIPELINE_CHECKPOINT_PATH", ".pipeline_ckpt.db")
 
-async def test_pipeline():
+
+@functools.lru_cache(maxsize=1)
+def get_langfuse_handler() -> CallbackHandler:
+    """Shared Langfuse callback handler (one client and flush thread per process)"""
+    handler = CallbackHandler()
+    atexit.register(get_client().flush)
+    return handler
+
+
+@functools.lru_cache(maxsize=1)
+def load_sample_sop() -> str:
+    """Sample multi-agent SOP used as pipeline input"""
+    return (FIXTURES_DIR / "complex_sop.md").read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def load_sample_voice_personality() -> dict:
+    """Sample structured voice personality used as pipeline input"""
+    return json.loads((FIXTURES_DIR / "voice_personality.json").read_text(encoding="utf-8"))
+
+
+def pipeline_thread_id(input_data: dict) -> str:
+    """Checkpoint thread ID: identical inputs resume the same thread"""
+    return hashlib.sha256(json.dumps(input_data, sort_keys=True).encode()).hexdigest()
+
+
+def print_results(result: dict):
+    """Print a summary of the pipeline results and a preview of the generated code"""
+    print("\n" + "=" * 60)
+    print("Pipeline Results")
+    print("=" * 60 + "\n")
+    
+    req = result.get("requirements")
+    if req:
+        print("✓ Requirements extracted")
+        core_goal = getattr(req, 'core_goal', None)
+        if core_goal is not None:
+            print(f"  Core goal: {core_goal[:80]}...")
+        else:
+            # Fallback for string format
+            try:
+                req_dict = json.loads(req) if isinstance(req, str) else req
+                print(f"  Core goal: {req_dict.get('core_goal', 'N/A')[:80]}...")
+            except:
+                print(f"  Requirements: {str(req)[:100]}...")
+    
+    plan = result.get("plan")
+    if plan:
+        print("✓ Plan created")
+        architecture_type = getattr(plan, 'architecture_type', None)
+        if architecture_type is not None:
+            print(f"  Architecture type: {architecture_type}")
+            print(f"  Agent roles: {getattr(plan, 'agent_roles', 'N/A')}")
+            print(f"  Required tools: {getattr(plan, 'required_tools', 'N/A')}")
+        else:
+            # Fallback for string format
+            try:
+                plan_dict = json.loads(plan) if isinstance(plan, str) else plan
+                print(f"  Architecture type: {plan_dict.get('architecture_type', 'N/A')}")
+                print(f"  Agent roles: {plan_dict.get('agent_roles', 'N/A')}")
+                print(f"  Plan: {str(plan_dict)[:100]}...")
+            except:
+                print(f"  Plan: {str(plan)[:100]}...")
+    
+    code = result.get("final_agent_code") or ""
+    code_lines = code.splitlines()
+    if code:
+        print("✓ Code generated")
+        print(f"  Lines of code: {len(code_lines)}")
+        print(f"  Has imports: {'import' in code}")
+        print(f"  Has Agent class: {'Agent' in code}")
+        print(f"  Has @tool decorator: {'@tool' in code}")
+        print(f"  Has tool import: {'from strands import Agent, tool' in code}")
+        
+        # Check for multi-agent pattern indicators
+        print(f"  Multiple Agent instances: {code.count('Agent(') > 1}")
+        print(f"  Has orchestrator pattern: {'orchestrator' in code.lower()}")
+    
+    prompt = result.get("generated_prompt")
+    if prompt:
+        print("✓ System prompt generated")
+        full_prompt = getattr(prompt, 'full_prompt', None)
+        print(f"  Prompt length: {len(full_prompt if full_prompt is not None else str(prompt))} chars")
+            
+    review = result.get("code_review")
+    if review:
+        print("✓ Code review completed")
+        score = getattr(review, 'code_quality_score', None)
+        if score is not None:
+            print(f"  Code quality score: {score}/10")
+            print(f"  Critical issues: {len(getattr(review, 'critical_issues', None) or [])}")
+            compliance = getattr(review, 'multi_agent_compliance', None)
+            if compliance:
+                print(f"  Multi-agent compliance: {compliance[:100]}...")
+        else:
+            print(f"  Code review: {str(review)[:100]}...")
+    
+    print("\n" + "=" * 60)
+    print("Sample Generated Code (first 30 lines):")
+    print("=" * 60 + "\n")
+    
+    for i, line in enumerate(code_lines[:30], 1):
+        print(f"{i:3d} | {line}")
+
+
+async def benchmark_node_cache(input_data: dict):
+    """
+    Time a cold run against an identical repeat run to measure the node cache
+
+    Uses its own pipeline without a checkpointer: re-invoking a checkpointed
+    thread merges the input into the finished run's state, so the node cache
+    keys differ from the cold run and every node re-runs.
+    """
+    pipeline = await create_agent_creator_pipeline()
+    
+    start = time.perf_counter()
+    await pipeline.ainvoke(input_data)
+    cold_elapsed = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    await pipeline.ainvoke(input_data)
+    warm_elapsed = time.perf_counter() - start
+    print(f"Cold run: {cold_elapsed:.1f}s, cached run: {warm_elapsed:.2f}s")
+
+
+async def test_pipeline(checkpointer=None):
     """Test the complete AgentCreator pipeline"""
     
     print("\n" + "=" * 60)
@@ -35,59 +171,15 @@ async def test_pipeline():
         from agentcreator.pipeline import create_agent_creator_pipeline
         
         # Sample SOP for testing
-        sample_sop = """
-           You are a unified support platform coordinating multiple specialized AI agents for a major travel and shopping company. 
-            Your system must respond to highly varied customer needs, with the following agent roles:
-
-            1. A travel planner helps users design trip itineraries, book hotels, flights, and recommend attractions.
-            2. A shopping advisor finds products, suggests deals, and compares options for customers.
-            3. A payment and refunds specialist answers questions about billing, payments, and handles refund or dispute requests.
-            4. A loyalty program agent helps with account details, rewards redemption, and status upgrades.
-
-            Guidelines:
-            - Always maintain a warm, empathetic, and professional demeanor with customers.
-            - Each specialized agent must use only their relevant knowledge base and tools for their domain.
-            - If a query spans multiple domains (e.g., booking plus payment), agents should collaborate and hand off the session as needed.
-            - Escalate fraudulent transaction alerts or emotionally distressed customers to human agents immediately.
-            - Always confirm customer identity using provided context before accessing any personal or payment information.
-
-            Business Rules:
-            - Refunds above $1000 or for disputed international bookings always escalate.
-            - Loyalty upgrades require confirmation from payment agent before increasing tier.
-            - Travel planning cannot finalize booking without payment approval.
-            - Shopping advisor must consult loyalty agent if a deal involves a member-exclusive benefit.
-
-            Your platform should log all customer queries with timestamps and agent hand-offs for audit compliance.
-
-            """
-
-        
-        sample_voice_personality = {
-        "identity": "Conversational AI Concierge",
-        "task": "Guide, assist, and resolve customer queries across travel, shopping, payments, and loyalty programs.",
-        "demeanor": "empathetic, proactive, collaborative",
-        "tone": "warm, approachable yet trustworthy",
-        "formalityLevel": "semi-formal (friendly but precise, especially on transactions)",
-        "enthusiasmLevel": "high when recommending, measured when discussing issues or policies",
-        "pacing": "adaptable—faster for bookings, slower and more deliberate for disputes or financial matters",
-        "fillerWords": "rarely, except when building rapport (e.g., \"Let's see...\", \"Good news!\")",
-        "additionalInstructions": (
-            "If you detect frustration or stress, slow down, affirm the customer's feelings, and offer a handoff."
-            " Use customer name frequently, thank them for patience, never guess on financial/legal matters."
-            " Confirm context before giving out or committing to any sensitive operation."
-            )
-        }
-
+        sample_sop = load_sample_sop()
+        sample_voice_personality = load_sample_voice_personality()
         
         # Create pipeline
         print("Creating pipeline...")
-        pipeline = await create_agent_creator_pipeline()
+        pipeline = await create_agent_creator_pipeline(checkpointer=checkpointer)
         print("✓ Pipeline created\n")
-        global langfuse_handler
-        langfuse_handler = CallbackHandler()
-
         pipeline_with_callabacks = pipeline.with_config({
-            "callbacks":[langfuse_handler],
+            "callbacks":[get_langfuse_handler()],
             "run_name":run_name,
             "tags":["oratio"]
         })
@@ -112,85 +204,24 @@ async def test_pipeline():
         print("Running pipeline...")
         print("This may take 30-60 seconds...\n")
         
-        result = await pipeline_with_callabacks.ainvoke(input_data)
+        config = {"configurable": {"thread_id": pipeline_thread_id(input_data)}}
+        snapshot = await pipeline_with_callabacks.aget_state(config)
         
-        # Display results
-        print("\n" + "=" * 60)
-        print("Pipeline Results")
-        print("=" * 60 + "\n")
+        if snapshot.next:
+            # A previous run stopped part-way: resume from the last completed node
+            print(f"Resuming from checkpoint before: {', '.join(snapshot.next)}\n")
+            result = await pipeline_with_callabacks.ainvoke(None, config)
+        elif snapshot.values.get("final_agent_code"):
+            print("Reusing completed run from checkpoint\n")
+            result = snapshot.values
+        else:
+            result = await pipeline_with_callabacks.ainvoke(input_data, config)
         
-        if result.get("requirements"):
-            print("✓ Requirements extracted")
-            req = result["requirements"]
-            if hasattr(req, 'core_goal'):
-                print(f"  Core goal: {req.core_goal[:80]}...")
-            else:
-                # Fallback for string format
-                try:
-                    req_dict = json.loads(req) if isinstance(req, str) else req
-                    print(f"  Core goal: {req_dict.get('core_goal', 'N/A')[:80]}...")
-                except:
-                    print(f"  Requirements: {str(req)[:100]}...")
-        
-        if result.get("plan"):
-            print("✓ Plan created")
-            plan = result["plan"]
-            if hasattr(plan, 'architecture_type'):
-                print(f"  Architecture type: {plan.architecture_type}")
-                print(f"  Agent roles: {plan.agent_roles if hasattr(plan, 'agent_roles') else 'N/A'}")
-                print(f"  Required tools: {plan.required_tools if hasattr(plan, 'required_tools') else 'N/A'}")
-            else:
-                # Fallback for string format
-                try:
-                    plan_dict = json.loads(plan) if isinstance(plan, str) else plan
-                    print(f"  Architecture type: {plan_dict.get('architecture_type', 'N/A')}")
-                    print(f"  Agent roles: {plan_dict.get('agent_roles', 'N/A')}")
-                    print(f"  Plan: {str(plan_dict)[:100]}...")
-                except:
-                    print(f"  Plan: {str(plan)[:100]}...")
-        
-        if result.get("final_agent_code"):
-            print("✓ Code generated")
-            code_lines = result["final_agent_code"].split('\n')
-            print(f"  Lines of code: {len(code_lines)}")
-            print(f"  Has imports: {'import' in result['final_agent_code']}")
-            print(f"  Has Agent class: {'Agent' in result['final_agent_code']}")
-            print(f"  Has @tool decorator: {'@tool' in result['final_agent_code']}")
-            print(f"  Has tool import: {'from strands import Agent, tool' in result['final_agent_code']}")
-            
-            # Check for multi-agent pattern indicators
-            has_multiple_agents = result['final_agent_code'].count('Agent(') > 1
-            has_orchestrator = 'orchestrator' in result['final_agent_code'].lower()
-            print(f"  Multiple Agent instances: {has_multiple_agents}")
-            print(f"  Has orchestrator pattern: {has_orchestrator}")
-        
-        if result.get("generated_prompt"):
-            print("✓ System prompt generated")
-            prompt = result["generated_prompt"]
-            if hasattr(prompt, 'full_prompt'):
-                print(f"  Prompt length: {len(prompt.full_prompt)} chars")
-            else:
-                print(f"  Prompt length: {len(str(prompt))} chars")
-                
-        if result.get("code_review"):
-            print("✓ Code review completed")
-            review = result["code_review"]
-            if hasattr(review, 'code_quality_score'):
-                print(f"  Code quality score: {review.code_quality_score}/10")
-                print(f"  Critical issues: {len(review.critical_issues) if hasattr(review, 'critical_issues') else 0}")
-                if hasattr(review, 'multi_agent_compliance') and review.multi_agent_compliance:
-                    print(f"  Multi-agent compliance: {review.multi_agent_compliance[:100]}...")
-            else:
-                print(f"  Code review: {str(review)[:100]}...")
-        
-        print("\n" + "=" * 60)
-        print("Sample Generated Code (first 30 lines):")
-        print("=" * 60 + "\n")
+        if os.getenv("ORATIO_BENCH_CACHE"):
+            await benchmark_node_cache(input_data)
         
-        if result.get("final_agent_code"):
-            code_lines = result["final_agent_code"].split('\n')[:30]
-            for i, line in enumerate(code_lines, 1):
-                print(f"{i:3d} | {line}")
+        if not os.getenv("ORATIO_QUIET"):
+            print_results(result)
         
         print("\n" + "=" * 60)
         print("✓ Pipeline test completed successfully!")
@@ -204,8 +235,11 @@ async def test_pipeline():
         
     except Exception as e:
         print(f"\n✗ Pipeline test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.getenv("ORATIO_VERBOSE"):
+            import traceback
+            traceback.print_exc()
+        else:
+            logger.exception("Pipeline test failed")
         return 1
 
 
@@ -221,7 +255,8 @@ async def main():
     try:
         
         # Test 2: Full pipeline
-        exit_code = await test_pipeline()
+        async with AsyncSqliteSaver.from_conn_string(CHECKPOINT_PATH) as checkpointer:
+            exit_code = await test_pipeline(checkpointer)
         
     finally:
         # Clean up MCP sessions (best effort - may fail due to async context)
@@ -233,6 +268,8 @@ async def main():
         except (RuntimeError, asyncio.CancelledError):
             # Expected error - sessions will cleanup on process exit
             print("✓ MCP sessions will cleanup on exit\n")
+        except TimeoutError:
+            print("✓ MCP cleanup timed out - sessions will cleanup on exit\n")
         except Exception as e:
             logger.warning(f"Unexpected error during cleanup: {e}")
     
@@ -1,4 +1,5 @@
 # AWS clients package
+from .session import get_client, get_resource
 from .bedrock_client import BedrockClient
 from .cognito_client import CognitoClient
 from .dynamodb_client import DynamoDBClient
@@ -11,4 +12,6 @@ __all__ = [
     "S3Client",
     "BedrockClient",
     "StepFunctionsClient",
+    "get_client",
+    "get_resource",
 ]
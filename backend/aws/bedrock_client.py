@@ -1,21 +1,38 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional
+import random
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
-import boto3
+import orjson
 from botocore.exceptions import ClientError
 
+from .session import get_client
+
 logger = logging.getLogger(__name__)
 
+# Anthropic Messages request envelope, pre-serialized around the prompt:
+# PREFIX % max_tokens + json(prompt) + SUFFIX
+_ANTHROPIC_BODY_PREFIX = (
+    b'{"anthropic_version":"bedrock-2023-05-31","max_tokens":%d,'
+    b'"messages":[{"role":"user","content":'
+)
+_ANTHROPIC_BODY_SUFFIX = b"}]}"
+
+# Ingestion job statuses after which polling stops
+INGESTION_TERMINAL_STATUSES = frozenset({"COMPLETE", "FAILED", "STOPPED"})
+
 
 class BedrockClient:
     """Bedrock client wrapper with tagging support for Oratio platform"""
 
+    # Tags applied to every knowledge base (userId is added per call)
+    _BASE_TAGS = MappingProxyType({"platform": "oratio", "environment": "production"})
+
     def __init__(self, region_name: str = "us-east-1"):
-        self.bedrock_agent = boto3.client("bedrock-agent", region_name=region_name)
-        self.bedrock_runtime = boto3.client("bedrock-runtime", region_name=region_name)
-        self.bedrock_agent_runtime = boto3.client(
-            "bedrock-agent-runtime", region_name=region_name
-        )
+        self.bedrock_agent = get_client("bedrock-agent", region_name)
+        self.bedrock_runtime = get_client("bedrock-runtime", region_name)
+        self.bedrock_agent_runtime = get_client("bedrock-agent-runtime", region_name)
         self.region_name = region_name
 
     def create_knowledge_base(
@@ -47,11 +64,7 @@ class BedrockClient:
         """
         try:
             # Prepare tags
-            tags = {
-                "userId": user_id,
-                "platform": "oratio",
-                "environment": "production",
-            }
+            tags = {"userId": user_id, **self._BASE_TAGS}
 
             response = self.bedrock_agent.create_knowledge_base(
                 name=name,
@@ -198,6 +211,95 @@ class BedrockClient:
             logger.error(f"Failed to get ingestion job status: {e}")
             return None
 
+    async def get_ingestion_job_statuses(
+        self, jobs: List[Tuple[str, str, str]]
+    ) -> List[Optional[str]]:
+        """
+        Get the status of several ingestion jobs concurrently
+
+        Args:
+            jobs: (knowledge_base_id, data_source_id, ingestion_job_id) tuples
+
+        Returns:
+            List[Optional[str]]: Status per job, in input order (None if failed)
+        """
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.get_ingestion_job_status, *job) for job in jobs),
+            return_exceptions=True,
+        )
+        return [None if isinstance(result, BaseException) else result for result in results]
+
+    async def poll_ingestion_jobs(
+        self,
+        jobs: List[Tuple[str, str, str]],
+        initial_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ) -> AsyncIterator[Dict[Tuple[str, str, str], Optional[str]]]:
+        """
+        Poll ingestion jobs until they all reach a terminal status
+
+        Each round queries all pending jobs concurrently, then sleeps with
+        jittered exponential backoff (initial_delay doubling up to max_delay).
+
+        Args:
+            jobs: (knowledge_base_id, data_source_id, ingestion_job_id) tuples
+            initial_delay: First sleep between polling rounds in seconds
+            max_delay: Maximum sleep between polling rounds in seconds
+
+        Yields:
+            Dict: Latest status of every job after each round
+        """
+        statuses: Dict[Tuple[str, str, str], Optional[str]] = {job: None for job in jobs}
+        pending = list(jobs)
+        delay = initial_delay
+
+        while pending:
+            for job, status in zip(pending, await self.get_ingestion_job_statuses(pending)):
+                statuses[job] = status
+            yield dict(statuses)
+
+            pending = [job for job in pending if statuses[job] not in INGESTION_TERMINAL_STATUSES]
+            if pending:
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+                delay = min(delay * 2, max_delay)
+
+    def invoke_model_stream(
+        self, model_id: str, prompt: str, max_tokens: int = 1024
+    ) -> Iterator[str]:
+        """
+        Invoke a Bedrock model and stream the generated text
+
+        Args:
+            model_id: ID of the model to invoke
+            prompt: Prompt to send to the model
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            str: Text chunks as they are generated
+
+        Raises:
+            ClientError: If the invocation fails
+        """
+        body = (
+            _ANTHROPIC_BODY_PREFIX % max_tokens
+            + orjson.dumps(prompt)
+            + _ANTHROPIC_BODY_SUFFIX
+        )
+
+        response = self.bedrock_runtime.invoke_model_with_response_stream(
+            modelId=model_id, body=body, contentType="application/json"
+        )
+
+        for event in response["body"]:
+            chunk = event.get("chunk")
+            if not chunk:
+                continue
+            payload = orjson.loads(chunk["bytes"])
+            if payload.get("type") == "content_block_delta":
+                text = payload["delta"].get("text")
+                if text:
+                    yield text
+
     def invoke_model(
         self, model_id: str, prompt: str, max_tokens: int = 1024
     ) -> Optional[str]:
@@ -213,23 +315,24 @@ class BedrockClient:
             Optional[str]: Model response or None if failed
         """
         try:
-            import json
-
-            body = json.dumps(
-                {
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": max_tokens,
-                    "messages": [{"role": "user", "content": prompt}],
-                }
-            )
-
-            response = self.bedrock_runtime.invoke_model(
-                modelId=model_id, body=body, contentType="application/json"
-            )
-
-            response_body = json.loads(response["body"].read())
-            return response_body["content"][0]["text"]
+            return "".join(self.invoke_model_stream(model_id, prompt, max_tokens))
 
         except ClientError as e:
             logger.error(f"Failed to invoke model: {e}")
             return None
+
+    async def a_invoke_model(
+        self, model_id: str, prompt: str, max_tokens: int = 1024
+    ) -> Optional[str]:
+        """
+        Invoke a Bedrock model without blocking the event loop
+
+        Args:
+            model_id: ID of the model to invoke
+            prompt: Prompt to send to the model
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Optional[str]: Model response or None if failed
+        """
+        return await asyncio.to_thread(self.invoke_model, model_id, prompt, max_tokens)
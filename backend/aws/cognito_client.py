@@ -1,13 +1,17 @@
 """AWS Cognito client wrapper for user authentication operations."""
 
 import os
-import boto3
 from botocore.exceptions import ClientError
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Optional, Any, Tuple
 import logging
 import hmac
 import hashlib
 import base64
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .session import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +19,13 @@ logger = logging.getLogger(__name__)
 class CognitoClient:
     """Wrapper for AWS Cognito operations."""
     
+    # User lookups cached at class level, shared by every request the worker serves.
+    # Maps cache key -> (expires_at, user dict).
+    USER_CACHE_TTL_SECONDS = float(os.getenv('COGNITO_USER_CACHE_TTL_SECONDS', '60'))
+    USER_CACHE_MAX_SIZE = 10_000
+    _user_cache: Dict[str, Tuple[float, Dict]] = {}
+    _user_cache_lock = threading.Lock()
+    
     def __init__(
         self,
         cognito_client: Optional[Any] = None,
@@ -33,9 +44,9 @@ class CognitoClient:
             client_secret: Cognito Client Secret (optional, defaults to env var)
             region: AWS region (defaults to env var)
         """
-        self.client = cognito_client or boto3.client(
+        self.client = cognito_client or get_client(
             'cognito-idp',
-            region_name=region or os.getenv('AWS_REGION', 'us-east-1')
+            region or os.getenv('AWS_REGION', 'us-east-1')
         )
         self.user_pool_id = user_pool_id or os.getenv('COGNITO_USER_POOL_ID')
         self.client_id = client_id or os.getenv('COGNITO_CLIENT_ID')
@@ -65,6 +76,42 @@ class CognitoClient:
         
         return secret_hash
     
+    @staticmethod
+    def _token_cache_key(access_token: str) -> str:
+        """Cache key for an access token (the token itself is not stored)."""
+        return 'token:' + hashlib.blake2s(access_token.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @classmethod
+    def _get_cached_user(cls, key: str) -> Optional[Dict]:
+        """Return a cached user dict if present and not expired."""
+        with cls._user_cache_lock:
+            entry = cls._user_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del cls._user_cache[key]
+                return None
+            return dict(entry[1])
+    
+    @classmethod
+    def _cache_user(cls, key: str, user: Dict) -> None:
+        """Cache a user dict, evicting the oldest entry when full."""
+        with cls._user_cache_lock:
+            cls._user_cache.pop(key, None)
+            if len(cls._user_cache) >= cls.USER_CACHE_MAX_SIZE:
+                cls._user_cache.pop(next(iter(cls._user_cache)))
+            cls._user_cache[key] = (time.monotonic() + cls.USER_CACHE_TTL_SECONDS, dict(user))
+    
+    def invalidate_user(self, email: str) -> None:
+        """
+        Drop a cached admin_get_user result after the user is modified.
+        
+        Args:
+            email: User email address
+        """
+        with self._user_cache_lock:
+            self._user_cache.pop(f'email:{email}', None)
+    
     def sign_up(self, email: str, password: str, name: str) -> Dict:
         """
         Register a new user in Cognito.
@@ -136,6 +183,7 @@ class CognitoClient:
                 params['SecretHash'] = secret_hash
             
             self.client.confirm_sign_up(**params)
+            self.invalidate_user(email)
             logger.info(f"User confirmed successfully: {email}")
             return True
             
@@ -239,16 +287,23 @@ class CognitoClient:
         Raises:
             ClientError: If user retrieval fails
         """
+        cache_key = self._token_cache_key(access_token)
+        cached = self._get_cached_user(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.client.get_user(AccessToken=access_token)
             
             # Convert attributes list to dict
             attributes = {attr['Name']: attr['Value'] for attr in response['UserAttributes']}
             
-            return {
+            user = {
                 'username': response['Username'],
                 'attributes': attributes
             }
+            self._cache_user(cache_key, user)
+            return user
             
         except ClientError as e:
             logger.error(f"Get user failed: {e}")
@@ -264,6 +319,11 @@ class CognitoClient:
         Returns:
             Dict containing user information or None if not found
         """
+        cache_key = f'email:{email}'
+        cached = self._get_cached_user(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.client.admin_get_user(
                 UserPoolId=self.user_pool_id,
@@ -273,7 +333,7 @@ class CognitoClient:
             # Convert attributes list to dict
             attributes = {attr['Name']: attr['Value'] for attr in response['UserAttributes']}
             
-            return {
+            user = {
                 'username': response['Username'],
                 'user_status': response['UserStatus'],
                 'enabled': response['Enabled'],
@@ -281,6 +341,8 @@ class CognitoClient:
                 'user_create_date': response['UserCreateDate'],
                 'user_last_modified_date': response['UserLastModifiedDate']
             }
+            self._cache_user(cache_key, user)
+            return user
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'UserNotFoundException':
@@ -288,6 +350,36 @@ class CognitoClient:
             logger.error(f"Admin get user failed: {e}")
             raise
     
+    def batch_get_users(self, emails: Iterable[str], max_workers: int = 10) -> Dict[str, Dict]:
+        """
+        Get several users by email (admin operation).
+        
+        Cached users are served locally; the rest are fetched concurrently.
+        
+        Args:
+            emails: User email addresses
+            max_workers: Maximum concurrent Cognito requests
+            
+        Returns:
+            Dict mapping email to user information (missing users omitted)
+        """
+        users: Dict[str, Dict] = {}
+        missing = []
+        for email in dict.fromkeys(emails):
+            cached = self._get_cached_user(f'email:{email}')
+            if cached is not None:
+                users[email] = cached
+            else:
+                missing.append(email)
+        
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+                for email, user in zip(missing, pool.map(self.admin_get_user, missing)):
+                    if user is not None:
+                        users[email] = user
+        
+        return users
+    
     def change_password(self, access_token: str, previous_password: str, proposed_password: str) -> bool:
         """
         Change user password.
@@ -1,38 +1,227 @@
 import logging
-from typing import Any, Dict, List, Optional
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-import boto3
+from boto3.dynamodb.conditions import ConditionBase, Key
 from botocore.exceptions import ClientError
 
+from .session import get_resource
+
 logger = logging.getLogger(__name__)
 
+# Bulk writes above this size are split into shards written concurrently
+BATCH_WRITE_SHARD_SIZE = 1000
+BATCH_WRITE_MAX_WORKERS = 8
+
+# BatchGetItem accepts at most 100 keys per request; unprocessed keys are
+# retried with jittered exponential backoff
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 5
+BATCH_GET_BASE_DELAY_SECONDS = 0.05
+
+# TransactWriteItems accepts at most 100 actions per request
+TRANSACT_WRITE_MAX_ITEMS = 100
+
+# Items requested per Query page (DynamoDB also caps each page at 1 MB)
+QUERY_PAGE_SIZE = 500
+
+
+@lru_cache(maxsize=256)
+def _build_update_expr(keys: Tuple[str, ...]) -> Tuple[str, Dict[str, str]]:
+    """Build the SET expression and attribute names for a set of update keys"""
+    expression = "SET " + ", ".join(f"#{k} = :{k}" for k in keys)
+    return expression, {f"#{k}": k for k in keys}
+
 
 class DynamoDBClient:
     """DynamoDB client wrapper for Oratio platform"""
 
     def __init__(self, region_name: str = "us-east-1"):
-        self.dynamodb = boto3.resource("dynamodb", region_name=region_name)
+        self.dynamodb = get_resource("dynamodb", region_name)
         self.region_name = region_name
+        self._tables: Dict[str, Any] = {}
+
+    def _table(self, table_name: str) -> Any:
+        """Get a cached Table handle by name"""
+        table = self._tables.get(table_name)
+        if table is None:
+            table = self._tables[table_name] = self.dynamodb.Table(table_name)
+        return table
 
-    def put_item(self, table_name: str, item: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _is_condition_failure(error: ClientError) -> bool:
+        """Whether a write was rejected by its ConditionExpression"""
+        return error.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+
+    def put_item(
+        self,
+        table_name: str,
+        item: Dict[str, Any],
+        condition_expression: Optional[Union[ConditionBase, str]] = None,
+    ) -> bool:
         """
         Put an item into DynamoDB table
 
         Args:
             table_name: Name of the DynamoDB table
             item: Item to put
+            condition_expression: Optional condition the write must satisfy,
+                e.g. Attr("agentId").not_exists() to refuse overwrites
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if successful, False otherwise (including a failed condition)
         """
         try:
-            table = self.dynamodb.Table(table_name)
-            table.put_item(Item=item)
+            table = self._table(table_name)
+            kwargs: Dict[str, Any] = {"Item": item, "ReturnValues": "NONE"}
+            if condition_expression is not None:
+                kwargs["ConditionExpression"] = condition_expression
+            table.put_item(**kwargs)
             logger.info(f"Successfully put item into {table_name}")
             return True
 
         except ClientError as e:
-            logger.error(f"Failed to put item into {table_name}: {e}")
+            if self._is_condition_failure(e):
+                logger.warning(f"Conditional put into {table_name} rejected")
+            else:
+                logger.error(f"Failed to put item into {table_name}: {e}")
+            return False
+
+    def _batch_write(
+        self,
+        table_name: str,
+        items: Sequence[Dict[str, Any]],
+        delete: bool,
+        overwrite_by_pkeys: Optional[List[str]],
+    ) -> None:
+        """Write one shard of puts or deletes through a batch writer"""
+        table = self._table(table_name)
+        with table.batch_writer(overwrite_by_pkeys=overwrite_by_pkeys) as batch:
+            for item in items:
+                if delete:
+                    batch.delete_item(Key=item)
+                else:
+                    batch.put_item(Item=item)
+
+    def _batch_write_sharded(
+        self,
+        table_name: str,
+        items: Sequence[Dict[str, Any]],
+        delete: bool,
+        overwrite_by_pkeys: Optional[List[str]],
+    ) -> None:
+        """Batch write, splitting large inputs into concurrently written shards"""
+        if len(items) <= BATCH_WRITE_SHARD_SIZE:
+            self._batch_write(table_name, items, delete, overwrite_by_pkeys)
+            return
+
+        shards = [
+            items[i : i + BATCH_WRITE_SHARD_SIZE]
+            for i in range(0, len(items), BATCH_WRITE_SHARD_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=min(BATCH_WRITE_MAX_WORKERS, len(shards))) as executor:
+            futures = [
+                executor.submit(self._batch_write, table_name, shard, delete, overwrite_by_pkeys)
+                for shard in shards
+            ]
+            for future in futures:
+                future.result()
+
+    def put_items(
+        self,
+        table_name: str,
+        items: Sequence[Dict[str, Any]],
+        overwrite_by_pkeys: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        Put multiple items into DynamoDB table using batched writes
+
+        Args:
+            table_name: Name of the DynamoDB table
+            items: Items to put
+            overwrite_by_pkeys: Primary key names used to de-duplicate items
+                within a batch (last one wins)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self._batch_write_sharded(table_name, list(items), False, overwrite_by_pkeys)
+            logger.info(f"Successfully put {len(items)} items into {table_name}")
+            return True
+
+        except ClientError as e:
+            logger.error(f"Failed to batch put items into {table_name}: {e}")
+            return False
+
+    def delete_items(
+        self, table_name: str, keys: Sequence[Dict[str, Any]]
+    ) -> bool:
+        """
+        Delete multiple items from DynamoDB table using batched writes
+
+        Args:
+            table_name: Name of the DynamoDB table
+            keys: Primary keys of the items to delete
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self._batch_write_sharded(table_name, list(keys), True, None)
+            logger.info(f"Successfully deleted {len(keys)} items from {table_name}")
+            return True
+
+        except ClientError as e:
+            logger.error(f"Failed to batch delete items from {table_name}: {e}")
+            return False
+
+    def transact_put_items(
+        self, puts: Sequence[Tuple[str, Dict[str, Any], Optional[str]]]
+    ) -> bool:
+        """
+        Put items into one or more tables in a single all-or-nothing transaction
+
+        Args:
+            puts: (table_name, item, unique_attribute) tuples. When
+                unique_attribute is set, the whole transaction is rejected if
+                an item with the same key already exists in that table.
+
+        Returns:
+            bool: True if every item was written, False otherwise (nothing is written)
+        """
+        if len(puts) > TRANSACT_WRITE_MAX_ITEMS:
+            raise ValueError(
+                f"A transaction holds at most {TRANSACT_WRITE_MAX_ITEMS} items, got {len(puts)}"
+            )
+
+        transact_items = []
+        for table_name, item, unique_attribute in puts:
+            put: Dict[str, Any] = {"TableName": table_name, "Item": item}
+            # Plain-string condition: the resource client hoists the names of
+            # a ConditionBase to the top level, which TransactWriteItems rejects
+            if unique_attribute:
+                put["ConditionExpression"] = "attribute_not_exists(#unique)"
+                put["ExpressionAttributeNames"] = {"#unique": unique_attribute}
+            transact_items.append({"Put": put})
+
+        table_names = ", ".join(sorted({table_name for table_name, _, _ in puts}))
+        try:
+            self.dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+            logger.info(f"Successfully put {len(puts)} items into {table_names} in one transaction")
+            return True
+
+        except ClientError as e:
+            reasons = [
+                reason.get("Code") for reason in e.response.get("CancellationReasons", [])
+            ]
+            if "ConditionalCheckFailed" in reasons:
+                logger.warning(f"Transactional put into {table_names} rejected: item already exists")
+            else:
+                logger.error(f"Failed to put items into {table_names} in one transaction: {e}")
             return False
 
     def get_item(
@@ -49,7 +238,7 @@ class DynamoDBClient:
             Optional[Dict[str, Any]]: Item or None if not found
         """
         try:
-            table = self.dynamodb.Table(table_name)
+            table = self._table(table_name)
             response = table.get_item(Key=key)
             return response.get("Item")
 
@@ -57,57 +246,183 @@ class DynamoDBClient:
             logger.error(f"Failed to get item from {table_name}: {e}")
             return None
 
-    def query_by_partition_key(
-        self,
-        table_name: str,
-        partition_key_name: str,
-        partition_key_value: Any,
-        sort_key_condition: Optional[Dict] = None,
+    def batch_get_items(
+        self, table_name: str, keys: Sequence[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
-        Query items by partition key
+        Get multiple items from DynamoDB table using BatchGetItem
+
+        Keys are de-duplicated and requested 100 at a time. Missing items are
+        simply absent from the result, which is in no particular order.
 
         Args:
             table_name: Name of the DynamoDB table
-            partition_key_name: Name of the partition key
-            partition_key_value: Value of the partition key
-            sort_key_condition: Optional sort key condition
+            keys: Primary keys of the items
 
         Returns:
-            List[Dict[str, Any]]: List of items
+            List[Dict[str, Any]]: Items found (partial if a request failed)
         """
+        unique_keys = list({tuple(sorted(k.items())): k for k in keys}.values())
+        items: List[Dict[str, Any]] = []
+
         try:
-            table = self.dynamodb.Table(table_name)
-
-            # Build key condition expression
-            from boto3.dynamodb.conditions import Key
-
-            key_condition = Key(partition_key_name).eq(partition_key_value)
-
-            if sort_key_condition:
-                # Add sort key condition if provided
-                # Example: {'name': 'timestamp', 'operator': 'gt', 'value': 123456}
-                sort_key_name = sort_key_condition["name"]
-                operator = sort_key_condition["operator"]
-                value = sort_key_condition["value"]
-
-                if operator == "eq":
-                    key_condition = key_condition & Key(sort_key_name).eq(value)
-                elif operator == "gt":
-                    key_condition = key_condition & Key(sort_key_name).gt(value)
-                elif operator == "lt":
-                    key_condition = key_condition & Key(sort_key_name).lt(value)
-                elif operator == "between":
-                    key_condition = key_condition & Key(sort_key_name).between(
-                        value[0], value[1]
+            for start in range(0, len(unique_keys), BATCH_GET_MAX_KEYS):
+                request = {table_name: {"Keys": unique_keys[start : start + BATCH_GET_MAX_KEYS]}}
+                for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+                    response = self.dynamodb.batch_get_item(RequestItems=request)
+                    items.extend(response.get("Responses", {}).get(table_name, []))
+                    request = response.get("UnprocessedKeys") or {}
+                    if not request:
+                        break
+                    if attempt < BATCH_GET_MAX_RETRIES:
+                        time.sleep(
+                            random.uniform(0, BATCH_GET_BASE_DELAY_SECONDS * (2**attempt))
+                        )
+                else:
+                    unprocessed = len(request.get(table_name, {}).get("Keys", []))
+                    logger.error(
+                        f"Gave up on {unprocessed} unprocessed keys from {table_name}"
                     )
 
-            response = table.query(KeyConditionExpression=key_condition)
-            return response.get("Items", [])
+            return items
+
+        except ClientError as e:
+            logger.error(f"Failed to batch get items from {table_name}: {e}")
+            return items
+
+    def _paginate_query(
+        self,
+        table_name: str,
+        query_kwargs: Dict[str, Any],
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield items from every page of a Query
+
+        Args:
+            table_name: Name of the DynamoDB table
+            query_kwargs: Arguments for table.query
+            limit: Optional maximum number of items to yield
+            prefetch: Fetch the next page in a background thread while the
+                caller consumes the current one
+
+        Yields:
+            Dict[str, Any]: Items in query order
+        """
+        table = self._table(table_name)
+        page_size = QUERY_PAGE_SIZE if limit is None else min(QUERY_PAGE_SIZE, limit)
+
+        def fetch_page(start_key: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            kwargs = {**query_kwargs, "Limit": page_size}
+            if start_key:
+                kwargs["ExclusiveStartKey"] = start_key
+            return table.query(**kwargs)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        remaining = limit
+        try:
+            response = fetch_page(None)
+            while True:
+                start_key = response.get("LastEvaluatedKey")
+                next_page = executor.submit(fetch_page, start_key) if executor and start_key else None
+
+                for item in response.get("Items", []):
+                    if remaining is not None:
+                        if remaining <= 0:
+                            return
+                        remaining -= 1
+                    yield item
+
+                if not start_key or (remaining is not None and remaining <= 0):
+                    return
+                response = next_page.result() if next_page else fetch_page(start_key)
 
         except ClientError as e:
             logger.error(f"Failed to query {table_name}: {e}")
-            return []
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _query_options(
+        projection: Optional[List[str]] = None,
+        filter_expression: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build ProjectionExpression / FilterExpression query arguments
+
+        Projected attribute names are always aliased (#p0, #p1, ...) so
+        reserved words such as "status" or "name" can be projected.
+        """
+        options: Dict[str, Any] = {}
+        if projection:
+            options["ProjectionExpression"] = ", ".join(f"#p{i}" for i in range(len(projection)))
+            options["ExpressionAttributeNames"] = {
+                f"#p{i}": name for i, name in enumerate(projection)
+            }
+        if filter_expression is not None:
+            options["FilterExpression"] = filter_expression
+        return options
+
+    def query_by_partition_key(
+        self,
+        table_name: str,
+        partition_key_name: str,
+        partition_key_value: Any,
+        sort_key_condition: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+        projection: Optional[List[str]] = None,
+        filter_expression: Optional[Any] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Query items by partition key, following pagination lazily
+
+        Args:
+            table_name: Name of the DynamoDB table
+            partition_key_name: Name of the partition key
+            partition_key_value: Value of the partition key
+            sort_key_condition: Optional sort key condition
+            limit: Optional maximum number of items to return
+            prefetch: Fetch the next page while the current one is consumed
+            projection: Optional attribute names to return (default: all)
+            filter_expression: Optional boto3 condition (e.g. Attr("status").eq("active"))
+                applied server-side after the key condition
+
+        Yields:
+            Dict[str, Any]: Matching items (stops early on error)
+        """
+        # Build key condition expression
+        key_condition = Key(partition_key_name).eq(partition_key_value)
+
+        if sort_key_condition:
+            # Add sort key condition if provided
+            # Example: {'name': 'timestamp', 'operator': 'gt', 'value': 123456}
+            sort_key_name = sort_key_condition["name"]
+            operator = sort_key_condition["operator"]
+            value = sort_key_condition["value"]
+
+            if operator == "eq":
+                key_condition = key_condition & Key(sort_key_name).eq(value)
+            elif operator == "gt":
+                key_condition = key_condition & Key(sort_key_name).gt(value)
+            elif operator == "lt":
+                key_condition = key_condition & Key(sort_key_name).lt(value)
+            elif operator == "between":
+                key_condition = key_condition & Key(sort_key_name).between(
+                    value[0], value[1]
+                )
+
+        yield from self._paginate_query(
+            table_name,
+            {
+                "KeyConditionExpression": key_condition,
+                **self._query_options(projection, filter_expression),
+            },
+            limit=limit,
+            prefetch=prefetch,
+        )
 
     def query_by_gsi(
         self,
@@ -116,9 +431,13 @@ class DynamoDBClient:
         partition_key_name: str,
         partition_key_value: Any,
         sort_key_condition: Optional[Dict] = None,
-    ) -> List[Dict[str, Any]]:
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+        projection: Optional[List[str]] = None,
+        filter_expression: Optional[Any] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Query items using a Global Secondary Index
+        Query items using a Global Secondary Index, following pagination lazily
 
         Args:
             table_name: Name of the DynamoDB table
@@ -126,43 +445,46 @@ class DynamoDBClient:
             partition_key_name: Name of the partition key in GSI
             partition_key_value: Value of the partition key
             sort_key_condition: Optional sort key condition
-
-        Returns:
-            List[Dict[str, Any]]: List of items
+            limit: Optional maximum number of items to return
+            prefetch: Fetch the next page while the current one is consumed
+            projection: Optional attribute names to return (default: all)
+            filter_expression: Optional boto3 condition (e.g. Attr("status").eq("active"))
+                applied server-side after the key condition
+
+        Yields:
+            Dict[str, Any]: Matching items (stops early on error)
         """
-        try:
-            table = self.dynamodb.Table(table_name)
-
-            from boto3.dynamodb.conditions import Key
-
-            key_condition = Key(partition_key_name).eq(partition_key_value)
-
-            if sort_key_condition:
-                sort_key_name = sort_key_condition["name"]
-                operator = sort_key_condition["operator"]
-                value = sort_key_condition["value"]
-
-                if operator == "eq":
-                    key_condition = key_condition & Key(sort_key_name).eq(value)
-                elif operator == "gt":
-                    key_condition = key_condition & Key(sort_key_name).gt(value)
-                elif operator == "lt":
-                    key_condition = key_condition & Key(sort_key_name).lt(value)
-
-            response = table.query(
-                IndexName=index_name, KeyConditionExpression=key_condition
-            )
-            return response.get("Items", [])
-
-        except ClientError as e:
-            logger.error(f"Failed to query {table_name} using GSI {index_name}: {e}")
-            return []
+        key_condition = Key(partition_key_name).eq(partition_key_value)
+
+        if sort_key_condition:
+            sort_key_name = sort_key_condition["name"]
+            operator = sort_key_condition["operator"]
+            value = sort_key_condition["value"]
+
+            if operator == "eq":
+                key_condition = key_condition & Key(sort_key_name).eq(value)
+            elif operator == "gt":
+                key_condition = key_condition & Key(sort_key_name).gt(value)
+            elif operator == "lt":
+                key_condition = key_condition & Key(sort_key_name).lt(value)
+
+        yield from self._paginate_query(
+            table_name,
+            {
+                "IndexName": index_name,
+                "KeyConditionExpression": key_condition,
+                **self._query_options(projection, filter_expression),
+            },
+            limit=limit,
+            prefetch=prefetch,
+        )
 
     def update_item(
         self,
         table_name: str,
         key: Dict[str, Any],
         updates: Dict[str, Any],
+        condition_expression: Optional[Union[ConditionBase, str]] = None,
     ) -> bool:
         """
         Update an item in DynamoDB table
@@ -171,32 +493,41 @@ class DynamoDBClient:
             table_name: Name of the DynamoDB table
             key: Primary key of the item
             updates: Dictionary of attributes to update
+            condition_expression: Optional condition the write must satisfy,
+                e.g. Attr("userId").eq(user_id) for an ownership check
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if successful, False otherwise (including a failed condition)
         """
         try:
-            table = self.dynamodb.Table(table_name)
+            table = self._table(table_name)
 
-            # Build update expression
-            update_expression = "SET " + ", ".join(
-                [f"#{k} = :{k}" for k in updates.keys()]
+            # Expression skeleton is shared by every update with the same keys
+            update_expression, expression_attribute_names = _build_update_expr(
+                tuple(sorted(updates))
             )
-            expression_attribute_names = {f"#{k}": k for k in updates.keys()}
             expression_attribute_values = {f":{k}": v for k, v in updates.items()}
 
-            table.update_item(
-                Key=key,
-                UpdateExpression=update_expression,
-                ExpressionAttributeNames=expression_attribute_names,
-                ExpressionAttributeValues=expression_attribute_values,
-            )
+            kwargs: Dict[str, Any] = {
+                "Key": key,
+                "UpdateExpression": update_expression,
+                # Copy so the cached mapping is never mutated downstream
+                "ExpressionAttributeNames": dict(expression_attribute_names),
+                "ExpressionAttributeValues": expression_attribute_values,
+                "ReturnValues": "NONE",
+            }
+            if condition_expression is not None:
+                kwargs["ConditionExpression"] = condition_expression
+            table.update_item(**kwargs)
 
             logger.info(f"Successfully updated item in {table_name}")
             return True
 
         except ClientError as e:
-            logger.error(f"Failed to update item in {table_name}: {e}")
+            if self._is_condition_failure(e):
+                logger.warning(f"Conditional update in {table_name} rejected")
+            else:
+                logger.error(f"Failed to update item in {table_name}: {e}")
             return False
 
     def delete_item(self, table_name: str, key: Dict[str, Any]) -> bool:
@@ -211,7 +542,7 @@ class DynamoDBClient:
             bool: True if successful, False otherwise
         """
         try:
-            table = self.dynamodb.Table(table_name)
+            table = self._table(table_name)
             table.delete_item(Key=key)
             logger.info(f"Successfully deleted item from {table_name}")
             return True
@@ -1,18 +1,78 @@
 import logging
-from typing import BinaryIO, Dict, List, Optional
-
-import boto3
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import BinaryIO, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
+from .session import MAX_POOL_CONNECTIONS, get_client
+
 logger = logging.getLogger(__name__)
 
+# Managed transfer settings: larger multipart parts and read chunks than the
+# boto3 defaults (8 MB parts, 256 KB reads) for KB documents and recordings
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
+# Seekable files below this size are sent with a single put_object call
+# instead of going through the transfer manager's worker threads
+SINGLE_PUT_MAX_BYTES = TRANSFER_CONFIG.multipart_threshold
+
+# How long a prefix listing from prefetch_keys answers file_exists_cached
+KEY_LISTING_TTL_SECONDS = 30.0
+
+# Presigned URLs are reused within a window of at most this long, and at most
+# PRESIGNED_URL_REUSE_FRACTION of their validity, so a reused URL always has
+# most of its requested lifetime left
+PRESIGNED_URL_REUSE_SECONDS = 60
+PRESIGNED_URL_REUSE_FRACTION = 0.1
+
+# Concurrent uploads per upload_folder call (bounded by the connection pool)
+UPLOAD_FOLDER_MAX_WORKERS = min(16, MAX_POOL_CONNECTIONS)
+
+
+@lru_cache(maxsize=1024)
+def _object_tags(user_id: str, agent_id: str, resource_type: str) -> str:
+    """URL-encoded S3 object tag set for an upload"""
+    return urlencode(
+        {"userId": user_id, "agentId": agent_id, "resourceType": resource_type}
+    )
+
+
+def _remaining_size(file_obj: BinaryIO) -> Optional[int]:
+    """Bytes left to read from a seekable file object, or None if unknown"""
+    try:
+        if not file_obj.seekable():
+            return None
+        position = file_obj.tell()
+        size = file_obj.seek(0, 2) - position
+        file_obj.seek(position)
+        return size
+    except (AttributeError, OSError):
+        return None
+
 
 class S3Client:
     """S3 client wrapper with tagging support for Oratio platform"""
 
+    # (bucket, prefix) -> (expires_at, keys); shared across instances
+    _key_listings: Dict[Tuple[str, str], Tuple[float, FrozenSet[str]]] = {}
+    _key_listings_lock = threading.Lock()
+
     def __init__(self, region_name: str = "us-east-1"):
-        self.s3_client = boto3.client("s3", region_name=region_name)
+        self.s3_client = get_client("s3", region_name)
         self.region_name = region_name
+        self._presign_get_object = lru_cache(maxsize=4096)(self._presign_get_object_uncached)
 
     def upload_file(
         self,
@@ -47,15 +107,25 @@ class S3Client:
             
             # Only add tags if requested (not for Bedrock KB files to avoid metadata size limits)
             if add_tags:
-                tags = f"userId={user_id}&agentId={agent_id}&resourceType={resource_type}"
-                extra_args["Tagging"] = tags
+                extra_args["Tagging"] = _object_tags(user_id, agent_id, resource_type)
                 
             if content_type:
                 extra_args["ContentType"] = content_type
 
-            # Upload file
-            self.s3_client.upload_fileobj(file_obj, bucket, key, ExtraArgs=extra_args if extra_args else None)
-
+            size = _remaining_size(file_obj)
+            if size is not None and size < SINGLE_PUT_MAX_BYTES:
+                # Small file: one request, no transfer manager thread hop
+                self.s3_client.put_object(Bucket=bucket, Key=key, Body=file_obj, **extra_args)
+            else:
+                self.s3_client.upload_fileobj(
+                    file_obj,
+                    bucket,
+                    key,
+                    ExtraArgs=extra_args if extra_args else None,
+                    Config=TRANSFER_CONFIG,
+                )
+
+            self._forget_key_listing(bucket, key)
             logger.info(f"Successfully uploaded file to s3://{bucket}/{key}")
             return True
 
@@ -73,7 +143,7 @@ class S3Client:
         resource_type: str = "knowledge-base",
     ) -> Dict[str, bool]:
         """
-        Upload multiple files to S3 with proper tagging
+        Upload multiple files to S3 concurrently with proper tagging
 
         Args:
             files: List of (file_obj, relative_path) tuples
@@ -87,18 +157,29 @@ class S3Client:
             Dict[str, bool]: Mapping of file paths to upload success status
         """
         results = {}
-
-        for file_obj, relative_path in files:
-            full_key = f"{base_key}/{relative_path}"
-            success = self.upload_file(
-                file_obj=file_obj,
-                bucket=bucket,
-                key=full_key,
-                user_id=user_id,
-                agent_id=agent_id,
-                resource_type=resource_type,
-            )
-            results[relative_path] = success
+        if not files:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(UPLOAD_FOLDER_MAX_WORKERS, len(files))) as executor:
+            futures = {
+                executor.submit(
+                    self.upload_file,
+                    file_obj=file_obj,
+                    bucket=bucket,
+                    key=f"{base_key}/{relative_path}",
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    resource_type=resource_type,
+                ): relative_path
+                for file_obj, relative_path in files
+            }
+            for future in as_completed(futures):
+                relative_path = futures[future]
+                try:
+                    results[relative_path] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to upload {relative_path} to S3: {e}")
+                    results[relative_path] = False
 
         return results
 
@@ -145,28 +226,85 @@ class S3Client:
             logger.error(f"Failed to check file existence: {e}")
             return False
 
-    def list_files(self, bucket: str, prefix: str) -> List[str]:
+    @staticmethod
+    def _key_prefix(key: str) -> str:
+        """Folder prefix of a key ("a/b/c.txt" -> "a/b/")"""
+        folder = posixpath.dirname(key)
+        return f"{folder}/" if folder else ""
+
+    def _forget_key_listing(self, bucket: str, key: str) -> None:
+        """Drop the cached listing that would contain key"""
+        with self._key_listings_lock:
+            self._key_listings.pop((bucket, self._key_prefix(key)), None)
+
+    def prefetch_keys(self, bucket: str, prefix: str) -> FrozenSet[str]:
         """
-        List files in S3 with a given prefix
+        List and cache all keys under a prefix for KEY_LISTING_TTL_SECONDS
 
         Args:
             bucket: S3 bucket name
             prefix: S3 key prefix
 
         Returns:
-            List[str]: List of S3 keys
+            FrozenSet[str]: Keys under the prefix
         """
-        try:
-            response = self.s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
+        cache_key = (bucket, prefix)
+        with self._key_listings_lock:
+            entry = self._key_listings.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        keys = frozenset(self.list_files(bucket, prefix))
+        with self._key_listings_lock:
+            self._key_listings[cache_key] = (time.monotonic() + KEY_LISTING_TTL_SECONDS, keys)
+        return keys
+
+    def file_exists_cached(self, bucket: str, key: str) -> bool:
+        """
+        Check if a file exists using one cached listing of its folder
+
+        Checking many files in the same folder costs one listing instead of
+        one HEAD request each. Keys missing from the listing are confirmed
+        with head_object, so recently uploaded files are still found.
+
+        Args:
+            bucket: S3 bucket name
+            key: S3 object key
+
+        Returns:
+            bool: True if file exists, False otherwise
+        """
+        if key in self.prefetch_keys(bucket, self._key_prefix(key)):
+            return True
+        return self.file_exists(bucket, key)
+
+    def list_files(
+        self, bucket: str, prefix: str, max_keys: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        List files in S3 with a given prefix, following pagination lazily
 
-            if "Contents" not in response:
-                return []
+        Args:
+            bucket: S3 bucket name
+            prefix: S3 key prefix
+            max_keys: Optional maximum number of keys to return
 
-            return [obj["Key"] for obj in response["Contents"]]
+        Yields:
+            str: S3 keys (stops early on error)
+        """
+        try:
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            pages = paginator.paginate(
+                Bucket=bucket,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": 1000, "MaxItems": max_keys},
+            )
+            for page in pages:
+                for obj in page.get("Contents", []):
+                    yield obj["Key"]
 
         except ClientError as e:
             logger.error(f"Failed to list files from S3: {e}")
-            return []
 
     def generate_presigned_url(
         self, bucket: str, key: str, expiration: int = 3600
@@ -183,11 +321,39 @@ class S3Client:
             Optional[str]: Presigned URL or None if failed
         """
         try:
-            url = self.s3_client.generate_presigned_url(
-                "get_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=expiration
+            reuse_seconds = min(
+                PRESIGNED_URL_REUSE_SECONDS, int(expiration * PRESIGNED_URL_REUSE_FRACTION)
             )
-            return url
+            if reuse_seconds < 1:
+                # Too short-lived to share: sign a fresh URL every time
+                return self._presign_get_object_uncached(bucket, key, expiration, 0)
+            window = int(time.time()) // reuse_seconds
+            return self._presign_get_object(bucket, key, expiration, window)
 
         except ClientError as e:
             logger.error(f"Failed to generate presigned URL: {e}")
             return None
+
+    def generate_presigned_urls(
+        self, bucket: str, keys: List[str], expiration: int = 3600
+    ) -> Dict[str, Optional[str]]:
+        """
+        Generate presigned download URLs for several files
+
+        Args:
+            bucket: S3 bucket name
+            keys: S3 object keys
+            expiration: URL expiration time in seconds (default: 1 hour)
+
+        Returns:
+            Dict[str, Optional[str]]: Mapping of key to presigned URL (None if failed)
+        """
+        return {key: self.generate_presigned_url(bucket, key, expiration) for key in keys}
+
+    def _presign_get_object_uncached(
+        self, bucket: str, key: str, expiration: int, window: int
+    ) -> str:
+        """Sign a get_object URL (window only partitions the cache)"""
+        return self.s3_client.generate_presigned_url(
+            "get_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=expiration
+        )
@@ -0,0 +1,91 @@
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import Optional
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+# One boto3 session per process: credential resolution and service model
+# loading happen once instead of on every client wrapper instantiation.
+_SESSION = boto3.session.Session()
+# boto3 sessions are not thread-safe; guards client creation and warm-up
+_SESSION_LOCK = threading.Lock()
+
+# Shared client config. The pool is sized for concurrent FastAPI requests
+# plus worker threads (asyncio.to_thread, parallel S3 uploads). Adaptive
+# retries rate-limit client-side under throttling instead of retry-storming.
+# The standard AWS_RETRY_MODE / AWS_MAX_ATTEMPTS variables override the
+# defaults (an explicit Config would otherwise shadow them). TCP keepalive
+# stops idle pooled connections from being dropped between calls, which
+# would force a fresh TCP+TLS handshake.
+#
+# Accept-Encoding: gzip is deliberately not requested for DynamoDB: urllib3
+# decompresses the body before botocore verifies x-amz-crc32, which DynamoDB
+# computes over the compressed payload, so every gzipped response would
+# fail the checksum and be retried.
+MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "128"))
+
+_CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    retries={
+        "mode": os.getenv("AWS_RETRY_MODE", "adaptive"),
+        "max_attempts": int(os.getenv("AWS_MAX_ATTEMPTS", "10")),
+    },
+)
+
+
+def _warm_credentials() -> None:
+    """Resolve credentials on the shared session ahead of the first client call"""
+    try:
+        with _SESSION_LOCK:
+            credentials = _SESSION.get_credentials()
+        if credentials is not None:
+            credentials.get_frozen_credentials()
+    except Exception as e:
+        logger.warning(f"Credential warm-up failed: {e}")
+
+
+# Credential resolution (env, IMDS, STS, ...) overlaps with app startup
+threading.Thread(target=_warm_credentials, name="aws-credential-warmup", daemon=True).start()
+
+
+@lru_cache(maxsize=None)
+def get_client(service_name: str, region_name: Optional[str] = None):
+    """
+    Get a shared boto3 client for a service and region
+
+    boto3 clients are thread-safe, so the cached client is shared by every
+    wrapper instance. Callers must not mutate it (e.g. register events).
+
+    Args:
+        service_name: AWS service name (e.g. "bedrock-agent")
+        region_name: AWS region (None uses the session's default region)
+
+    Returns:
+        boto3 client for the service
+    """
+    logger.info(f"Creating boto3 client: {service_name} ({region_name})")
+    with _SESSION_LOCK:
+        return _SESSION.client(service_name, region_name=region_name, config=_CLIENT_CONFIG)
+
+
+@lru_cache(maxsize=None)
+def get_resource(service_name: str, region_name: Optional[str] = None):
+    """
+    Get a shared boto3 resource for a service and region
+
+    Args:
+        service_name: AWS service name (e.g. "dynamodb")
+        region_name: AWS region (None uses the session's default region)
+
+    Returns:
+        boto3 service resource
+    """
+    logger.info(f"Creating boto3 resource: {service_name} ({region_name})")
+    with _SESSION_LOCK:
+        return _SESSION.resource(service_name, region_name=region_name, config=_CLIENT_CONFIG)
@@ -1,10 +1,12 @@
-import json
+import asyncio
 import logging
 from typing import Any, Dict, Optional
 
-import boto3
+import orjson
 from botocore.exceptions import ClientError
 
+from .session import get_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,7 +14,7 @@ class StepFunctionsClient:
     """Step Functions client wrapper for Oratio platform"""
 
     def __init__(self, region_name: str = "us-east-1"):
-        self.sfn_client = boto3.client("stepfunctions", region_name=region_name)
+        self.sfn_client = get_client("stepfunctions", region_name)
         self.region_name = region_name
 
     def start_execution(
@@ -36,7 +38,8 @@ class StepFunctionsClient:
             response = self.sfn_client.start_execution(
                 stateMachineArn=state_machine_arn,
                 name=execution_name,
-                input=json.dumps(input_data),
+                # Step Functions requires a str input
+                input=orjson.dumps(input_data).decode("utf-8"),
             )
 
             execution_arn = response["executionArn"]
@@ -73,8 +76,8 @@ class StepFunctionsClient:
                 "stopDate": (
                     response["stopDate"].isoformat() if "stopDate" in response else None
                 ),
-                "input": json.loads(response["input"]),
-                "output": json.loads(response["output"]) if "output" in response else None,
+                "input": orjson.loads(response["input"]),
+                "output": orjson.loads(response["output"]) if "output" in response else None,
             }
 
         except ClientError as e:
@@ -103,3 +106,21 @@ class StepFunctionsClient:
         except ClientError as e:
             logger.error(f"Failed to stop execution: {e}")
             return False
+
+    # Async variants: run the blocking API call in the default thread pool so
+    # async routes don't stall the event loop for a full AWS round trip
+
+    async def a_start_execution(
+        self,
+        state_machine_arn: str,
+        execution_name: str,
+        input_data: Dict[str, Any],
+    ) -> Optional[Dict]:
+        """Async variant of start_execution"""
+        return await asyncio.to_thread(
+            self.start_execution, state_machine_arn, execution_name, input_data
+        )
+
+    async def a_describe_execution(self, execution_arn: str) -> Optional[Dict]:
+        """Async variant of describe_execution"""
+        return await asyncio.to_thread(self.describe_execution, execution_arn)
@@ -62,11 +62,16 @@ class Settings(BaseSettings):
         default="", validation_alias="AGENTCREATOR_AGENT_ALIAS_ID"
     )
 
+    # Frozen: settings are read once at import and never mutated at runtime
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
+        frozen=True,
+        extra="ignore",
     )
 
 
+# Process-wide singleton; import this rather than instantiating Settings(),
+# which re-reads the environment and .env file
 settings = Settings()
@@ -2,6 +2,7 @@
 
 from typing import Annotated, Optional
 from fastapi import Depends, HTTPException, status
+from fastapi.requests import HTTPConnection
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import logging
 
@@ -17,31 +18,33 @@ from aws.dynamodb_client import DynamoDBClient
 from aws.s3_client import S3Client
 from aws.stepfunctions_client import StepFunctionsClient
 from models.user import UserProfile
-from config import settings
 
 logger = logging.getLogger(__name__)
 
-# HTTP Bearer token scheme
+# HTTP Bearer token schemes (required and optional authentication)
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 # Dependency injection functions
-def get_cognito_client() -> CognitoClient:
+#
+# Clients and services are built once per worker by the app lifespan (see
+# main.py) and stored on app.state; these getters only look them up. They
+# take an HTTPConnection so they resolve for WebSocket routes as well.
+def get_cognito_client(connection: HTTPConnection) -> CognitoClient:
     """
-    Get CognitoClient instance.
+    Get the shared CognitoClient instance.
     Can be overridden for testing.
     """
-    return CognitoClient()
+    return connection.app.state.cognito_client
 
 
-def get_auth_service(
-    cognito_client: Annotated[CognitoClient, Depends(get_cognito_client)]
-) -> AuthService:
+def get_auth_service(connection: HTTPConnection) -> AuthService:
     """
-    Get AuthService instance with injected dependencies.
+    Get the shared AuthService instance.
     Can be overridden for testing.
     """
-    return AuthService(cognito_client=cognito_client)
+    return connection.app.state.auth_service
 
 
 async def get_current_user(
@@ -103,7 +106,7 @@ async def get_current_user_id(
 async def get_current_user_optional(
     credentials: Annotated[
         Optional[HTTPAuthorizationCredentials],
-        Depends(HTTPBearer(auto_error=False))
+        Depends(optional_security)
     ],
     auth_service: Annotated[AuthService, Depends(get_auth_service)]
 ) -> Optional[UserProfile]:
@@ -153,31 +156,41 @@ def get_user_id_from_token(token: str) -> str:
 
 
 # Service dependencies
-def get_dynamodb_client() -> DynamoDBClient:
-    """Get DynamoDBClient instance"""
-    return DynamoDBClient()
-
-
-def get_agent_service(
-    dynamodb_client: Annotated[DynamoDBClient, Depends(get_dynamodb_client)]
-) -> AgentService:
-    """Get AgentService instance"""
-    return AgentService(
-        dynamodb_client=dynamodb_client,
-        table_name=settings.AGENTS_TABLE
-    )
-
-
-def get_api_key_service(
-    dynamodb_client: Annotated[DynamoDBClient, Depends(get_dynamodb_client)]
-) -> APIKeyService:
-    """Get APIKeyService instance"""
-    return APIKeyService(
-        dynamodb_client=dynamodb_client,
-        table_name=settings.API_KEYS_TABLE
-    )
-
-
-def get_agent_invocation_service() -> AgentInvocationService:
-    """Get AgentInvocationService instance"""
-    return AgentInvocationService(region=settings.BEDROCK_REGION)
+def get_dynamodb_client(connection: HTTPConnection) -> DynamoDBClient:
+    """Get the shared DynamoDBClient instance"""
+    return connection.app.state.dynamodb_client
+
+
+def get_s3_client(connection: HTTPConnection) -> S3Client:
+    """Get the shared S3Client instance"""
+    return connection.app.state.s3_client
+
+
+def get_stepfunctions_client(connection: HTTPConnection) -> StepFunctionsClient:
+    """Get the shared StepFunctionsClient instance"""
+    return connection.app.state.sfn_client
+
+
+def get_agent_service(connection: HTTPConnection) -> AgentService:
+    """Get the shared AgentService instance"""
+    return connection.app.state.agent_service
+
+
+def get_knowledge_base_service(connection: HTTPConnection) -> KnowledgeBaseService:
+    """Get the shared KnowledgeBaseService instance"""
+    return connection.app.state.kb_service
+
+
+def get_s3_service(connection: HTTPConnection) -> S3Service:
+    """Get the shared S3Service instance"""
+    return connection.app.state.s3_service
+
+
+def get_api_key_service(connection: HTTPConnection) -> APIKeyService:
+    """Get the shared APIKeyService instance"""
+    return connection.app.state.api_key_service
+
+
+def get_agent_invocation_service(connection: HTTPConnection) -> AgentInvocationService:
+    """Get the shared AgentInvocationService instance"""
+    return connection.app.state.agent_invocation_service
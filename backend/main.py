@@ -1,13 +1,47 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
+from aws.dynamodb_client import DynamoDBClient
+from aws.s3_client import S3Client
+from aws.stepfunctions_client import StepFunctionsClient
+from services.agent_invocation_service import AgentInvocationService
+from services.agent_service import AgentService
+from services.api_key_service import APIKeyService
+from services.auth_service import auth_service
+from services.knowledge_base_service import KnowledgeBaseService
+from services.s3_service import S3Service
 from routers import agents, auth, chat, api_keys, knowledge_bases
 from routers import voice_simple as voice  # Use simplified voice implementation
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build AWS clients and services once per worker for the dependencies"""
+    dynamodb_client = DynamoDBClient(region_name=settings.AWS_REGION)
+    s3_client = S3Client(region_name=settings.AWS_REGION)
+
+    app.state.dynamodb_client = dynamodb_client
+    app.state.s3_client = s3_client
+    app.state.sfn_client = StepFunctionsClient(region_name=settings.AWS_REGION)
+    app.state.auth_service = auth_service
+    app.state.cognito_client = auth_service.cognito_client
+    app.state.agent_service = AgentService(dynamodb_client, table_name=settings.AGENTS_TABLE)
+    app.state.kb_service = KnowledgeBaseService(
+        dynamodb_client, table_name=settings.KNOWLEDGE_BASES_TABLE
+    )
+    app.state.api_key_service = APIKeyService(dynamodb_client, table_name=settings.API_KEYS_TABLE)
+    app.state.s3_service = S3Service(s3_client, kb_bucket=settings.KB_BUCKET)
+    app.state.agent_invocation_service = AgentInvocationService(region=settings.BEDROCK_REGION)
+    yield
+
+
 app = FastAPI(
     title="Oratio API",
     description="AI-Architected Voice Agents for Modern Enterprises",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -1,46 +1,92 @@
 # Models package
-from .agent import (
-    Agent,
-    AgentCreate,
-    AgentResponse,
-    AgentStatus,
-    AgentType,
-    AgentUpdate,
-    VoicePersonality,
-)
-from .api_key import (
-    APIKey,
-    APIKeyCreate,
-    APIKeyPermission,
-    APIKeyResponse,
-    APIKeyStatus,
-    APIKeyValidation,
-)
-from .knowledge_base import (
-    KnowledgeBase,
-    KnowledgeBaseCreate,
-    KnowledgeBaseStatus,
-    KnowledgeBaseUpdate,
-)
-from .user import User
+#
+# Submodules are imported on first attribute access (PEP 562), so importing
+# one model module (e.g. models.agent) does not build every pydantic schema.
+import importlib
+
+_LAZY = {
+    "AGENT_STATUS_ACTIVE": "agent",
+    "AGENT_STATUS_CREATING": "agent",
+    "AGENT_STATUS_FAILED": "agent",
+    "AGENT_STATUS_PAUSED": "agent",
+    "Agent": "agent",
+    "AgentCreate": "agent",
+    "AgentFormFields": "agent",
+    "AgentResponse": "agent",
+    "AgentStatus": "agent",
+    "AgentType": "agent",
+    "AgentUpdate": "agent",
+    "VoicePersonality": "agent",
+    "validate_agent_create": "agent",
+    "API_KEY_PERMISSION_CHAT": "api_key",
+    "API_KEY_PERMISSION_VOICE": "api_key",
+    "API_KEY_STATUS_ACTIVE": "api_key",
+    "APIKey": "api_key",
+    "APIKeyCreate": "api_key",
+    "APIKeyPermission": "api_key",
+    "APIKeyResponse": "api_key",
+    "APIKeyStatus": "api_key",
+    "APIKeyValidation": "api_key",
+    "KnowledgeBase": "knowledge_base",
+    "KnowledgeBaseCreate": "knowledge_base",
+    "KnowledgeBaseStatus": "knowledge_base",
+    "KnowledgeBaseUpdate": "knowledge_base",
+    "TokenRefresh": "user",
+    "TokenResponse": "user",
+    "User": "user",
+    "UserBase": "user",
+    "UserConfirm": "user",
+    "UserCreate": "user",
+    "UserLogin": "user",
+    "UserProfile": "user",
+}
 
 __all__ = [
     "User",
+    "UserBase",
+    "UserCreate",
+    "UserLogin",
+    "UserConfirm",
+    "UserProfile",
+    "TokenResponse",
+    "TokenRefresh",
     "Agent",
     "AgentCreate",
+    "AgentFormFields",
     "AgentUpdate",
     "AgentResponse",
     "AgentStatus",
     "AgentType",
     "VoicePersonality",
+    "validate_agent_create",
+    "AGENT_STATUS_CREATING",
+    "AGENT_STATUS_ACTIVE",
+    "AGENT_STATUS_FAILED",
+    "AGENT_STATUS_PAUSED",
     "APIKey",
     "APIKeyCreate",
     "APIKeyPermission",
     "APIKeyResponse",
     "APIKeyStatus",
     "APIKeyValidation",
+    "API_KEY_PERMISSION_CHAT",
+    "API_KEY_PERMISSION_VOICE",
+    "API_KEY_STATUS_ACTIVE",
     "KnowledgeBase",
     "KnowledgeBaseCreate",
     "KnowledgeBaseUpdate",
     "KnowledgeBaseStatus",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
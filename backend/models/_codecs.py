@@ -0,0 +1,27 @@
+"""Prebuilt (de)serializers for model lists.
+
+Each TypeAdapter compiles its pydantic-core schema once at import, so list
+endpoints encode, and DynamoDB query results validate, with a single C call
+per request. MSGPACK_ENCODER serves
+clients that negotiate application/x-msgpack (None if msgspec is missing).
+"""
+
+from typing import List
+
+from pydantic import TypeAdapter
+
+from .agent import Agent, AgentResponse
+from .api_key import APIKey
+from .knowledge_base import KnowledgeBase
+
+try:
+    import msgspec
+
+    MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+except ImportError:  # pragma: no cover - JSON only
+    MSGPACK_ENCODER = None
+
+AGENT_LIST = TypeAdapter(List[Agent])
+AGENT_RESPONSE_LIST = TypeAdapter(List[AgentResponse])
+API_KEY_LIST = TypeAdapter(List[APIKey])
+KNOWLEDGE_BASE_LIST = TypeAdapter(List[KnowledgeBase])
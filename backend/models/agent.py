@@ -1,8 +1,18 @@
-from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional
+from functools import lru_cache
+from time import time as _time
+from typing import TYPE_CHECKING, Dict, Final, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, Json
+from pydantic.alias_generators import to_camel
+
+if TYPE_CHECKING:
+    from .knowledge_base import KnowledgeBase
+
+
+def _now_ts() -> int:
+    """Current Unix timestamp in whole seconds"""
+    return int(_time())
 
 
 class AgentStatus(str, Enum):
@@ -14,6 +24,14 @@ class AgentStatus(str, Enum):
     PAUSED = "paused"
 
 
+# Plain-string status values for hot comparisons against stored agents
+# (Agent keeps enum values as str via use_enum_values)
+AGENT_STATUS_CREATING: Final[str] = AgentStatus.CREATING.value
+AGENT_STATUS_ACTIVE: Final[str] = AgentStatus.ACTIVE.value
+AGENT_STATUS_FAILED: Final[str] = AgentStatus.FAILED.value
+AGENT_STATUS_PAUSED: Final[str] = AgentStatus.PAUSED.value
+
+
 class AgentType(str, Enum):
     """Type of agent"""
 
@@ -59,66 +77,67 @@ class VoicePersonality(BaseModel):
 class Agent(BaseModel):
     """Agent model for storing agent configuration and metadata"""
 
-    agent_id: str = Field(..., description="Unique identifier for the agent", alias="agentId")
-    user_id: str = Field(..., description="User ID who owns this agent", alias="userId")
-    agent_name: str = Field(..., description="Human-readable name for the agent", alias="agentName")
-    agent_type: AgentType = Field(..., description="Type of agent (voice, text, or both)", alias="agentType")
+    # camelCase aliases for DynamoDB; populate_by_name allows snake_case too
+    model_config = ConfigDict(
+        alias_generator=to_camel, populate_by_name=True, use_enum_values=True
+    )
+
+    agent_id: str = Field(..., description="Unique identifier for the agent")
+    user_id: str = Field(..., description="User ID who owns this agent")
+    agent_name: str = Field(..., description="Human-readable name for the agent")
+    agent_type: AgentType = Field(..., description="Type of agent (voice, text, or both)")
     sop: str = Field(..., description="Standard Operating Procedure for the agent")
-    knowledge_base_id: str = Field(..., description="Associated knowledge base ID", alias="knowledgeBaseId")
+    knowledge_base_id: str = Field(..., description="Associated knowledge base ID")
     knowledge_base_description: str = Field(
-        ..., description="Description of when to use the knowledge base", alias="knowledgeBaseDescription"
+        ..., description="Description of when to use the knowledge base"
     )
     human_handoff_description: str = Field(
-        ..., description="Description of when to escalate to human", alias="humanHandoffDescription"
+        ..., description="Description of when to escalate to human"
     )
     voice_personality: Optional[VoicePersonality] = Field(
-        default=None, description="Voice agent personality configuration", alias="voicePersonality"
+        default=None, description="Voice agent personality configuration"
     )
     voice_config: Optional[Dict] = Field(
-        default=None, description="Additional voice-specific technical configuration", alias="voiceConfig"
+        default=None, description="Additional voice-specific technical configuration"
     )
-    text_config: Optional[Dict] = Field(default=None, description="Text-specific configuration", alias="textConfig")
+    text_config: Optional[Dict] = Field(default=None, description="Text-specific configuration")
     bedrock_knowledge_base_arn: Optional[str] = Field(
-        None, description="Bedrock Knowledge Base ARN", alias="bedrockKnowledgeBaseArn"
+        None, description="Bedrock Knowledge Base ARN"
     )
     agentcore_runtime_arn: Optional[str] = Field(
-        None, description="Bedrock AgentCore Runtime ARN (shared Chameleon loader)", alias="agentcoreRuntimeArn"
+        None, description="Bedrock AgentCore Runtime ARN (shared Chameleon loader)"
     )
     generated_prompt: Optional[str] = Field(
-        None, description="Generated system prompt for the Strands agent (embedded in code)", alias="generatedPrompt"
+        None, description="Generated system prompt for the Strands agent (embedded in code)"
     )
     voice_prompt: Optional[str] = Field(
-        None, description="Voice-optimized system prompt for Nova Sonic interface", alias="voicePrompt"
+        None, description="Voice-optimized system prompt for Nova Sonic interface"
     )
     agent_code_s3_path: Optional[str] = Field(
-        None, description="S3 path to generated agent_file.py", alias="agentCodeS3Path"
+        None, description="S3 path to generated agent_file.py"
     )
     memory_id: Optional[str] = Field(
-        None, description="AgentCore Memory resource ID for conversation history", alias="memoryId"
+        None, description="AgentCore Memory resource ID for conversation history"
     )
     status: AgentStatus = Field(
         default=AgentStatus.CREATING, description="Current status of the agent"
     )
     created_at: int = Field(
-        default_factory=lambda: int(datetime.now().timestamp()),
-        description="Creation timestamp",
-        alias="createdAt"
+        default_factory=_now_ts,
+        description="Creation timestamp"
     )
     updated_at: int = Field(
-        default_factory=lambda: int(datetime.now().timestamp()),
-        description="Last update timestamp",
-        alias="updatedAt"
+        default_factory=_now_ts,
+        description="Last update timestamp"
     )
     # Note: websocket_url and api_endpoint removed - constructed on-the-fly in API
 
-    class Config:
-        use_enum_values = True
-        populate_by_name = True  # Allow both snake_case and camelCase
-
 
 class AgentCreate(BaseModel):
     """Request model for creating an agent"""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     agent_name: str = Field(..., min_length=3, max_length=100)
     agent_type: AgentType
     sop: str = Field(..., min_length=10)
@@ -128,13 +147,51 @@ class AgentCreate(BaseModel):
     voice_config: Optional[Dict] = None
     text_config: Optional[Dict] = None
 
-    class Config:
-        use_enum_values = True
+
+class AgentFormFields(BaseModel):
+    """JSON-encoded multipart form fields of a create-agent request
+
+    Each field holds the raw JSON string from the form; pydantic decodes and
+    validates it in one pass. Omit a field (rather than passing None or "")
+    when it was not sent.
+    """
+
+    voice_personality: Optional[Json[VoicePersonality]] = None
+    voice_config: Optional[Json[Dict]] = None
+    text_config: Optional[Json[Dict]] = None
+    file_descriptions: Json[Dict[str, str]] = Field(default_factory=dict)
+
+
+@lru_cache(maxsize=1)
+def _agent_create_validator():
+    """Compile the AgentCreate JSON Schema to a validator (built on first use)"""
+    import fastjsonschema
+
+    return fastjsonschema.compile(AgentCreate.model_json_schema(), use_default=False)
+
+
+def validate_agent_create(raw: Dict) -> None:
+    """
+    Validate a raw AgentCreate payload against its JSON Schema
+
+    For payloads that arrive outside FastAPI's request parsing (webhooks,
+    workflow callbacks). The validator is generated Python code, compiled
+    once per process.
+
+    Args:
+        raw: Decoded JSON payload
+
+    Raises:
+        ValueError: If the payload does not match the schema
+    """
+    _agent_create_validator()(raw)
 
 
 class AgentUpdate(BaseModel):
     """Request model for updating an agent"""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     bedrock_knowledge_base_arn: Optional[str] = None
     agentcore_runtime_arn: Optional[str] = None
     generated_prompt: Optional[str] = None
@@ -142,15 +199,14 @@ class AgentUpdate(BaseModel):
     agent_code_s3_path: Optional[str] = None
     memory_id: Optional[str] = None
     status: Optional[AgentStatus] = None
-    updated_at: int = Field(default_factory=lambda: int(datetime.now().timestamp()))
-
-    class Config:
-        use_enum_values = True
+    updated_at: int = Field(default_factory=_now_ts)
 
 
 class AgentResponse(BaseModel):
     """Response model for agent with knowledge base details"""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     agent_id: str
     user_id: str
     agent_name: str
@@ -174,5 +230,26 @@ class AgentResponse(BaseModel):
     knowledge_base: Optional[Dict] = None  # Will be populated with KB details
     # Note: websocket_url and api_endpoint constructed on-the-fly when needed
 
-    class Config:
-        use_enum_values = True
+    @classmethod
+    def from_agent(
+        cls, agent: Agent, knowledge_base: Optional["KnowledgeBase"] = None
+    ) -> "AgentResponse":
+        """
+        Build the response for a stored agent and its knowledge base
+
+        Args:
+            agent: Agent to describe
+            knowledge_base: Agent's knowledge base, if found
+
+        Returns:
+            AgentResponse: Response with the knowledge base details embedded
+        """
+        data = {name: getattr(agent, name) for name in _AGENT_RESPONSE_FIELDS}
+        data["knowledge_base"] = knowledge_base.model_dump() if knowledge_base else None
+        return cls.model_validate(data)
+
+
+# AgentResponse fields copied straight from Agent
+_AGENT_RESPONSE_FIELDS: Final = tuple(
+    name for name in AgentResponse.model_fields if name != "knowledge_base"
+)
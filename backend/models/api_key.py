@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Final, List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
+from pydantic.alias_generators import to_camel
 
 
 class APIKeyPermission(str, Enum):
@@ -23,23 +24,34 @@ class APIKeyStatus(str, Enum):
     EXPIRED = "expired"
 
 
+# Plain-string values for the per-request key validation checks
+API_KEY_PERMISSION_CHAT: Final[str] = APIKeyPermission.CHAT.value
+API_KEY_PERMISSION_VOICE: Final[str] = APIKeyPermission.VOICE.value
+API_KEY_STATUS_ACTIVE: Final[str] = APIKeyStatus.ACTIVE.value
+
+
+def _default_permissions() -> List[APIKeyPermission]:
+    """Fresh default permission list (chat only)"""
+    return [APIKeyPermission.CHAT]
+
+
 class APIKey(BaseModel):
     """API Key model"""
 
-    model_config = ConfigDict(populate_by_name=True, by_alias=False)
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
-    api_key_hash: str = Field(..., alias="apiKeyHash", description="SHA-256 hash of the API key")
-    user_id: str = Field(..., alias="userId", description="User ID who owns this key")
-    agent_id: str = Field(..., alias="agentId", description="Agent ID this key is for")
-    key_name: str = Field(..., alias="keyName", description="Human-readable name for the key")
+    api_key_hash: str = Field(..., description="SHA-256 hash of the API key")
+    user_id: str = Field(..., description="User ID who owns this key")
+    agent_id: str = Field(..., description="Agent ID this key is for")
+    key_name: str = Field(..., description="Human-readable name for the key")
     permissions: List[APIKeyPermission] = Field(
-        default=[APIKeyPermission.CHAT], description="Permissions granted to this key"
+        default_factory=_default_permissions, description="Permissions granted to this key"
     )
     status: APIKeyStatus = Field(default=APIKeyStatus.ACTIVE, description="Key status")
-    rate_limit: int = Field(default=1000, alias="rateLimit", description="Requests per hour")
-    created_at: int = Field(..., alias="createdAt", description="Creation timestamp")
-    expires_at: Optional[int] = Field(None, alias="expiresAt", description="Expiration timestamp")
-    last_used_at: Optional[int] = Field(None, alias="lastUsedAt", description="Last usage timestamp")
+    rate_limit: int = Field(default=1000, description="Requests per hour")
+    created_at: int = Field(..., description="Creation timestamp")
+    expires_at: Optional[int] = Field(None, description="Expiration timestamp")
+    last_used_at: Optional[int] = Field(None, description="Last usage timestamp")
 
 
 class APIKeyCreate(BaseModel):
@@ -48,7 +60,7 @@ class APIKeyCreate(BaseModel):
     agent_id: str = Field(..., description="Agent ID to create key for")
     key_name: str = Field(..., description="Human-readable name for the key")
     permissions: List[APIKeyPermission] = Field(
-        default=[APIKeyPermission.CHAT], description="Permissions to grant"
+        default_factory=_default_permissions, description="Permissions to grant"
     )
     rate_limit: int = Field(default=1000, description="Requests per hour")
     expires_in_days: Optional[int] = Field(None, description="Days until expiration")
@@ -57,19 +69,19 @@ class APIKeyCreate(BaseModel):
 class APIKeyResponse(BaseModel):
     """API Key response (includes plain key only on creation)"""
 
-    model_config = ConfigDict(populate_by_name=True, by_alias=False)
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
-    api_key_hash: str = Field(..., alias="apiKeyHash")
-    user_id: str = Field(..., alias="userId")
-    agent_id: str = Field(..., alias="agentId")
-    key_name: str = Field(..., alias="keyName")
+    api_key_hash: str
+    user_id: str
+    agent_id: str
+    key_name: str
     permissions: List[APIKeyPermission]
     status: APIKeyStatus
-    rate_limit: int = Field(..., alias="rateLimit")
-    created_at: int = Field(..., alias="createdAt")
-    expires_at: Optional[int] = Field(None, alias="expiresAt")
+    rate_limit: int
+    created_at: int
+    expires_at: Optional[int] = None
     # Only included on creation
-    api_key: Optional[str] = Field(None, alias="apiKey", description="Plain API key (only shown once)")
+    api_key: Optional[str] = Field(None, description="Plain API key (only shown once)")
 
 
 class APIKeyValidation(BaseModel):
@@ -78,5 +90,5 @@ class APIKeyValidation(BaseModel):
     valid: bool
     user_id: Optional[str] = None
     agent_id: Optional[str] = None
-    permissions: List[APIKeyPermission] = []
+    permissions: List[APIKeyPermission] = Field(default_factory=list)
     reason: Optional[str] = None  # Reason if invalid
@@ -1,8 +1,14 @@
-from datetime import datetime
 from enum import Enum
+from time import time as _time
 from typing import Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+
+def _now_ts() -> int:
+    """Current Unix timestamp in whole seconds"""
+    return int(_time())
 
 
 class KnowledgeBaseStatus(str, Enum):
@@ -16,35 +22,33 @@ class KnowledgeBaseStatus(str, Enum):
 class KnowledgeBase(BaseModel):
     """Knowledge Base model for storing document metadata and Bedrock KB info"""
 
-    knowledge_base_id: str = Field(..., description="Unique identifier for the knowledge base", alias="knowledgeBaseId")
-    user_id: str = Field(..., description="User ID who owns this knowledge base", alias="userId")
-    s3_path: str = Field(..., description="S3 path where documents are stored", alias="s3Path")
+    # camelCase aliases for DynamoDB; populate_by_name allows snake_case too
+    model_config = ConfigDict(
+        alias_generator=to_camel, populate_by_name=True, use_enum_values=True
+    )
+
+    knowledge_base_id: str = Field(..., description="Unique identifier for the knowledge base")
+    user_id: str = Field(..., description="User ID who owns this knowledge base")
+    s3_path: str = Field(..., description="S3 path where documents are stored")
     bedrock_knowledge_base_id: Optional[str] = Field(
-        None, description="Bedrock Knowledge Base ID after provisioning", alias="bedrockKnowledgeBaseId"
+        None, description="Bedrock Knowledge Base ID after provisioning"
     )
     status: KnowledgeBaseStatus = Field(
         default=KnowledgeBaseStatus.NOTREADY, description="Current status of the knowledge base"
     )
     folder_file_descriptions: Dict[str, str] = Field(
         default_factory=dict,
-        description="Mapping of folder/file paths to their descriptions",
-        alias="folderFileDescriptions"
+        description="Mapping of folder/file paths to their descriptions"
     )
     created_at: int = Field(
-        default_factory=lambda: int(datetime.now().timestamp()),
-        description="Creation timestamp",
-        alias="createdAt"
+        default_factory=_now_ts,
+        description="Creation timestamp"
     )
     updated_at: int = Field(
-        default_factory=lambda: int(datetime.now().timestamp()),
-        description="Last update timestamp",
-        alias="updatedAt"
+        default_factory=_now_ts,
+        description="Last update timestamp"
     )
 
-    class Config:
-        use_enum_values = True
-        populate_by_name = True  # Allow both snake_case and camelCase
-
 
 class KnowledgeBaseCreate(BaseModel):
     """Request model for creating a knowledge base"""
@@ -57,9 +61,8 @@ class KnowledgeBaseCreate(BaseModel):
 class KnowledgeBaseUpdate(BaseModel):
     """Request model for updating a knowledge base"""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     bedrock_knowledge_base_id: Optional[str] = None
     status: Optional[KnowledgeBaseStatus] = None
-    updated_at: int = Field(default_factory=lambda: int(datetime.now().timestamp()))
-
-    class Config:
-        use_enum_values = True
+    updated_at: int = Field(default_factory=_now_ts)
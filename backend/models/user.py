@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class UserBase(BaseModel):
@@ -35,14 +35,13 @@ class UserConfirm(BaseModel):
 class User(UserBase):
     """Complete user model with all fields."""
     
+    model_config = ConfigDict(from_attributes=True)
+
     user_id: str
     created_at: int
     last_login: Optional[int] = None
     subscription_tier: str = "free"
     cognito_sub: str  # Cognito user sub identifier
-    
-    class Config:
-        from_attributes = True
 
 
 class TokenResponse(BaseModel):
@@ -1,36 +1,34 @@
+import asyncio
 import hashlib
 import logging
 import os
 from typing import List, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile, status
 from fastapi.responses import JSONResponse
 
-from aws.dynamodb_client import DynamoDBClient
-from aws.s3_client import S3Client
 from aws.stepfunctions_client import StepFunctionsClient
-from dependencies import get_current_user
-from models.agent import AgentCreate, AgentResponse, AgentStatus, AgentType
+from dependencies import (
+    get_agent_service,
+    get_current_user,
+    get_knowledge_base_service,
+    get_s3_service,
+    get_stepfunctions_client,
+)
+from models._codecs import AGENT_RESPONSE_LIST
+from models.agent import AgentCreate, AgentFormFields, AgentResponse, AgentStatus, AgentType
 from models.knowledge_base import KnowledgeBaseCreate
 from models.user import User
 from services.agent_service import AgentService
 from services.knowledge_base_service import KnowledgeBaseService
 from services.s3_service import S3Service
+from utils.responses import accepts_msgpack, negotiated_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/agents", tags=["agents"])
 
-# Initialize clients and services
-dynamodb_client = DynamoDBClient()
-s3_client = S3Client()
-sfn_client = StepFunctionsClient()
-
-agent_service = AgentService(dynamodb_client)
-kb_service = KnowledgeBaseService(dynamodb_client)
-s3_service = S3Service(s3_client)
-
 # Get environment variables
 from config import settings
 
@@ -40,9 +38,34 @@ STATE_MACHINE_ARN = os.getenv(
     "arn:aws:states:us-east-1:095811638868:stateMachine:oratio-agent-creation"  # Your actual ARN
 )
 
+# Form/query values are looked up directly instead of going through
+# Enum.__call__; the joined lists are only needed for error messages
+_AGENT_TYPES = AgentType._value2member_map_
+_AGENT_TYPE_VALUES = ", ".join(AgentType._value2member_map_)
+_AGENT_STATUSES = AgentStatus._value2member_map_
+_AGENT_STATUS_VALUES = ", ".join(AgentStatus._value2member_map_)
+
+
+async def _start_agent_workflow(
+    sfn_client: StepFunctionsClient, agent_id: str, workflow_input: dict
+) -> None:
+    """Start the agent creation workflow (runs after the response is sent)"""
+    execution = await sfn_client.a_start_execution(
+        state_machine_arn=STATE_MACHINE_ARN,
+        execution_name=f"agent-creation-{agent_id}",
+        input_data=workflow_input,
+    )
+
+    if execution:
+        logger.info(f"Started Step Functions execution: {execution.get('executionArn')}")
+    else:
+        logger.warning("Failed to start Step Functions execution - agent created but workflow not triggered")
+        # Don't fail the request, agent is created, workflow can be triggered manually or retried
+
 
 @router.post("", response_model=AgentResponse, status_code=status.HTTP_201_CREATED)
 async def create_agent(
+    background_tasks: BackgroundTasks,
     agent_name: str = Form(...),
     agent_type: str = Form(...),
     sop: str = Form(...),
@@ -54,38 +77,40 @@ async def create_agent(
     files: List[UploadFile] = File(...),
     file_descriptions: Optional[str] = Form(None),  # JSON string mapping filename to description
     current_user: User = Depends(get_current_user),
+    agent_service: AgentService = Depends(get_agent_service),
+    kb_service: KnowledgeBaseService = Depends(get_knowledge_base_service),
+    s3_service: S3Service = Depends(get_s3_service),
+    sfn_client: StepFunctionsClient = Depends(get_stepfunctions_client),
 ):
     """
     Create a new agent with knowledge base
 
     This endpoint:
     1. Uploads files to S3 with proper tagging
-    2. Creates knowledge base entry in DynamoDB
-    3. Creates agent entry in DynamoDB
-    4. Triggers Step Functions workflow for agent creation
+    2. Creates knowledge base and agent entries in DynamoDB (one transaction)
+    3. Triggers Step Functions workflow for agent creation (after responding)
     """
     try:
-        import json
-
-        from models.agent import VoicePersonality
-
-        # Parse JSON fields
-        voice_personality_obj = None
-        if voice_personality:
-            voice_personality_dict = json.loads(voice_personality)
-            voice_personality_obj = VoicePersonality(**voice_personality_dict)
-
-        voice_config_dict = json.loads(voice_config) if voice_config else None
-        text_config_dict = json.loads(text_config) if text_config else None
-        file_descriptions_dict = json.loads(file_descriptions) if file_descriptions else {}
+        # Parse JSON fields (empty form values count as not sent)
+        form_fields = AgentFormFields.model_validate(
+            {
+                name: value
+                for name, value in (
+                    ("voice_personality", voice_personality),
+                    ("voice_config", voice_config),
+                    ("text_config", text_config),
+                    ("file_descriptions", file_descriptions),
+                )
+                if value
+            }
+        )
 
         # Validate agent type
-        try:
-            agent_type_enum = AgentType(agent_type)
-        except ValueError:
+        agent_type_enum = _AGENT_TYPES.get(agent_type)
+        if agent_type_enum is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid agent_type. Must be one of: {', '.join([t.value for t in AgentType])}",
+                detail=f"Invalid agent_type. Must be one of: {_AGENT_TYPE_VALUES}",
             )
 
         # Generate IDs
@@ -100,15 +125,12 @@ async def create_agent(
         logger.info(f"Creating agent {agent_id} for user {user_id} with KB {kb_id}")
 
         # Step 1: Upload files to S3
-        file_upload_data = []
-        for file in files:
-            content = await file.read()
-            import io
+        # Hand S3 the spooled temp files themselves rather than in-memory
+        # copies: small files go out in one PUT, larger ones are streamed
+        # in multipart chunks, so memory stays bounded by the part size
+        file_upload_data = [(file.file, file.filename, file.content_type) for file in files]
 
-            file_obj = io.BytesIO(content)
-            file_upload_data.append((file_obj, file.filename, file.content_type))
-
-        upload_results = s3_service.upload_knowledge_base_files(
+        upload_results = await s3_service.a_upload_knowledge_base_files(
             files=file_upload_data, user_id=user_id, agent_id=agent_id
         )
 
@@ -123,12 +145,12 @@ async def create_agent(
 
         # Step 2: Generate folder structure with descriptions
         file_desc_list = [
-            (filename, file_descriptions_dict.get(filename, ""))
+            (filename, form_fields.file_descriptions.get(filename, ""))
             for filename in upload_results.keys()
         ]
         folder_structure = s3_service.generate_folder_structure(file_desc_list)
 
-        # Step 3: Create knowledge base entry
+        # Step 3: Create knowledge base and agent entries
         s3_path = s3_service.get_s3_path(user_id, agent_id)
         kb_data = KnowledgeBaseCreate(
             user_id=user_id,
@@ -136,40 +158,38 @@ async def create_agent(
             folder_file_descriptions=folder_structure,
         )
 
-        kb = kb_service.create_knowledge_base(kb_data, kb_id=kb_id)
-        if not kb:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to create knowledge base entry",
-            )
-
-        logger.info(f"Created knowledge base {kb_id}")
-
-        # Step 4: Create agent entry
         agent_create_data = AgentCreate(
             agent_name=agent_name,
             agent_type=agent_type_enum,
             sop=sop,
             knowledge_base_description=knowledge_base_description,
             human_handoff_description=human_handoff_description,
-            voice_personality=voice_personality_obj,
-            voice_config=voice_config_dict,
-            text_config=text_config_dict,
+            voice_personality=form_fields.voice_personality,
+            voice_config=form_fields.voice_config,
+            text_config=form_fields.text_config,
         )
 
-        agent = agent_service.create_agent(
-            user_id=user_id, kb_id=kb_id, agent_data=agent_create_data, agent_id=agent_id
+        # One transaction writes both entries, so a failure never leaves a
+        # knowledge base behind without its agent
+        created = await asyncio.to_thread(
+            agent_service.create_agent_with_knowledge_base,
+            kb_service,
+            user_id,
+            agent_create_data,
+            kb_data,
+            agent_id,
+            kb_id,
         )
-        if not agent:
+        if not created:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to create agent entry",
+                detail="Failed to create agent and knowledge base entries",
             )
+        agent, kb = created
 
-        logger.info(f"Created agent {agent_id}")
+        logger.info(f"Created knowledge base {kb_id} and agent {agent_id}")
 
-        # Step 5: Trigger Step Functions workflow
-        execution_name = f"agent-creation-{agent_id}"
+        # Step 4: Trigger Step Functions workflow
         workflow_input = {
             "userId": user_id,
             "agentId": agent_id,
@@ -180,42 +200,12 @@ async def create_agent(
             "s3Path": s3_path,
         }
 
-        execution = sfn_client.start_execution(
-            state_machine_arn=STATE_MACHINE_ARN,
-            execution_name=execution_name,
-            input_data=workflow_input,
-        )
-
-        if execution:
-            logger.info(f"Started Step Functions execution: {execution.get('executionArn')}")
-        else:
-            logger.warning("Failed to start Step Functions execution - agent created but workflow not triggered")
-            # Don't fail the request, agent is created, workflow can be triggered manually or retried
+        # Started only once both entries exist (the workflow reads them back),
+        # and after the response is sent: its outcome never changed the response
+        background_tasks.add_task(_start_agent_workflow, sfn_client, agent_id, workflow_input)
 
         # Return agent response
-        response = AgentResponse(
-            agent_id=agent.agent_id,
-            user_id=agent.user_id,
-            agent_name=agent.agent_name,
-            agent_type=agent.agent_type,
-            sop=agent.sop,
-            knowledge_base_id=agent.knowledge_base_id,
-            knowledge_base_description=agent.knowledge_base_description,
-            human_handoff_description=agent.human_handoff_description,
-            voice_personality=agent.voice_personality,
-            voice_config=agent.voice_config,
-            text_config=agent.text_config,
-            bedrock_knowledge_base_arn=agent.bedrock_knowledge_base_arn,
-            agentcore_runtime_arn=agent.agentcore_runtime_arn,
-            generated_prompt=agent.generated_prompt,
-            voice_prompt=agent.voice_prompt,
-            agent_code_s3_path=agent.agent_code_s3_path,
-            memory_id=agent.memory_id,
-            status=agent.status,
-            created_at=agent.created_at,
-            updated_at=agent.updated_at,
-            knowledge_base=kb.model_dump(),
-        )
+        response = AgentResponse.from_agent(agent, kb)
 
         return response
 
@@ -233,6 +223,9 @@ async def create_agent(
 async def list_agents(
     status_filter: Optional[str] = None,
     current_user: User = Depends(get_current_user),
+    agent_service: AgentService = Depends(get_agent_service),
+    kb_service: KnowledgeBaseService = Depends(get_knowledge_base_service),
+    use_msgpack: bool = Depends(accepts_msgpack),
 ):
     """
     List all agents for the current user
@@ -245,48 +238,31 @@ async def list_agents(
         # Parse status filter if provided
         status_enum = None
         if status_filter:
-            try:
-                status_enum = AgentStatus(status_filter)
-            except ValueError:
+            status_enum = _AGENT_STATUSES.get(status_filter)
+            if status_enum is None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid status. Must be one of: {', '.join([s.value for s in AgentStatus])}",
+                    detail=f"Invalid status. Must be one of: {_AGENT_STATUS_VALUES}",
                 )
 
         # Get agents
-        agents = agent_service.list_user_agents(user_id, status_filter=status_enum)
-
-        # Get knowledge bases for each agent
-        responses = []
-        for agent in agents:
-            kb = kb_service.get_knowledge_base(agent.knowledge_base_id)
-
-            response = AgentResponse(
-                agent_id=agent.agent_id,
-                user_id=agent.user_id,
-                agent_name=agent.agent_name,
-                agent_type=agent.agent_type,
-                sop=agent.sop,
-                knowledge_base_id=agent.knowledge_base_id,
-                knowledge_base_description=agent.knowledge_base_description,
-                human_handoff_description=agent.human_handoff_description,
-                voice_personality=agent.voice_personality,
-                voice_config=agent.voice_config,
-                text_config=agent.text_config,
-                bedrock_knowledge_base_arn=agent.bedrock_knowledge_base_arn,
-                agentcore_runtime_arn=agent.agentcore_runtime_arn,
-                generated_prompt=agent.generated_prompt,
-                voice_prompt=agent.voice_prompt,
-                agent_code_s3_path=agent.agent_code_s3_path,
-                memory_id=agent.memory_id,
-                status=agent.status,
-                created_at=agent.created_at,
-                updated_at=agent.updated_at,
-                knowledge_base=kb.model_dump() if kb else None,
-            )
-            responses.append(response)
+        agents = await asyncio.to_thread(
+            agent_service.list_user_agents, user_id, status_filter=status_enum
+        )
 
-        return responses
+        # Fetch every referenced knowledge base in one batched read instead
+        # of one get_item per agent
+        kbs = await asyncio.to_thread(
+            kb_service.get_knowledge_bases,
+            [agent.knowledge_base_id for agent in agents],
+        )
+
+        responses = [
+            AgentResponse.from_agent(agent, kbs.get(agent.knowledge_base_id))
+            for agent in agents
+        ]
+
+        return negotiated_response(AGENT_RESPONSE_LIST, responses, use_msgpack)
 
     except HTTPException:
         raise
@@ -302,6 +278,8 @@ async def list_agents(
 async def get_agent(
     agent_id: str,
     current_user: User = Depends(get_current_user),
+    agent_service: AgentService = Depends(get_agent_service),
+    kb_service: KnowledgeBaseService = Depends(get_knowledge_base_service),
 ):
     """
     Get a specific agent by ID
@@ -310,7 +288,7 @@ async def get_agent(
         user_id = current_user.user_id
 
         # Get agent with tenant isolation
-        agent = agent_service.get_agent(user_id, agent_id)
+        agent = await asyncio.to_thread(agent_service.get_agent, user_id, agent_id)
         if not agent:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -318,32 +296,12 @@ async def get_agent(
             )
 
         # Get knowledge base
-        kb = kb_service.get_knowledge_base(agent.knowledge_base_id)
-
-        response = AgentResponse(
-            agent_id=agent.agent_id,
-            user_id=agent.user_id,
-            agent_name=agent.agent_name,
-            agent_type=agent.agent_type,
-            sop=agent.sop,
-            knowledge_base_id=agent.knowledge_base_id,
-            knowledge_base_description=agent.knowledge_base_description,
-            human_handoff_description=agent.human_handoff_description,
-            voice_personality=agent.voice_personality,
-            voice_config=agent.voice_config,
-            text_config=agent.text_config,
-            bedrock_knowledge_base_arn=agent.bedrock_knowledge_base_arn,
-            agentcore_runtime_arn=agent.agentcore_runtime_arn,
-            generated_prompt=agent.generated_prompt,
-            voice_prompt=agent.voice_prompt,
-            agent_code_s3_path=agent.agent_code_s3_path,
-            memory_id=agent.memory_id,
-            status=agent.status,
-            created_at=agent.created_at,
-            updated_at=agent.updated_at,
-            knowledge_base=kb.model_dump() if kb else None,
+        kb = await asyncio.to_thread(
+            kb_service.get_knowledge_base, agent.knowledge_base_id
         )
 
+        response = AgentResponse.from_agent(agent, kb)
+
         return response
 
     except HTTPException:
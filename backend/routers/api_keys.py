@@ -1,11 +1,14 @@
 """API Keys router"""
 
+import asyncio
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
+from models._codecs import API_KEY_LIST
 from models.api_key import APIKey, APIKeyCreate, APIKeyResponse
 from models.user import UserProfile
 from services.api_key_service import APIKeyService
 from dependencies import get_api_key_service, get_current_user
+from utils.responses import accepts_msgpack, negotiated_response
 
 router = APIRouter(prefix="/api-keys", tags=["api-keys"])
 
@@ -22,7 +25,9 @@ async def create_api_key(
     The API key will only be shown once upon creation.
     Store it securely as it cannot be retrieved later.
     """
-    api_key = api_key_service.create_api_key(current_user.user_id, key_data)
+    api_key = await asyncio.to_thread(
+        api_key_service.create_api_key, current_user.user_id, key_data
+    )
     
     if not api_key:
         raise HTTPException(
@@ -38,14 +43,17 @@ async def list_api_keys(
     agent_id: str = None,
     current_user: UserProfile = Depends(get_current_user),
     api_key_service: APIKeyService = Depends(get_api_key_service),
+    use_msgpack: bool = Depends(accepts_msgpack),
 ):
     """
     List all API keys for the current user
     
     Optionally filter by agent_id
     """
-    keys = api_key_service.list_user_keys(current_user.user_id, agent_id)
-    return keys
+    keys = await asyncio.to_thread(
+        api_key_service.list_user_keys, current_user.user_id, agent_id
+    )
+    return negotiated_response(API_KEY_LIST, keys, use_msgpack, by_alias=False)
 
 
 @router.delete("/{key_hash}", status_code=status.HTTP_204_NO_CONTENT)
@@ -59,7 +67,9 @@ async def revoke_api_key(
     
     This will immediately invalidate the key.
     """
-    success = api_key_service.revoke_api_key(current_user.user_id, key_hash)
+    success = await asyncio.to_thread(
+        api_key_service.revoke_api_key, current_user.user_id, key_hash
+    )
     
     if not success:
         raise HTTPException(
@@ -1,14 +1,17 @@
 """Chat endpoints for conversational agents"""
 
+import asyncio
 import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Header, HTTPException, status
 from pydantic import BaseModel, Field
 
+from aws.session import get_resource
 from config import settings
 from dependencies import get_agent_service, get_api_key_service, get_agent_invocation_service
-from models.api_key import APIKeyPermission
+from models.agent import AGENT_STATUS_ACTIVE
+from models.api_key import API_KEY_PERMISSION_CHAT
 from services.agent_invocation_service import AgentInvocationService
 from services.agent_service import AgentService
 from services.api_key_service import APIKeyService
@@ -107,8 +110,10 @@ async def chat_with_agent(
             )
         
         logger.info(f"Validating API key for agent {agent_id}")
-        validation = api_key_service.validate_key_for_agent(
-            api_key=x_api_key, agent_id=agent_id
+        validation = await asyncio.to_thread(
+            api_key_service.validate_key_for_agent,
+            api_key=x_api_key,
+            agent_id=agent_id,
         )
 
         if not validation.valid:
@@ -119,7 +124,7 @@ async def chat_with_agent(
             )
 
         # Check chat permission
-        if APIKeyPermission.CHAT not in validation.permissions:
+        if API_KEY_PERMISSION_CHAT not in validation.permissions:
             logger.warning(f"API key does not have chat permission for agent {agent_id}")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -132,14 +137,12 @@ async def chat_with_agent(
     # In test mode, we need to find the agent first to get user_id
     if test:
         # Query using agentId-index GSI to find the agent
-        import boto3
-        from config import settings
-        
-        dynamodb = boto3.resource('dynamodb', region_name=settings.AWS_REGION)
+        dynamodb = get_resource('dynamodb', settings.AWS_REGION)
         table = dynamodb.Table(settings.AGENTS_TABLE)
         
         # Query the GSI with agentId
-        response = table.query(
+        response = await asyncio.to_thread(
+            table.query,
             IndexName='agentId-index',
             KeyConditionExpression='agentId = :agent_id',
             ExpressionAttributeValues={
@@ -160,8 +163,8 @@ async def chat_with_agent(
         logger.info(f"Test mode: Retrieved agent {agent_id} for user {user_id}")
     
     logger.info(f"Retrieving agent {agent_id} for user {user_id}")
-    agent = agent_service.get_agent(
-        user_id=user_id, agent_id=agent_id
+    agent = await asyncio.to_thread(
+        agent_service.get_agent, user_id=user_id, agent_id=agent_id
     )
 
     if not agent:
@@ -172,7 +175,7 @@ async def chat_with_agent(
         )
 
     # Check if agent is active
-    if agent.status != "active":
+    if agent.status != AGENT_STATUS_ACTIVE:
         logger.warning(f"Agent {agent_id} is not active (status: {agent.status})")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -197,7 +200,8 @@ async def chat_with_agent(
     # Chameleon fetches it from DynamoDB based on agent_id
     # Each agent has a unique memory_id created during agent creation
 
-    result = invocation_service.invoke_agent(
+    result = await asyncio.to_thread(
+        invocation_service.invoke_agent,
         runtime_arn=agent.agentcore_runtime_arn,
         agent_id=agent_id,
         user_id=user_id,
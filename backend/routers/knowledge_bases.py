@@ -2,24 +2,25 @@
 
 from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File
 from typing import Annotated, List
+import asyncio
 import logging
 
+from models._codecs import KNOWLEDGE_BASE_LIST
 from models.knowledge_base import KnowledgeBase
 from models.user import UserProfile
 from services.knowledge_base_service import KnowledgeBaseService
-from dependencies import get_current_user
-from aws.dynamodb_client import DynamoDBClient
+from dependencies import get_current_user, get_knowledge_base_service
+from utils.responses import accepts_msgpack, negotiated_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/knowledge-bases", tags=["knowledge-bases"])
 
-dynamodb_client = DynamoDBClient()
-kb_service = KnowledgeBaseService(dynamodb_client)
-
 @router.get("", response_model=List[KnowledgeBase])
 async def list_knowledge_bases(
-    current_user: Annotated[UserProfile, Depends(get_current_user)]
+    current_user: Annotated[UserProfile, Depends(get_current_user)],
+    kb_service: Annotated[KnowledgeBaseService, Depends(get_knowledge_base_service)],
+    use_msgpack: Annotated[bool, Depends(accepts_msgpack)],
 ):
     """
     List all knowledge bases for the current user.
@@ -28,8 +29,10 @@ async def list_knowledge_bases(
         List of knowledge bases owned by the user
     """
     try:
-        knowledge_bases = kb_service.list_user_knowledge_bases(current_user.user_id)
-        return knowledge_bases
+        knowledge_bases = await asyncio.to_thread(
+            kb_service.list_user_knowledge_bases, current_user.user_id
+        )
+        return negotiated_response(KNOWLEDGE_BASE_LIST, knowledge_bases, use_msgpack)
     except Exception as e:
         logger.error(f"Error listing knowledge bases: {e}")
         raise HTTPException(
@@ -41,7 +44,8 @@ async def list_knowledge_bases(
 @router.get("/{knowledge_base_id}", response_model=KnowledgeBase)
 async def get_knowledge_base(
     knowledge_base_id: str,
-    current_user: Annotated[UserProfile, Depends(get_current_user)]
+    current_user: Annotated[UserProfile, Depends(get_current_user)],
+    kb_service: Annotated[KnowledgeBaseService, Depends(get_knowledge_base_service)],
 ):
     """
     Get a specific knowledge base by ID.
@@ -53,7 +57,7 @@ async def get_knowledge_base(
         Knowledge base details
     """
     try:
-        kb = kb_service.get_knowledge_base(knowledge_base_id)
+        kb = await asyncio.to_thread(kb_service.get_knowledge_base, knowledge_base_id)
         
         if not kb:
             raise HTTPException(
@@ -117,7 +121,8 @@ async def upload_files(
 @router.delete("/{knowledge_base_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_knowledge_base(
     knowledge_base_id: str,
-    current_user: Annotated[UserProfile, Depends(get_current_user)]
+    current_user: Annotated[UserProfile, Depends(get_current_user)],
+    kb_service: Annotated[KnowledgeBaseService, Depends(get_knowledge_base_service)],
 ):
     """
     Delete a knowledge base.
@@ -126,7 +131,7 @@ async def delete_knowledge_base(
         knowledge_base_id: Knowledge base ID
     """
     try:
-        kb = kb_service.get_knowledge_base(knowledge_base_id)
+        kb = await asyncio.to_thread(kb_service.get_knowledge_base, knowledge_base_id)
         
         if not kb:
             raise HTTPException(
@@ -11,15 +11,16 @@ from datetime import datetime
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Depends, status
 from pydantic import BaseModel
-import boto3
 
+from aws.session import get_resource
 from config import settings
 from dependencies import get_agent_service, get_api_key_service, get_agent_invocation_service
 from services.agent_service import AgentService
 from services.api_key_service import APIKeyService
 from services.agent_invocation_service import AgentInvocationService
 from services.conversation_logger_service import ConversationLoggerService
-from models.api_key import APIKeyPermission
+from models.agent import AGENT_STATUS_ACTIVE
+from models.api_key import API_KEY_PERMISSION_VOICE
 
 logger = logging.getLogger(__name__)
 
@@ -595,8 +596,7 @@ async def voice_agent_websocket(
         logger.info(f"[Voice] Starting authentication (test mode: {test})")
         if test:
             # Test mode: retrieve agent to get user_id
-            import boto3
-            dynamodb = boto3.resource('dynamodb', region_name=settings.AWS_REGION)
+            dynamodb = get_resource('dynamodb', settings.AWS_REGION)
             table = dynamodb.Table(settings.AGENTS_TABLE)
             response = table.query(
                 IndexName='agentId-index',
@@ -627,7 +627,7 @@ async def voice_agent_websocket(
                 return
             
             # Check voice permission
-            if APIKeyPermission.VOICE not in validation.permissions:
+            if API_KEY_PERMISSION_VOICE not in validation.permissions:
                 await websocket.send_json({"type": "error", "message": "API key does not have voice permission"})
                 await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
                 return
@@ -637,7 +637,9 @@ async def voice_agent_websocket(
         # Step 2: Get agent details
         logger.info(f"[Voice] Fetching agent details for user_id={user_id}, agent_id={agent_id}")
         try:
-            agent = agent_service.get_agent(user_id=user_id, agent_id=agent_id)
+            agent = await asyncio.to_thread(
+                agent_service.get_agent, user_id=user_id, agent_id=agent_id
+            )
             logger.info(f"[Voice] ✅ Agent retrieved: {agent.agent_name if agent else 'None'}")
         except Exception as e:
             logger.error(f"[Voice] ❌ Failed to get agent: {e}", exc_info=True)
@@ -645,7 +647,7 @@ async def voice_agent_websocket(
             await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
             return
         
-        if not agent or agent.status != "active":
+        if not agent or agent.status != AGENT_STATUS_ACTIVE:
             logger.warning(f"[Voice] Agent not found or not active: status={agent.status if agent else 'None'}")
             await websocket.send_json({"type": "error", "message": "Agent not found or not active"})
             await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
@@ -21,7 +21,9 @@ from config import settings
 from services.agent_service import AgentService
 from services.api_key_service import APIKeyService
 from aws.dynamodb_client import DynamoDBClient
-from models.api_key import APIKeyPermission
+from aws.session import get_client, get_resource
+from models.agent import AGENT_STATUS_ACTIVE
+from models.api_key import API_KEY_PERMISSION_VOICE
 
 logger = logging.getLogger(__name__)
 
@@ -47,15 +49,13 @@ class ToolProcessor:
     def _get_bedrock_client(self):
         """Get or create bedrock-agentcore client"""
         if not self.bedrock_agentcore:
-            import boto3
-            self.bedrock_agentcore = boto3.client('bedrock-agentcore', region_name=settings.AWS_REGION)
+            self.bedrock_agentcore = get_client('bedrock-agentcore', settings.AWS_REGION)
         return self.bedrock_agentcore
     
     def _get_chameleon_arn(self):
         """Get Chameleon runtime ARN from SSM"""
         if not self.chameleon_runtime_arn:
-            import boto3
-            ssm = boto3.client('ssm', region_name=settings.AWS_REGION)
+            ssm = get_client('ssm', settings.AWS_REGION)
             try:
                 response = ssm.get_parameter(Name='/oratio/chameleon/runtime-arn')
                 self.chameleon_runtime_arn = response['Parameter']['Value']
@@ -982,7 +982,7 @@ async def voice_agent_websocket(
         if test:
             print(f"🧪 Test mode: querying DynamoDB for agent...", flush=True)
             # Test mode: retrieve agent to get user_id
-            dynamodb = boto3.resource('dynamodb', region_name=settings.AWS_REGION)
+            dynamodb = get_resource('dynamodb', settings.AWS_REGION)
             table = dynamodb.Table(settings.AGENTS_TABLE)
             print(f"📊 Querying table: {settings.AGENTS_TABLE}", flush=True)
             response = table.query(
@@ -1024,7 +1024,7 @@ async def voice_agent_websocket(
                 return
             
             # Check voice permission
-            if APIKeyPermission.VOICE not in validation.permissions:
+            if API_KEY_PERMISSION_VOICE not in validation.permissions:
                 await websocket.accept()
                 await websocket.send_json({"type": "error", "message": "API key does not have voice permission"})
                 await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
@@ -1035,9 +1035,11 @@ async def voice_agent_websocket(
         
         # Step 2: Get agent details
         print(f"🔍 Getting agent details for user_id={user_id}, agent_id={agent_id}", flush=True)
-        agent = agent_service.get_agent(user_id=user_id, agent_id=agent_id)
+        agent = await asyncio.to_thread(
+            agent_service.get_agent, user_id=user_id, agent_id=agent_id
+        )
         print(f"✅ Agent retrieved: {agent.agent_name if agent else 'None'}", flush=True)
-        if not agent or agent.status != "active":
+        if not agent or agent.status != AGENT_STATUS_ACTIVE:
             print(f"❌ Agent not active! status={agent.status if agent else 'None'}", flush=True)
             await websocket.accept()
             await websocket.send_json({"type": "error", "message": "Agent not active"})
@@ -5,9 +5,10 @@ import logging
 import uuid
 from typing import Any, Dict, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
+from aws.session import get_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,9 +17,7 @@ class AgentInvocationService:
 
     def __init__(self, region: str = "us-east-1"):
         self.region = region
-        self.bedrock_agentcore = boto3.client(
-            "bedrock-agentcore", region_name=region
-        )
+        self.bedrock_agentcore = get_client("bedrock-agentcore", region)
 
     def invoke_agent(
         self,
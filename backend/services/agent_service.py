@@ -1,10 +1,15 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
+from boto3.dynamodb.conditions import Attr
+
 from aws.dynamodb_client import DynamoDBClient
+from models._codecs import AGENT_LIST
 from models.agent import Agent, AgentCreate, AgentResponse, AgentStatus
+from models.knowledge_base import KnowledgeBase, KnowledgeBaseCreate
+from services.knowledge_base_service import KnowledgeBaseService
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +21,42 @@ class AgentService:
         self.dynamodb = dynamodb_client
         self.table_name = table_name
 
+    def new_agent(
+        self, user_id: str, kb_id: str, agent_data: AgentCreate, agent_id: Optional[str] = None
+    ) -> Agent:
+        """
+        Build an agent entry without writing it
+
+        Args:
+            user_id: User ID
+            kb_id: Knowledge base ID
+            agent_data: Agent creation data
+            agent_id: Optional pre-generated agent ID (if None, generates new UUID)
+
+        Returns:
+            Agent: Agent in CREATING status
+        """
+        # Use provided ID or generate unique ID
+        if agent_id is None:
+            agent_id = str(uuid4())
+
+        return Agent(
+            agent_id=agent_id,
+            user_id=user_id,
+            agent_name=agent_data.agent_name,
+            agent_type=agent_data.agent_type,
+            sop=agent_data.sop,
+            knowledge_base_id=kb_id,
+            knowledge_base_description=agent_data.knowledge_base_description,
+            human_handoff_description=agent_data.human_handoff_description,
+            voice_personality=agent_data.voice_personality,
+            voice_config=agent_data.voice_config,
+            text_config=agent_data.text_config,
+            status=AgentStatus.CREATING,
+            created_at=int(datetime.now().timestamp()),
+            updated_at=int(datetime.now().timestamp()),
+        )
+
     def create_agent(
         self, user_id: str, kb_id: str, agent_data: AgentCreate, agent_id: Optional[str] = None
     ) -> Optional[Agent]:
@@ -32,36 +73,22 @@ class AgentService:
             Optional[Agent]: Created agent or None if failed
         """
         try:
-            # Use provided ID or generate unique ID
-            if agent_id is None:
-                agent_id = str(uuid4())
-
-            # Create agent object
-            agent = Agent(
-                agent_id=agent_id,
-                user_id=user_id,
-                agent_name=agent_data.agent_name,
-                agent_type=agent_data.agent_type,
-                sop=agent_data.sop,
-                knowledge_base_id=kb_id,
-                knowledge_base_description=agent_data.knowledge_base_description,
-                human_handoff_description=agent_data.human_handoff_description,
-                voice_personality=agent_data.voice_personality,
-                voice_config=agent_data.voice_config,
-                text_config=agent_data.text_config,
-                status=AgentStatus.CREATING,
-                created_at=int(datetime.now().timestamp()),
-                updated_at=int(datetime.now().timestamp()),
-            )
+            agent = self.new_agent(user_id, kb_id, agent_data, agent_id)
 
-            # Convert to dict for DynamoDB (use aliases for camelCase keys)
-            item = agent.model_dump(by_alias=True)
+            # Convert to dict for DynamoDB (use aliases for camelCase keys;
+            # unset optional fields are left out rather than stored as NULL)
+            item = agent.model_dump(by_alias=True, exclude_none=True)
 
             # Put item in DynamoDB
-            success = self.dynamodb.put_item(self.table_name, item)
+            # Refuse to clobber an existing agent on an ID collision
+            success = self.dynamodb.put_item(
+                self.table_name,
+                item,
+                condition_expression=Attr("agentId").not_exists(),
+            )
 
             if success:
-                logger.info(f"Created agent: {agent_id}")
+                logger.info(f"Created agent: {agent.agent_id}")
                 return agent
             else:
                 logger.error(f"Failed to create agent in DynamoDB")
@@ -71,6 +98,65 @@ class AgentService:
             logger.error(f"Error creating agent: {e}")
             return None
 
+    def create_agent_with_knowledge_base(
+        self,
+        kb_service: KnowledgeBaseService,
+        user_id: str,
+        agent_data: AgentCreate,
+        kb_data: KnowledgeBaseCreate,
+        agent_id: Optional[str] = None,
+        kb_id: Optional[str] = None,
+    ) -> Optional[Tuple[Agent, KnowledgeBase]]:
+        """
+        Create an agent and its knowledge base entry in one DynamoDB transaction
+
+        Either both entries are written or neither is, so a failed request
+        never leaves a knowledge base without its agent. Existing entries with
+        the same IDs are never overwritten.
+
+        Args:
+            kb_service: Knowledge base service owning the knowledge base table
+            user_id: User ID
+            agent_data: Agent creation data
+            kb_data: Knowledge base creation data
+            agent_id: Optional pre-generated agent ID (if None, generates new UUID)
+            kb_id: Optional pre-generated knowledge base ID (if None, generates new UUID)
+
+        Returns:
+            Optional[Tuple[Agent, KnowledgeBase]]: Created entries or None if failed
+        """
+        try:
+            kb = kb_service.new_knowledge_base(kb_data, kb_id)
+            agent = self.new_agent(user_id, kb.knowledge_base_id, agent_data, agent_id)
+
+            success = self.dynamodb.transact_put_items(
+                [
+                    (
+                        kb_service.table_name,
+                        kb.model_dump(by_alias=True, exclude_none=True),
+                        "knowledgeBaseId",
+                    ),
+                    (
+                        self.table_name,
+                        agent.model_dump(by_alias=True, exclude_none=True),
+                        "agentId",
+                    ),
+                ]
+            )
+
+            if success:
+                logger.info(
+                    f"Created agent {agent.agent_id} with knowledge base {kb.knowledge_base_id}"
+                )
+                return agent, kb
+            else:
+                logger.error(f"Failed to create agent and knowledge base in DynamoDB")
+                return None
+
+        except Exception as e:
+            logger.error(f"Error creating agent with knowledge base: {e}")
+            return None
+
     def get_agent(self, user_id: str, agent_id: str) -> Optional[Agent]:
         """
         Get an agent by ID with tenant isolation
@@ -88,7 +174,7 @@ class AgentService:
             )
 
             if item:
-                return Agent(**item)
+                return Agent.model_validate(item)
             return None
 
         except Exception as e:
@@ -107,19 +193,17 @@ class AgentService:
             List[Agent]: List of agents
         """
         try:
+            # Apply status filter server-side if provided
+            filter_expression = Attr("status").eq(status_filter.value) if status_filter else None
+
             items = self.dynamodb.query_by_partition_key(
                 table_name=self.table_name,
                 partition_key_name="userId",
                 partition_key_value=user_id,
+                filter_expression=filter_expression,
             )
 
-            agents = [Agent(**item) for item in items]
-
-            # Apply status filter if provided
-            if status_filter:
-                agents = [a for a in agents if a.status == status_filter]
-
-            return agents
+            return AGENT_LIST.validate_python(items)
 
         except Exception as e:
             logger.error(f"Error listing agents for user {user_id}: {e}")
@@ -2,12 +2,19 @@
 
 import hashlib
 import logging
+import os
 import secrets
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from boto3.dynamodb.conditions import Attr, ConditionBase
 
 from aws.dynamodb_client import DynamoDBClient
+from models._codecs import API_KEY_LIST
 from models.api_key import (
+    API_KEY_STATUS_ACTIVE,
     APIKey,
     APIKeyCreate,
     APIKeyPermission,
@@ -18,6 +25,45 @@ from models.api_key import (
 
 logger = logging.getLogger(__name__)
 
+# Key records looked up by validate_api_key, keyed by the raw 32-byte SHA-256
+# digest. Revocation on this worker evicts immediately; other workers see it
+# within the TTL.
+API_KEY_CACHE_TTL_SECONDS = float(os.getenv("API_KEY_CACHE_TTL_SECONDS", "30"))
+API_KEY_CACHE_MAX_SIZE = 10_000
+_api_key_cache: Dict[bytes, Tuple[float, APIKey]] = {}
+_api_key_cache_lock = threading.Lock()
+
+
+def _get_cached_key(digest: bytes) -> Optional[APIKey]:
+    """Return a cached key record if present and not expired"""
+    with _api_key_cache_lock:
+        entry = _api_key_cache.get(digest)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _api_key_cache[digest]
+            return None
+        return entry[1]
+
+
+def _cache_key(digest: bytes, api_key: APIKey) -> None:
+    """Cache a key record, evicting the oldest entry when full"""
+    with _api_key_cache_lock:
+        _api_key_cache.pop(digest, None)
+        if len(_api_key_cache) >= API_KEY_CACHE_MAX_SIZE:
+            _api_key_cache.pop(next(iter(_api_key_cache)))
+        _api_key_cache[digest] = (time.monotonic() + API_KEY_CACHE_TTL_SECONDS, api_key)
+
+
+def invalidate_key(key_hash: str) -> None:
+    """Drop a cached key record after its status changes"""
+    try:
+        digest = bytes.fromhex(key_hash)
+    except ValueError:
+        return
+    with _api_key_cache_lock:
+        _api_key_cache.pop(digest, None)
+
 
 class APIKeyService:
     """Service for managing API keys"""
@@ -72,9 +118,13 @@ class APIKeyService:
                 expires_at=expires_at,
             )
 
-            # Store in DynamoDB (use camelCase aliases)
-            item = api_key.model_dump(by_alias=True)
-            success = self.dynamodb.put_item(self.table_name, item)
+            # Store in DynamoDB (use camelCase aliases, omit unset optional fields)
+            item = api_key.model_dump(by_alias=True, exclude_none=True)
+            success = self.dynamodb.put_item(
+                self.table_name,
+                item,
+                condition_expression=Attr("apiKeyHash").not_exists(),
+            )
 
             if success:
                 logger.info(f"Created API key for agent {key_data.agent_id}")
@@ -104,21 +154,25 @@ class APIKeyService:
             APIKeyValidation: Validation result
         """
         try:
-            # Hash the provided key
-            key_hash = self._hash_key(api_key)
-
-            # Look up in DynamoDB
-            item = self.dynamodb.get_item(
-                self.table_name, key={"apiKeyHash": key_hash}
-            )
+            # Hash once; the raw digest keys the cache, the hex form DynamoDB
+            digest = hashlib.sha256(api_key.encode()).digest()
+            key_hash = digest.hex()
+
+            api_key_obj = _get_cached_key(digest)
+            if api_key_obj is None:
+                # Look up in DynamoDB
+                item = self.dynamodb.get_item(
+                    self.table_name, key={"apiKeyHash": key_hash}
+                )
 
-            if not item:
-                return APIKeyValidation(valid=False, reason="API key not found")
+                if not item:
+                    return APIKeyValidation(valid=False, reason="API key not found")
 
-            api_key_obj = APIKey(**item)
+                api_key_obj = APIKey.model_validate(item)
+                _cache_key(digest, api_key_obj)
 
             # Check status
-            if api_key_obj.status != APIKeyStatus.ACTIVE:
+            if api_key_obj.status != API_KEY_STATUS_ACTIVE:
                 return APIKeyValidation(
                     valid=False, reason=f"API key is {api_key_obj.status.value}"
                 )
@@ -191,20 +245,20 @@ class APIKeyService:
         """
         try:
             # Query by userId using GSI
+            # agentId is the GSI sort key, so an agent filter narrows the key condition
+            sort_key_condition = (
+                {"name": "agentId", "operator": "eq", "value": agent_id} if agent_id else None
+            )
+
             items = self.dynamodb.query_by_gsi(
                 table_name=self.table_name,
                 index_name="userId-agentId-index",
                 partition_key_name="userId",
                 partition_key_value=user_id,
+                sort_key_condition=sort_key_condition,
             )
 
-            keys = [APIKey(**item) for item in items]
-
-            # Filter by agent_id if provided
-            if agent_id:
-                keys = [k for k in keys if k.agent_id == agent_id]
-
-            return keys
+            return API_KEY_LIST.validate_python(items)
 
         except Exception as e:
             logger.error(f"Error listing API keys for user {user_id}: {e}")
@@ -222,28 +276,25 @@ class APIKeyService:
             bool: True if successful
         """
         try:
-            # Verify ownership
-            item = self.dynamodb.get_item(
-                self.table_name, key={"apiKeyHash": key_hash}
+            # Ownership is verified by the write itself; a missing key fails
+            # the same condition, so no item is ever created here
+            revoked = self._update_key_status(
+                key_hash,
+                APIKeyStatus.REVOKED,
+                condition=Attr("userId").eq(user_id),
             )
-
-            if not item:
-                logger.warning(f"API key not found: {key_hash}")
-                return False
-
-            if item.get("userId") != user_id:
-                logger.warning(f"User {user_id} attempted to revoke key owned by {item.get('userId')}")
-                return False
-
-            # Update status
-            return self._update_key_status(key_hash, APIKeyStatus.REVOKED)
+            if not revoked:
+                logger.warning(f"API key {key_hash} not found or not owned by user {user_id}")
+            return revoked
 
         except Exception as e:
             logger.error(f"Error revoking API key: {e}")
             return False
 
-    def _update_key_status(self, key_hash: str, status: APIKeyStatus) -> bool:
-        """Update API key status"""
+    def _update_key_status(
+        self, key_hash: str, status: APIKeyStatus, condition: Optional[ConditionBase] = None
+    ) -> bool:
+        """Update API key status, optionally only if condition holds"""
         try:
             updates = {
                 "status": status.value,
@@ -253,12 +304,17 @@ class APIKeyService:
                 table_name=self.table_name,
                 key={"apiKeyHash": key_hash},
                 updates=updates,
+                condition_expression=condition,
             )
 
         except Exception as e:
             logger.error(f"Error updating key status: {e}")
             return False
 
+        finally:
+            # After the write, so a concurrent lookup cannot re-cache the old record
+            invalidate_key(key_hash)
+
     def _update_last_used(self, key_hash: str) -> bool:
         """Update last used timestamp"""
         try:
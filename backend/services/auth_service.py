@@ -1,18 +1,55 @@
 """Authentication service for user registration, login, and token management."""
 
+import asyncio
 import os
-import boto3
+import threading
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
 from botocore.exceptions import ClientError
 
 from aws.cognito_client import CognitoClient
+from aws.session import get_resource
 from models.user import User, UserCreate, UserLogin, TokenResponse, UserProfile
 from utils.jwt_utils import jwt_validator
 
 logger = logging.getLogger(__name__)
 
+# User profiles resolved by get_current_user, keyed by user ID. Module-level so
+# every request (and any AuthService instance) reads the same cache.
+PROFILE_CACHE_TTL_SECONDS = float(os.getenv('PROFILE_CACHE_TTL_SECONDS', '60'))
+PROFILE_CACHE_MAX_SIZE = 10_000
+_profile_cache: Dict[str, Tuple[float, UserProfile]] = {}
+_profile_cache_lock = threading.Lock()
+
+
+def _get_cached_profile(user_id: str) -> Optional[UserProfile]:
+    """Return a cached profile if present and not expired."""
+    with _profile_cache_lock:
+        entry = _profile_cache.get(user_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _profile_cache[user_id]
+            return None
+        return entry[1]
+
+
+def _cache_profile(user_id: str, profile: UserProfile) -> None:
+    """Cache a profile, evicting the oldest entry when full."""
+    with _profile_cache_lock:
+        _profile_cache.pop(user_id, None)
+        if len(_profile_cache) >= PROFILE_CACHE_MAX_SIZE:
+            _profile_cache.pop(next(iter(_profile_cache)))
+        _profile_cache[user_id] = (time.monotonic() + PROFILE_CACHE_TTL_SECONDS, profile)
+
+
+def invalidate_profile(user_id: str) -> None:
+    """Drop a cached profile after the user record changes."""
+    with _profile_cache_lock:
+        _profile_cache.pop(user_id, None)
+
 
 class AuthService:
     """Service for handling authentication operations."""
@@ -32,7 +69,7 @@ class AuthService:
             users_table_name: Optional users table name (defaults to env var)
         """
         self.cognito_client = cognito_client or CognitoClient()
-        self.dynamodb = dynamodb_resource or boto3.resource('dynamodb')
+        self.dynamodb = dynamodb_resource or get_resource('dynamodb')
         table_name = users_table_name or os.getenv('USERS_TABLE', 'oratio-users')
         self.users_table = self.dynamodb.Table(table_name)
     
@@ -51,7 +88,8 @@ class AuthService:
         """
         try:
             # Register user in Cognito
-            cognito_response = self.cognito_client.sign_up(
+            cognito_response = await asyncio.to_thread(
+                self.cognito_client.sign_up,
                 email=user_data.email,
                 password=user_data.password,
                 name=user_data.name
@@ -71,7 +109,7 @@ class AuthService:
                 'lastLogin': None
             }
             
-            self.users_table.put_item(Item=user_item)
+            await asyncio.to_thread(self.users_table.put_item, Item=user_item)
             
             logger.info(f"User registered successfully: {user_data.email}")
             
@@ -111,7 +149,7 @@ class AuthService:
             ValueError: If confirmation fails
         """
         try:
-            self.cognito_client.confirm_sign_up(email, confirmation_code)
+            await asyncio.to_thread(self.cognito_client.confirm_sign_up, email, confirmation_code)
             logger.info(f"User confirmed: {email}")
             return True
             
@@ -142,7 +180,8 @@ class AuthService:
         """
         try:
             # Authenticate with Cognito
-            auth_response = self.cognito_client.initiate_auth(
+            auth_response = await asyncio.to_thread(
+                self.cognito_client.initiate_auth,
                 email=login_data.email,
                 password=login_data.password
             )
@@ -153,11 +192,13 @@ class AuthService:
             
             # Update last login timestamp in DynamoDB
             current_timestamp = int(datetime.utcnow().timestamp())
-            self.users_table.update_item(
+            await asyncio.to_thread(
+                self.users_table.update_item,
                 Key={'userId': user_sub},
                 UpdateExpression='SET lastLogin = :timestamp',
                 ExpressionAttributeValues={':timestamp': current_timestamp}
             )
+            invalidate_profile(user_sub)
             
             logger.info(f"User logged in: {login_data.email}")
             
@@ -191,7 +232,7 @@ class AuthService:
             ValueError: If token refresh fails
         """
         try:
-            auth_response = self.cognito_client.refresh_token(refresh_token)
+            auth_response = await asyncio.to_thread(self.cognito_client.refresh_token, refresh_token)
             
             # Note: refresh token is not returned in refresh response
             auth_response['refresh_token'] = refresh_token
@@ -223,18 +264,23 @@ class AuthService:
             ValueError: If token is invalid or user not found
         """
         try:
-            # Validate token and extract user ID
+            # Validate token and extract user ID (verification results are
+            # cached by jwt_validator until the token expires)
             user_id = jwt_validator.get_user_id_from_token(access_token)
             
+            profile = _get_cached_profile(user_id)
+            if profile is not None:
+                return profile
+            
             # Get user profile from DynamoDB
-            response = self.users_table.get_item(Key={'userId': user_id})
+            response = await asyncio.to_thread(self.users_table.get_item, Key={'userId': user_id})
             
             if 'Item' not in response:
                 raise ValueError("User not found")
             
             user_item = response['Item']
             
-            return UserProfile(
+            profile = UserProfile(
                 user_id=user_item['userId'],
                 email=user_item['email'],
                 name=user_item['name'],
@@ -242,6 +288,8 @@ class AuthService:
                 created_at=user_item['createdAt'],
                 last_login=user_item.get('lastLogin')
             )
+            _cache_profile(user_id, profile)
+            return profile
             
         except ValueError:
             raise
@@ -270,7 +318,8 @@ class AuthService:
             ValueError: If password change fails
         """
         try:
-            self.cognito_client.change_password(
+            await asyncio.to_thread(
+                self.cognito_client.change_password,
                 access_token=access_token,
                 previous_password=current_password,
                 proposed_password=new_password
@@ -302,7 +351,7 @@ class AuthService:
             True if forgot password initiated successfully
         """
         try:
-            self.cognito_client.forgot_password(email)
+            await asyncio.to_thread(self.cognito_client.forgot_password, email)
             logger.info(f"Forgot password initiated for: {email}")
             return True
             
@@ -338,7 +387,8 @@ class AuthService:
             ValueError: If password reset fails
         """
         try:
-            self.cognito_client.confirm_forgot_password(
+            await asyncio.to_thread(
+                self.cognito_client.confirm_forgot_password,
                 email=email,
                 confirmation_code=confirmation_code,
                 new_password=new_password
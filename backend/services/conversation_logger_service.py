@@ -5,10 +5,11 @@ Based on: https://github.com/aws-samples/amazon-nova-samples/blob/main/speech-to
 """
 
 import logging
-import boto3
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+from aws.session import get_resource
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,7 +39,7 @@ class ConversationLoggerService:
         self.conversation_turns = []
         
         # DynamoDB client
-        self.dynamodb = boto3.resource('dynamodb')
+        self.dynamodb = get_resource('dynamodb')
         self.table_name = dynamodb_table_name
         self.table = None
         
@@ -199,7 +200,7 @@ class ConversationLoggerService:
         Static method for fetching historical sessions
         """
         try:
-            dynamodb = boto3.resource('dynamodb')
+            dynamodb = get_resource('dynamodb')
             table = dynamodb.Table(table_name)
             
             response = table.get_item(
@@ -234,7 +235,7 @@ class ConversationLoggerService:
         Static method for retrieving multiple sessions
         """
         try:
-            dynamodb = boto3.resource('dynamodb')
+            dynamodb = get_resource('dynamodb')
             table = dynamodb.Table(table_name)
             
             # Query by userId (SK) - requires GSI
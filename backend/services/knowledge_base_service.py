@@ -1,9 +1,12 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import uuid4
 
+from boto3.dynamodb.conditions import Attr
+
 from aws.dynamodb_client import DynamoDBClient
+from models._codecs import KNOWLEDGE_BASE_LIST
 from models.knowledge_base import KnowledgeBase, KnowledgeBaseCreate, KnowledgeBaseStatus
 
 logger = logging.getLogger(__name__)
@@ -16,6 +19,31 @@ class KnowledgeBaseService:
         self.dynamodb = dynamodb_client
         self.table_name = table_name
 
+    def new_knowledge_base(self, kb_data: KnowledgeBaseCreate, kb_id: Optional[str] = None) -> KnowledgeBase:
+        """
+        Build a knowledge base entry without writing it
+
+        Args:
+            kb_data: Knowledge base creation data
+            kb_id: Optional pre-generated knowledge base ID (if None, generates new UUID)
+
+        Returns:
+            KnowledgeBase: Knowledge base in NOTREADY status
+        """
+        # Use provided ID or generate unique ID
+        if kb_id is None:
+            kb_id = str(uuid4())
+
+        return KnowledgeBase(
+            knowledge_base_id=kb_id,
+            user_id=kb_data.user_id,
+            s3_path=kb_data.s3_path,
+            folder_file_descriptions=kb_data.folder_file_descriptions,
+            status=KnowledgeBaseStatus.NOTREADY,
+            created_at=int(datetime.now().timestamp()),
+            updated_at=int(datetime.now().timestamp()),
+        )
+
     def create_knowledge_base(self, kb_data: KnowledgeBaseCreate, kb_id: Optional[str] = None) -> Optional[KnowledgeBase]:
         """
         Create a new knowledge base entry in DynamoDB
@@ -28,29 +56,22 @@ class KnowledgeBaseService:
             Optional[KnowledgeBase]: Created knowledge base or None if failed
         """
         try:
-            # Use provided ID or generate unique ID
-            if kb_id is None:
-                kb_id = str(uuid4())
-
-            # Create knowledge base object
-            kb = KnowledgeBase(
-                knowledge_base_id=kb_id,
-                user_id=kb_data.user_id,
-                s3_path=kb_data.s3_path,
-                folder_file_descriptions=kb_data.folder_file_descriptions,
-                status=KnowledgeBaseStatus.NOTREADY,
-                created_at=int(datetime.now().timestamp()),
-                updated_at=int(datetime.now().timestamp()),
-            )
+            kb = self.new_knowledge_base(kb_data, kb_id)
 
-            # Convert to dict for DynamoDB (use aliases for camelCase keys)
-            item = kb.model_dump(by_alias=True)
+            # Convert to dict for DynamoDB (use aliases for camelCase keys;
+            # unset optional fields are left out rather than stored as NULL)
+            item = kb.model_dump(by_alias=True, exclude_none=True)
 
             # Put item in DynamoDB
-            success = self.dynamodb.put_item(self.table_name, item)
+            # Refuse to clobber an existing knowledge base on an ID collision
+            success = self.dynamodb.put_item(
+                self.table_name,
+                item,
+                condition_expression=Attr("knowledgeBaseId").not_exists(),
+            )
 
             if success:
-                logger.info(f"Created knowledge base: {kb_id}")
+                logger.info(f"Created knowledge base: {kb.knowledge_base_id}")
                 return kb
             else:
                 logger.error(f"Failed to create knowledge base in DynamoDB")
@@ -76,13 +97,35 @@ class KnowledgeBaseService:
             )
 
             if item:
-                return KnowledgeBase(**item)
+                return KnowledgeBase.model_validate(item)
             return None
 
         except Exception as e:
             logger.error(f"Error getting knowledge base {kb_id}: {e}")
             return None
 
+    def get_knowledge_bases(self, kb_ids: Iterable[str]) -> Dict[str, KnowledgeBase]:
+        """
+        Get several knowledge bases by ID in batched reads
+
+        Args:
+            kb_ids: Knowledge base IDs (duplicates and empty IDs are ignored)
+
+        Returns:
+            Dict[str, KnowledgeBase]: Knowledge bases found, keyed by ID
+        """
+        try:
+            keys = [{"knowledgeBaseId": kb_id} for kb_id in set(kb_ids) if kb_id]
+            if not keys:
+                return {}
+
+            items = self.dynamodb.batch_get_items(self.table_name, keys)
+            return {kb.knowledge_base_id: kb for kb in KNOWLEDGE_BASE_LIST.validate_python(items)}
+
+        except Exception as e:
+            logger.error(f"Error getting knowledge bases: {e}")
+            return {}
+
     def list_user_knowledge_bases(self, user_id: str) -> List[KnowledgeBase]:
         """
         List all knowledge bases for a user
@@ -101,7 +144,7 @@ class KnowledgeBaseService:
                 partition_key_value=user_id,
             )
 
-            return [KnowledgeBase(**item) for item in items]
+            return KNOWLEDGE_BASE_LIST.validate_python(items)
 
         except Exception as e:
             logger.error(f"Error listing knowledge bases for user {user_id}: {e}")
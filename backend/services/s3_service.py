@@ -1,3 +1,5 @@
+import asyncio
+import gzip
 import logging
 from typing import BinaryIO, Dict, List, Tuple
 
@@ -5,6 +7,10 @@ from aws.s3_client import S3Client
 
 logger = logging.getLogger(__name__)
 
+# Knowledge base files uploaded at once per request; bounds the buffers and
+# pooled connections a single create_agent call can hold
+KB_UPLOAD_CONCURRENCY = 8
+
 
 class S3Service:
     """Service for managing S3 file operations"""
@@ -30,33 +36,79 @@ class S3Service:
         Returns:
             Dict[str, bool]: Mapping of filenames to upload success status
         """
-        results = {}
-        base_path = f"{user_id}/{agent_id}"
-
-        for file_obj, filename, content_type in files:
-            # Construct S3 key
-            s3_key = f"{base_path}/{filename}"
-
-            # Upload file WITHOUT tags for Bedrock KB (to avoid metadata size limits)
-            success = self.s3.upload_file(
-                file_obj=file_obj,
-                bucket=self.kb_bucket,
-                key=s3_key,
-                user_id=user_id,
-                agent_id=agent_id,
-                resource_type="knowledge-base",
-                content_type=content_type,
-                add_tags=False,  # Disable tags for Bedrock KB files
+        return {
+            filename: self._upload_knowledge_base_file(
+                file_obj, filename, content_type, user_id, agent_id
             )
+            for file_obj, filename, content_type in files
+        }
+
+    async def a_upload_knowledge_base_files(
+        self,
+        files: List[Tuple[BinaryIO, str, str]],  # (file_obj, filename, content_type)
+        user_id: str,
+        agent_id: str,
+    ) -> Dict[str, bool]:
+        """
+        Upload knowledge base files to S3 concurrently
 
-            results[filename] = success
+        At most KB_UPLOAD_CONCURRENCY files are in flight at once. Files above
+        the multipart threshold are further split into concurrent parts by
+        the S3 transfer manager.
 
-            if success:
-                logger.info(f"Uploaded {filename} to s3://{self.kb_bucket}/{s3_key}")
-            else:
-                logger.error(f"Failed to upload {filename}")
+        Args:
+            files: List of (file_obj, filename, content_type) tuples
+            user_id: User ID for tagging and path
+            agent_id: Agent ID for tagging and path
 
-        return results
+        Returns:
+            Dict[str, bool]: Mapping of filenames to upload success status
+        """
+        semaphore = asyncio.Semaphore(KB_UPLOAD_CONCURRENCY)
+
+        async def upload(file_obj: BinaryIO, filename: str, content_type: str) -> bool:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._upload_knowledge_base_file,
+                    file_obj,
+                    filename,
+                    content_type,
+                    user_id,
+                    agent_id,
+                )
+
+        successes = await asyncio.gather(*(upload(*file) for file in files))
+        return {filename: success for (_, filename, _), success in zip(files, successes)}
+
+    def _upload_knowledge_base_file(
+        self,
+        file_obj: BinaryIO,
+        filename: str,
+        content_type: str,
+        user_id: str,
+        agent_id: str,
+    ) -> bool:
+        """Upload one knowledge base file under the user/agent prefix"""
+        s3_key = f"{user_id}/{agent_id}/{filename}"
+
+        # Upload file WITHOUT tags for Bedrock KB (to avoid metadata size limits)
+        success = self.s3.upload_file(
+            file_obj=file_obj,
+            bucket=self.kb_bucket,
+            key=s3_key,
+            user_id=user_id,
+            agent_id=agent_id,
+            resource_type="knowledge-base",
+            content_type=content_type,
+            add_tags=False,  # Disable tags for Bedrock KB files
+        )
+
+        if success:
+            logger.info(f"Uploaded {filename} to s3://{self.kb_bucket}/{s3_key}")
+        else:
+            logger.error(f"Failed to upload {filename}")
+
+        return success
 
     def generate_folder_structure(
         self, files: List[Tuple[str, str]]  # (filename, description)
@@ -189,5 +241,8 @@ class S3Service:
         code_bytes = self.s3.get_file(bucket=code_bucket, key=s3_key)
 
         if code_bytes:
+            # Code uploaded by the AgentCreator invoker is stored gzip-compressed
+            if code_bytes[:2] == b"\x1f\x8b":
+                code_bytes = gzip.decompress(code_bytes)
             return code_bytes.decode("utf-8")
         return ""
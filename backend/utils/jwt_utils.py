@@ -1,15 +1,25 @@
 """JWT token validation utilities for AWS Cognito tokens."""
 
 import os
+import hashlib
+import threading
+import time
 import httpx
 from jose import jwt, JWTError
 from jose.backends import RSAKey
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import logging
-from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Cognito rotates signing keys rarely; refresh the JWKS daily, or early when
+# a token references an unknown key (at most once per minimum interval).
+JWKS_TTL_SECONDS = 24 * 60 * 60
+JWKS_MIN_REFRESH_INTERVAL_SECONDS = 60
+
+# Verified token payloads, keyed by token digest, reused until they expire
+VERIFIED_TOKEN_CACHE_MAX_SIZE = 10_000
+
 
 class JWTValidator:
     """Validates JWT tokens from AWS Cognito."""
@@ -25,23 +35,56 @@ class JWTValidator:
         
         self.jwks_url = f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}/.well-known/jwks.json"
         self.issuer = f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}"
+        
+        self._jwks: Optional[Dict] = None
+        self._signing_keys: Dict[str, Dict] = {}
+        self._jwks_fetched_at = 0.0
+        self._jwks_lock = threading.Lock()
+        # (token_use, token digest) -> verified payload
+        self._verified_tokens: Dict[Tuple[str, str], Dict] = {}
+        self._verified_tokens_lock = threading.Lock()
     
-    @lru_cache(maxsize=1)
-    def get_jwks(self) -> Dict:
+    def get_jwks(self, force_refresh: bool = False) -> Dict:
         """
         Fetch JSON Web Key Set (JWKS) from Cognito.
-        Cached to avoid repeated network calls.
+        Cached for JWKS_TTL_SECONDS to avoid repeated network calls.
+        
+        Args:
+            force_refresh: Refetch even if the cached JWKS has not expired
         
         Returns:
             Dict containing JWKS keys
         """
-        try:
-            response = httpx.get(self.jwks_url, timeout=10.0)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to fetch JWKS: {e}")
-            raise ValueError("Unable to fetch JWKS from Cognito")
+        with self._jwks_lock:
+            age = time.monotonic() - self._jwks_fetched_at
+            if self._jwks is not None and age < JWKS_TTL_SECONDS:
+                if not force_refresh or age < JWKS_MIN_REFRESH_INTERVAL_SECONDS:
+                    return self._jwks
+            
+            try:
+                response = httpx.get(self.jwks_url, timeout=10.0)
+                response.raise_for_status()
+                jwks = response.json()
+            except Exception as e:
+                logger.error(f"Failed to fetch JWKS: {e}")
+                if self._jwks is not None:
+                    # Keep serving the previous keys if Cognito is unreachable
+                    return self._jwks
+                raise ValueError("Unable to fetch JWKS from Cognito")
+            
+            self._jwks = jwks
+            self._signing_keys = {
+                key['kid']: {
+                    'kty': key['kty'],
+                    'kid': key['kid'],
+                    'use': key['use'],
+                    'n': key['n'],
+                    'e': key['e']
+                }
+                for key in jwks['keys']
+            }
+            self._jwks_fetched_at = time.monotonic()
+            return jwks
     
     def get_signing_key(self, token: str) -> Optional[Dict]:
         """
@@ -54,20 +97,14 @@ class JWTValidator:
             Dict containing RSA key components or None if not found
         """
         try:
-            unverified_header = jwt.get_unverified_header(token)
-            jwks = self.get_jwks()
-            
-            for key in jwks['keys']:
-                if key['kid'] == unverified_header['kid']:
-                    return {
-                        'kty': key['kty'],
-                        'kid': key['kid'],
-                        'use': key['use'],
-                        'n': key['n'],
-                        'e': key['e']
-                    }
+            kid = jwt.get_unverified_header(token)['kid']
+            self.get_jwks()
             
-            return None
+            if kid not in self._signing_keys:
+                # Unknown key: Cognito may have rotated its signing keys
+                self.get_jwks(force_refresh=True)
+            
+            return self._signing_keys.get(kid)
             
         except Exception as e:
             logger.error(f"Failed to get signing key: {e}")
@@ -87,6 +124,15 @@ class JWTValidator:
         Raises:
             ValueError: If token is invalid or verification fails
         """
+        cache_key = (token_use, hashlib.blake2b(token.encode('utf-8'), digest_size=16).hexdigest())
+        with self._verified_tokens_lock:
+            payload = self._verified_tokens.get(cache_key)
+        if payload is not None:
+            if payload.get('exp', 0) > time.time():
+                return payload
+            with self._verified_tokens_lock:
+                self._verified_tokens.pop(cache_key, None)
+        
         try:
             # Get signing key
             rsa_key = self.get_signing_key(token)
@@ -111,6 +157,11 @@ class JWTValidator:
             if payload.get('token_use') != token_use:
                 raise ValueError(f"Token is not an {token_use} token")
             
+            with self._verified_tokens_lock:
+                if len(self._verified_tokens) >= VERIFIED_TOKEN_CACHE_MAX_SIZE:
+                    self._verified_tokens.pop(next(iter(self._verified_tokens)))
+                self._verified_tokens[cache_key] = payload
+            
             return payload
             
         except JWTError as e:
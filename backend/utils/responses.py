@@ -0,0 +1,75 @@
+"""Response helpers for pre-serialized API payloads."""
+
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from models._codecs import MSGPACK_ENCODER
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+
+def json_response(
+    adapter: TypeAdapter,
+    content: Any,
+    by_alias: bool = True,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """
+    Serialize content with a prebuilt TypeAdapter straight to a JSON response.
+
+    Returning a Response skips FastAPI's response_model validation and
+    jsonable_encoder pass; keep response_model on the route for the OpenAPI
+    schema and pass the same by_alias setting the route would have used.
+
+    Args:
+        adapter: TypeAdapter matching the route's response_model
+        content: Value to serialize
+        by_alias: Serialize using field aliases (FastAPI's default)
+        status_code: HTTP status code
+
+    Returns:
+        Response with the encoded JSON body
+    """
+    return Response(
+        content=adapter.dump_json(content, by_alias=by_alias),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+def accepts_msgpack(request: Request) -> bool:
+    """Dependency: whether the client asked for a MessagePack response"""
+    return MSGPACK_ENCODER is not None and MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def negotiated_response(
+    adapter: TypeAdapter,
+    content: Any,
+    use_msgpack: bool,
+    by_alias: bool = True,
+) -> Response:
+    """
+    Serialize content as MessagePack or JSON depending on content negotiation.
+
+    Args:
+        adapter: TypeAdapter matching the route's response_model
+        content: Value to serialize
+        use_msgpack: Result of the accepts_msgpack dependency
+        by_alias: Serialize using field aliases (FastAPI's default)
+
+    Returns:
+        Response with the encoded body (varies on the Accept header)
+    """
+    if use_msgpack:
+        response = Response(
+            content=MSGPACK_ENCODER.encode(
+                adapter.dump_python(content, mode="json", by_alias=by_alias)
+            ),
+            media_type=MSGPACK_MEDIA_TYPE,
+        )
+    else:
+        response = json_response(adapter, content, by_alias=by_alias)
+    response.headers["Vary"] = "Accept"
+    return response
@@ -1,3 +1,4 @@
+import gzip
 import json
 import logging
 import os
@@ -199,11 +200,13 @@ def lambda_handler(event, context):
         s3_key = f"{user_id}/{agent_id}/agent_file.py"
         logger.info(f"Uploading generated code to s3://{CODE_BUCKET}/{s3_key}")
 
+        # Stored gzip-compressed; the Chameleon loader decompresses on fetch
         s3_client.put_object(
             Bucket=CODE_BUCKET,
             Key=s3_key,
-            Body=agent_code.encode("utf-8"),
+            Body=gzip.compress(agent_code.encode("utf-8")),
             ContentType="text/x-python",
+            ContentEncoding="gzip",
             Tagging=f"userId={user_id}&agentId={agent_id}&resourceType=generated-code",
         )
 